@@ -0,0 +1,74 @@
+"""
+Vérification de la triangulation en tableaux (array_graphs.Array_Delaunay_Triangulation).
+
+two_vertices_check insère le troisième point en partant de chacun des darts des deux faces infinies
+(les seules faces quand la triangulation n'a que deux sommets), de part et d'autre de la droite.
+cross_check compare les arêtes à celles de graphs.Delaunay_Triangulation sur des points aléatoires
+et cocycliques (polygone régulier), insérés un à un avec des marches aléatoires.
+"""
+
+import math
+import random
+from typing import List, Set, Tuple
+
+from array_graphs import Array_Delaunay_Triangulation, INFINITE
+from graphs import Delaunay_Triangulation
+
+Point = Tuple[float, float]
+
+def edge_set(T: Array_Delaunay_Triangulation) -> Set[frozenset]:
+    """Arêtes finies de la triangulation en tableaux, par coordonnées."""
+    return {frozenset((T.point(T.origin[d]).coord, T.point(T.target(d)).coord)) for d in T.unique_finite_darts}
+
+def two_vertices_check() -> int:
+    """Insère un troisième point depuis chaque dart de la triangulation à deux sommets, renvoie le nombre d'échecs."""
+    failures = 0
+    for p in ((0.5, 1.0), (0.5, -1.0), (2.0, 0.5)):
+        for start in range(6):
+            T = Array_Delaunay_Triangulation()
+            T.insert_point((0.0, 0.0))
+            T.insert_point((1.0, 0.0))
+            d = T.locate(*p, start)
+            if INFINITE in (T.origin[d], T.target(d)) or not T._in_infinite_face(T.origin[d], T.target(d), *p):
+                failures += 1
+                print(f"échec : point {p}, départ {start} : dart {d} hors de la face infinie du point")
+                continue
+            T.ref_dart[2] = start  # marche du troisième point depuis start (walk_from_last)
+            T.insert_point(p, walk_from_last=True)
+            if T.n_vertices != 4 or len(T.unique_finite_darts) != 3:
+                failures += 1
+                print(f"échec : point {p}, départ {start} : {len(T.unique_finite_darts)} arêtes finies")
+    return failures
+
+def random_points(n: int, kind: str, rng: random.Random) -> List[Point]:
+    """Génère n points : 'uniform' ou 'cocircular' (polygone régulier mélangé)."""
+    if kind == "uniform":
+        return [(rng.random(), rng.random()) for _ in range(n)]
+    points = [(math.cos(2 * math.pi * k / n), math.sin(2 * math.pi * k / n)) for k in range(n)]
+    rng.shuffle(points)
+    return points
+
+def cross_check(trials: int = 20, seed: int = 0) -> int:
+    """Compare les triangulations en tableaux et en objets, renvoie le nombre de désaccords."""
+    rng = random.Random(seed)
+    failures = 0
+    for t in range(trials):
+        kind = ("uniform", "cocircular")[t % 2]
+        n = rng.choice((3, 10, 100, 200))
+        points = random_points(n, kind, rng)
+        T = Array_Delaunay_Triangulation()
+        for p in points:
+            T.insert_point(p)
+        DT = Delaunay_Triangulation()
+        DT.build(points)
+        expected = {frozenset((d.origin.coord, d.target.coord)) for d in DT.unique_finite_darts}
+        # points cocycliques : la triangulation n'est pas unique, on compare le nombre d'arêtes
+        if (edge_set(T) != expected) if kind == "uniform" else (len(edge_set(T)) != len(expected)):
+            failures += 1
+            print(f"désaccord : essai {t}, {kind}, {n} points")
+    return failures
+
+
+if __name__ == "__main__":
+    failures = two_vertices_check() + cross_check()
+    print("cross-check :", "ok" if failures == 0 else f"{failures} échecs")
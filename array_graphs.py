@@ -0,0 +1,346 @@
+"""
+Module de triangulation de Delaunay stockée en tableaux (struct-of-arrays).
+
+Même algorithme que graphs.Delaunay_Triangulation, mais sans objets Vertex ni Dart :
+    - les coordonnées sont dans un tableau contigu de float64 (x0, y0, x1, y1, ...)
+    - les darts sont des entiers, origin et next sont des tableaux d'indices
+    - les darts sont créés par paires : le twin de d est d ^ 1, il n'est donc pas stocké
+    - le sommet 0 est le sommet à l'infini, comme dans graphs
+
+Les tableaux sont des array.array, exposables sans copie via memoryview
+(par exemple numpy.frombuffer(DT.coord_view).reshape(-1, 2)).
+Une vue exportée bloque le redimensionnement des tableaux : il faut la relâcher
+(view.release()) avant d'insérer de nouveaux points.
+"""
+
+import random
+from array import array
+from math import sqrt
+from typing import List, Optional, Tuple
+
+import geom
+import spatial_sort
+from graphs import Graph, _csr
+
+INFINITE = 0  # indice du sommet à l'infini
+NO_DART = -1
+
+class Array_Delaunay_Triangulation(Graph):
+    """
+    Triangulation de Delaunay dont les sommets et les darts sont des indices dans des tableaux.
+    """
+    coords: array
+    origin: array
+    next: array
+    ref_dart: array
+    aligned: List[Tuple[float, float]]
+
+    def __init__(self):
+        self.coords = array('d', [0.0, 0.0])  # sommet 0 : infini
+        self.ref_dart = array('i', [NO_DART])  # dart de référence de chaque sommet
+        self.origin = array('i')
+        self.next = array('i')
+        self.aligned: List[Tuple[float, float]] = []  # points alignés avec les deux premiers, en attente
+        self.duplicates = 0  # points doubles ignorés (cf. Delaunay_Triangulation.duplicates)
+
+    #--------------------------------------------- Accès
+    @property
+    def n_vertices(self) -> int:
+        """Nombre de sommets, sommet infini compris."""
+        return len(self.ref_dart)
+
+    @property
+    def n_darts(self) -> int:
+        return len(self.origin)
+
+    def point(self, v: int) -> geom.Point:
+        """Renvoie le sommet v sous forme de geom.Point."""
+        if v == INFINITE:
+            return geom.Point(0, 0, 0)
+        return geom.Point(self.coords[2*v], self.coords[2*v + 1])
+
+    def target(self, d: int) -> int:
+        return self.origin[self.next[d]]
+
+    @staticmethod
+    def twin(d: int) -> int:
+        return d ^ 1
+
+    def rotate(self, d: int) -> int:
+        """Dart suivant autour du sommet d'origine."""
+        return self.next[d ^ 1]
+
+    def incident_darts(self, v: int) -> List[int]:
+        """Renvoie la liste des darts issus du sommet v."""
+        d_0 = self.ref_dart[v]
+        darts = [d_0]
+        d = self.rotate(d_0)
+        while d != d_0:
+            darts.append(d)
+            d = self.rotate(d)
+        return darts
+
+    def is_infinite_face(self, d: int) -> bool:
+        nxt = self.next
+        origin = self.origin
+        return origin[d] == INFINITE or origin[nxt[d]] == INFINITE or origin[nxt[nxt[d]]] == INFINITE
+
+    @property
+    def unique_finite_darts(self) -> List[int]:
+        """Un dart par arête finie."""
+        origin, nxt = self.origin, self.next
+        return [d for d in range(0, len(origin), 2)
+                if origin[d] != INFINITE and origin[nxt[d]] != INFINITE]
+
+    @property
+    def edge_indices(self) -> array:
+        """Renvoie les arêtes finies sous forme d'un tableau plat (a0, b0, a1, b1, ...) d'indices de sommets."""
+        origin, nxt = self.origin, self.next
+        pairs = array('i')
+        for d in self.unique_finite_darts:
+            pairs.append(origin[d])
+            pairs.append(origin[nxt[d]])
+        return pairs
+
+    @property
+    def edges(self) -> List[geom.Edge]:
+        """Renvoie la liste des arêtes géométriques du graphe."""
+        ind = self.edge_indices
+        return [geom.Edge(self.point(ind[i]), self.point(ind[i + 1])) for i in range(0, len(ind), 2)]
+
+    def csr(self, lengths: bool = False) -> Tuple[array, array, Optional[array]]:
+        """Matrice d'adjacence CSR des arêtes finies (cf. graphs.Graph), lue sur les tableaux origin et next."""
+        origin, nxt, coords = self.origin, self.next, self.coords
+        rows, cols = array('i'), array('i')
+        weights = array('d') if lengths else None
+        for d in range(len(origin)): # chaque dart donne un arc, son twin l'arc inverse
+            a, b = origin[d], origin[nxt[d]]
+            if a == INFINITE or b == INFINITE:
+                continue
+            rows.append(a)
+            cols.append(b)
+            if lengths:
+                weights.append(sqrt((coords[2*b] - coords[2*a]) ** 2 + (coords[2*b + 1] - coords[2*a + 1]) ** 2))
+        return _csr(self.n_vertices, rows, cols, weights)
+
+    # vues sans copie sur le stockage
+    @property
+    def coord_view(self) -> memoryview:
+        return memoryview(self.coords)
+
+    @property
+    def origin_view(self) -> memoryview:
+        return memoryview(self.origin)
+
+    @property
+    def next_view(self) -> memoryview:
+        return memoryview(self.next)
+
+    #--------------------------------------------- Construction
+    def build(self, points: List[Tuple[float, float]], brio: bool = False) -> None:
+        """
+        Construit la triangulation à partir d'une liste de points.
+        brio : ordre d'insertion BRIO et marche depuis le dernier sommet inséré (cf. graphs).
+        """
+        self.reset()
+        if brio:
+            points = spatial_sort.brio_order(points)
+        for p in points:
+            self.insert_point(p, brio)
+
+    def insert_point(self, p: Tuple[float, float], walk_from_last: bool = False) -> int:
+        """Insère un point, renvoie l'indice du sommet créé (ou -1 si le point existait déjà)."""
+        x, y = p
+        v = self.n_vertices
+        if v == 2 and (x, y) == (self.coords[2], self.coords[3]):
+            self.duplicates += 1  # pour éviter les points doubles (doubles clics)
+            return -1
+        self.coords.append(x)
+        self.coords.append(y)
+        self.ref_dart.append(NO_DART)
+        if v == 1:
+            return v
+        if v == 2:
+            self._init_first_faces()
+            return v
+        c = self.coords
+        if v == 3 and geom.orient2d((c[2], c[3]), (c[4], c[5]), (x, y)) == 0:
+            # tous les points sont alignés : on attend un point hors de la droite pour trianguler
+            for _ in range(2):
+                self.coords.pop()
+            self.ref_dart.pop()
+            self.aligned.append((x, y))
+            return -1
+        start = self.ref_dart[v - 1] if walk_from_last else NO_DART
+        dart = self.walk_to(x, y, start)
+        if dart == NO_DART:
+            self.coords.pop()
+            self.coords.pop()
+            self.ref_dart.pop()
+            self.duplicates += 1
+            return -1
+        self._flip_until_Del(self._init_new_darts(dart, v))
+        if self.aligned:  # la triangulation n'est plus plate, on insère les points en attente
+            aligned, self.aligned = self.aligned, []
+            for q in aligned:
+                self.insert_point(q)
+        return v
+
+    def _new_edge(self, a: int, b: int) -> int:
+        """Crée le dart a -> b et son twin b -> a, renvoie le premier."""
+        d = len(self.origin)
+        self.origin.append(a)
+        self.origin.append(b)
+        self.next.append(NO_DART)
+        self.next.append(NO_DART)
+        return d
+
+    def _init_first_faces(self) -> None:
+        """Crée et initialise les 6 premiers darts (4 infinis et 2 finis)."""
+        darts_A = [self._new_edge(a, b) for a, b in ((0, 1), (1, 2), (2, 0))]
+        darts_B = [d ^ 1 for d in darts_A]
+        for i in range(3):
+            self.ref_dart[i] = darts_A[i]
+            self.next[darts_A[i - 1]] = darts_A[i]
+        b0, b1, b2 = darts_B
+        self.next[b0], self.next[b2], self.next[b1] = b2, b1, b0
+
+    def _in_infinite_face(self, a: int, b: int, p_x: float, p_y: float) -> bool:
+        """Renvoie True si p est dans la face infinie portée par l'arête finie ab (cf. geom)."""
+        c = self.coords
+        return geom.in_infinite_face((c[2*a], c[2*a + 1]), (c[2*b], c[2*b + 1]), (p_x, p_y))
+
+    def locate(self, x: float, y: float, start: int = NO_DART) -> int:
+        """
+        Marche de visibilité jusqu'à la face contenant (x, y), depuis start (aléatoire par défaut).
+        Renvoie un dart de cette face (le dart fini si elle est infinie).
+        """
+        origin, nxt, c = self.origin, self.next, self.coords
+        orient = geom.orient2d_xy
+        d = start if start != NO_DART else random.randrange(len(origin))
+        if self.is_infinite_face(d):  # on rentre dans l'enveloppe convexe par le dart fini
+            while origin[d] == INFINITE or origin[nxt[d]] == INFINITE:
+                d = nxt[d]
+            if self._in_infinite_face(origin[d], origin[nxt[d]], x, y):
+                return d
+            d ^= 1  # on rentre dans l'enveloppe convexe
+            if origin[nxt[nxt[d]]] == INFINITE:  # deux sommets seulement : le point est dans l'autre face infinie
+                return d
+        while True:
+            e = d
+            for _ in range(3):
+                a, b = 2 * origin[e], 2 * origin[nxt[e]]
+                if orient(c[a], c[a + 1], c[b], c[b + 1], x, y) > 0:
+                    break  # le point est strictement de l'autre côté de e
+                e = nxt[e]
+            else:
+                return d  # face trouvée
+            d = e ^ 1
+            if origin[nxt[nxt[d]]] == INFINITE:  # sorti de l'enveloppe convexe par l'arête d
+                return d
+
+    def locate_many(self, points: List[Tuple[float, float]]) -> array:
+        """
+        Localise une suite de points (liste de couples, ou tableau (N, 2)).
+        Renvoie le tableau des darts trouvés par locate, dans l'ordre des points.
+        Les points sont parcourus dans l'ordre de Hilbert, chaque marche partant du résultat précédent.
+        """
+        coords = [(float(x), float(y)) for x, y in points]
+        result = array('i', [NO_DART]) * len(coords)
+        if not self.origin:
+            return result
+        dart = NO_DART
+        for i in spatial_sort.hilbert_order(coords):
+            x, y = coords[i]
+            dart = self.locate(x, y, dart)
+            result[i] = dart
+        return result
+
+    def walk_to(self, x: float, y: float, start: int = NO_DART) -> int:
+        """Comme locate, mais renvoie NO_DART si le point est déjà un sommet de la face trouvée."""
+        d = self.locate(x, y, start)
+        origin, nxt, c = self.origin, self.next, self.coords
+        e = d
+        for _ in range(3):
+            v = origin[e]
+            if v != INFINITE and c[2*v] == x and c[2*v + 1] == y:
+                return NO_DART
+            e = nxt[e]
+        return d
+
+    def _init_new_darts(self, dart: int, v: int) -> List[int]:
+        """Découpe la face de dart en trois faces autour du nouveau sommet v."""
+        nxt = self.next
+        t = [dart, nxt[dart], nxt[nxt[dart]]]
+        f = [self._new_edge(v, self.origin[d]) for d in t]
+        g = [d ^ 1 for d in f]
+        self.ref_dart[v] = f[0]
+        for i in range(3):
+            nxt[f[i]] = t[i]
+            nxt[t[i]] = g[(i+1) % 3]
+            nxt[g[i]] = f[(i+2) % 3]
+        return t
+
+    def _is_in_circumcircle(self, a: int, b: int, c: int, p: int) -> bool:
+        """Même prédicat que geom.Point.is_in_circumcircle, sur des indices."""
+        co = self.coords
+        if c == INFINITE:
+            return self._in_infinite_face(a, b, co[2*p], co[2*p + 1])
+        elif a == INFINITE:
+            return self._in_infinite_face(b, c, co[2*p], co[2*p + 1])
+        elif b == INFINITE:
+            return self._in_infinite_face(c, a, co[2*p], co[2*p + 1])
+        elif p == INFINITE:
+            return False
+        return geom.in_circle((co[2*a], co[2*a + 1]), (co[2*b], co[2*b + 1]),
+                              (co[2*c], co[2*c + 1]), (co[2*p], co[2*p + 1]))
+
+    def _is_flat(self, a: int, b: int, c: int) -> bool:
+        """Renvoie True si le triangle abc est fini et ses sommets alignés."""
+        if a == INFINITE or b == INFINITE or c == INFINITE:
+            return False
+        co = self.coords
+        return geom.orient2d((co[2*a], co[2*a + 1]), (co[2*b], co[2*b + 1]), (co[2*c], co[2*c + 1])) == 0
+
+    def _flip_until_Del(self, darts: List[int]) -> None:
+        """Réétablit la propriété de Delaunay à partir des darts donnés (pile explicite)."""
+        origin, nxt = self.origin, self.next
+        for dart in darts:
+            # un triangle plat apparaît quand le point est inséré sur une arête : on flippe d'office cette arête
+            force = self._is_flat(origin[dart], origin[nxt[dart]], origin[nxt[nxt[dart]]])
+            stack = [dart]
+            while stack:
+                d_ab = stack.pop()
+                d_aq = nxt[d_ab ^ 1]
+                d_qb = nxt[d_aq]
+                d_bp = nxt[d_ab]
+                if force or self._is_in_circumcircle(origin[d_ab], origin[d_bp], origin[nxt[d_bp]], origin[d_qb]):
+                    self.flip(d_ab)
+                    stack.append(d_qb)
+                    stack.append(d_aq)
+                force = False
+
+    def flip(self, d_ab: int) -> None:
+        """Flippe le dart dans un quadrilatère paqb, remplaçant ab par pq."""
+        origin, nxt, ref = self.origin, self.next, self.ref_dart
+        d_ba = d_ab ^ 1
+        d_bp = nxt[d_ab]
+        d_pa = nxt[d_bp]
+        d_aq = nxt[d_ba]
+        d_qb = nxt[d_aq]
+        for d in (d_ab, d_ba):
+            if ref[origin[d]] == d:
+                ref[origin[d]] = nxt[d ^ 1]
+        origin[d_ab] = origin[d_qb]
+        origin[d_ba] = origin[d_pa]
+        # d_ab devient qp, d_ba devient pq
+        nxt[d_pa], nxt[d_aq], nxt[d_ab] = d_aq, d_ab, d_pa
+        nxt[d_qb], nxt[d_bp], nxt[d_ba] = d_bp, d_ba, d_qb
+
+
+if __name__ == "__main__":
+    points = [(0, 0), (1, 0), (0, 1), (1, 1), (0.5, 0.5)]
+    DT = Array_Delaunay_Triangulation()
+    DT.build(points)
+    for edge in DT.edges:
+        print(f"Edge from {edge.a.coord} to {edge.b.coord}")
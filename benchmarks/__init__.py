@@ -0,0 +1,27 @@
+"""
+Benchmarks de la triangulation de Delaunay et des graphes extraits.
+
+Compare graphs.Delaunay_Triangulation (carte combinatoire, marche depuis le dernier sommet, BRIO)
+à la version naïve delaunay2Dnaif.Del_Tri (Bowyer-Watson en O(n²)) sur des jeux de points
+de 10^2 à 10^6 points : uniformes, en amas, sur grille et cocycliques.
+
+Pour chaque cas on mesure :
+    - le temps de construction
+    - les percentiles de la latence d'insertion d'un point dans la triangulation construite,
+      depuis un dart aléatoire, puis avec la hiérarchie de Delaunay (locators.Delaunay_Hierarchy)
+      et avec la grille de cases (locators.Grid_Locator)
+    - le pic mémoire de la construction (tracemalloc)
+    - le temps d'extraction du Voronoï, du Gabriel, du RNG et du MST
+    - le nombre de passages des prédicats par le calcul exact
+
+Les résultats sont écrits en JSON et comparés à une référence enregistrée (baseline.json) :
+une mesure plus lente que la référence au-delà de la tolérance est signalée comme régression.
+
+Usage :
+    python -m benchmarks                         # tailles 10^2 à 10^4
+    python -m benchmarks --full                  # tailles 10^2 à 10^6 (long)
+    python -m benchmarks --save-baseline         # remplace la référence
+"""
+
+from benchmarks.datasets import KINDS, generate
+from benchmarks.runner import compare, run_case, run_suite
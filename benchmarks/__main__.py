@@ -0,0 +1,54 @@
+"""
+Lance les benchmarks : python -m benchmarks --help
+Code de sortie 1 si une régression est détectée par rapport à la référence.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from benchmarks.datasets import KINDS
+from benchmarks.runner import BACKENDS, FULL_SIZES, NAIVE_MAX, QUICK_SIZES, compare, run_suite
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks de la triangulation de Delaunay et des graphes.")
+    parser.add_argument("--sizes", type=int, nargs="+", help=f"tailles (défaut {' '.join(map(str, QUICK_SIZES))})")
+    parser.add_argument("--full", action="store_true", help="tailles de 10^2 à 10^6")
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=list(KINDS), help="distributions de points")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS), help="triangulations comparées")
+    parser.add_argument("--naive-max", type=int, default=NAIVE_MAX, help="taille maximale pour la version naïve")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="ne mesure pas le pic mémoire (une construction de moins par cas)")
+    parser.add_argument("--output", default="bench_results.json", help="fichier JSON des résultats")
+    parser.add_argument("--baseline", default=BASELINE, help="référence à laquelle comparer les résultats")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="ralentissement toléré, en proportion")
+    parser.add_argument("--save-baseline", action="store_true", help="enregistre les résultats comme nouvelle référence")
+    args = parser.parse_args()
+
+    sizes = args.sizes or (FULL_SIZES if args.full else QUICK_SIZES)
+    report = run_suite(sizes, args.kinds, args.backends, args.seed, not args.no_memory, args.naive_max)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print("résultats écrits dans", args.output)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print("référence enregistrée dans", args.baseline)
+        return 0
+    if not os.path.exists(args.baseline):
+        print("pas de référence :", args.baseline)
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.tolerance)
+    for r in regressions:
+        print(f"RÉGRESSION {r['case']} {r['metric']} : {r['baseline']:.4g} -> {r['value']:.4g} (x{r['ratio']:.2f})")
+    print(f"{len(regressions)} régression(s) par rapport à", args.baseline)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
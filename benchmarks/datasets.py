@@ -0,0 +1,39 @@
+"""
+Jeux de points des benchmarks, tous reproductibles à partir d'une graine.
+"""
+
+import random
+from math import ceil, cos, pi, sin, sqrt
+from typing import List, Tuple
+
+Point = Tuple[float, float]
+
+KINDS = ("uniform", "clustered", "grid", "cocircular")
+
+def generate(kind: str, n: int, seed: int = 0) -> List[Point]:
+    """
+    Génère n points distincts dans le carré unité, mélangés :
+        - uniform : uniformes
+        - clustered : amas gaussiens serrés (environ 50 points par amas)
+        - grid : grille régulière, pleine de quadruplets exactement cocycliques
+        - cocircular : sur un cercle (cocycliques aux arrondis près), le pire cas des prédicats filtrés
+    """
+    rng = random.Random(seed)
+    if kind == "uniform":
+        points = [(rng.random(), rng.random()) for _ in range(n)]
+    elif kind == "clustered":
+        centers = [(rng.random(), rng.random()) for _ in range(max(1, n // 50))]
+        points = []
+        for _ in range(n):
+            cx, cy = rng.choice(centers)
+            points.append((cx + rng.gauss(0, 0.01), cy + rng.gauss(0, 0.01)))
+    elif kind == "grid":
+        side = ceil(sqrt(n))
+        points = [((i % side) / side, (i // side) / side) for i in range(n)]
+    elif kind == "cocircular":
+        points = [(0.5 + 0.5 * cos(2 * pi * k / n), 0.5 + 0.5 * sin(2 * pi * k / n)) for k in range(n)]
+    else:
+        raise ValueError(f"distribution inconnue : {kind} (attendu : {', '.join(KINDS)})")
+    points = list(dict.fromkeys(points)) # les amas peuvent produire des doublons
+    rng.shuffle(points)
+    return points
@@ -0,0 +1,175 @@
+"""
+Mesures des benchmarks et comparaison à une référence.
+
+Un cas est un triplet (backend, distribution, n). Ses mesures sont rangées dans un dictionnaire
+dont les clés finissent par leur unité (_s, _us, _mb) : c'est ce qui permet à compare de savoir
+quelles mesures comparer et avec quelle marge absolue.
+"""
+
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+import geom
+import delaunay2Dnaif
+from graphs import (Delaunay_Triangulation, Voronoi_Diagram, Gabriel_Graph,
+                    Rel_Neighbor_Graph, Minimal_Spanning_Tree)
+from locators import Delaunay_Hierarchy, Grid_Locator
+from benchmarks.datasets import KINDS, generate
+
+BACKENDS = ("graphs", "naive")
+QUICK_SIZES = (10**2, 10**3, 10**4)
+FULL_SIZES = (10**2, 10**3, 10**4, 10**5, 10**6)
+NAIVE_MAX = 1000  # au-delà, la version naïve (O(n²)) prendrait des heures
+# la version naïve n'est pas robuste aux quadruplets exactement cocycliques (sa zone de conflit n'est
+# plus étoilée et les faces se chevauchent, leur nombre explose) : pas de grille pour elle
+NAIVE_KINDS = ("uniform", "clustered", "cocircular")
+MAX_INSERTS = {"graphs": 1000, "naive": 100}  # points insérés un à un pour les percentiles de latence
+LOCATORS = {"hierarchy": Delaunay_Hierarchy, "grid": Grid_Locator}  # une série d'insertions de plus par localisateur
+
+# écart absolu en dessous duquel une mesure plus lente n'est pas une régression (bruit de mesure)
+FLOORS = {"s": 1e-3, "us": 5.0, "mb": 0.5}
+
+EXTRACTORS = {
+    "voronoi": Voronoi_Diagram,
+    "gabriel": Gabriel_Graph,
+    "rng": Rel_Neighbor_Graph,
+    "mst": Minimal_Spanning_Tree,
+}
+
+def _best_time(fn: Callable[[], object], repeat: int) -> float:
+    """Meilleur temps (en secondes) de repeat appels de fn."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    """Percentiles 50, 90 et 99 (rang le plus proche) d'une liste de durées en secondes, en microsecondes."""
+    ordered = sorted(samples)
+    n = len(ordered)
+    return {f"p{q}_us": ordered[min(n - 1, (q * n + 99) // 100 - 1)] * 1e6 for q in (50, 90, 99)}
+
+def _latencies(insert: Callable[[object], object], points: List[object]) -> List[float]:
+    """Durées (en secondes) des insertions une à une des points."""
+    latencies = []
+    for p in points:
+        start = time.perf_counter()
+        insert(p)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+def _peak_memory(build: Callable[[], object]) -> float:
+    """Pic des allocations Python (en Mo) pendant une construction."""
+    tracemalloc.start()
+    try:
+        build()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+def run_case(backend: str, kind: str, n: int, seed: int = 0, memory: bool = True) -> Dict[str, object]:
+    """
+    Mesure un cas : construction sur n points, extraction des graphes sur cette triangulation,
+    puis insertion une à une de quelques points de plus de la même distribution
+    (pour graphs, une série de plus avec chacun des localisateurs de LOCATORS).
+    Les petits cas de graphs sont mesurés 3 fois (meilleur temps), la version naïve une seule.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend inconnu : {backend} (attendu : {', '.join(BACKENDS)})")
+    m = min(n, MAX_INSERTS[backend])
+    batches = 1 + (len(LOCATORS) if backend == "graphs" else 0)
+    points = generate(kind, n + batches * m, seed)
+    points, extras = points[:n], [points[n + k * m:n + (k + 1) * m] for k in range(batches)]
+    repeat = 3 if n <= 10**3 and backend == "graphs" else 1
+    result: Dict[str, object] = {"backend": backend, "kind": kind, "n": len(points)}
+    if backend == "graphs":
+        DT = Delaunay_Triangulation()
+        build = lambda: DT.build(points, brio=True)
+        geom.reset_exact_fallbacks()
+        result["build_s"] = _best_time(build, repeat)
+        result["exact_fallbacks"] = sum(geom.exact_fallbacks.values()) // repeat
+        extract = {}
+        for name, graph_class in EXTRACTORS.items():
+            graph = graph_class()
+            extract[f"{name}_s"] = _best_time(lambda: graph.extract_from_Del(DT), repeat)
+        result["extract"] = extract
+        insert = DT.insert_point
+    else:
+        DT = delaunay2Dnaif.Del_Tri("INF")
+        build = lambda: DT.creates_Tri(points)
+        result["build_s"] = _best_time(build, repeat)
+        graph = delaunay2Dnaif.Gabriel("INF")
+        result["extract"] = {"gabriel_s": _best_time(lambda: graph.extract_Gab_from_Del(points, DT.faces), repeat)}
+        insert = DT.add_point
+    result["insert"] = _percentiles(_latencies(insert, extras[0]))
+    if backend == "graphs":
+        for (name, locator_class), extra in zip(LOCATORS.items(), extras[1:]):
+            DT.set_locator(locator_class())
+            result[f"insert_{name}"] = _percentiles(_latencies(insert, extra))
+        DT.set_locator(None)
+    if memory:
+        result["peak_mem_mb"] = _peak_memory(build)
+    return result
+
+def run_suite(sizes: Sequence[int] = QUICK_SIZES, kinds: Sequence[str] = KINDS, backends: Sequence[str] = BACKENDS,
+              seed: int = 0, memory: bool = True, naive_max: int = NAIVE_MAX,
+              log: Optional[Callable[[str], None]] = print) -> Dict[str, object]:
+    """Lance tous les cas (la version naïve seulement jusqu'à naive_max points, hors grille) et renvoie le rapport."""
+    results = []
+    for backend in backends:
+        for kind in kinds:
+            for n in sizes:
+                if backend == "naive" and (n > naive_max or kind not in NAIVE_KINDS):
+                    continue
+                result = run_case(backend, kind, n, seed, memory)
+                results.append(result)
+                if log is not None:
+                    located = ", ".join(f"{result[f'insert_{name}']['p50_us']:.0f} µs ({name})"
+                                        for name in LOCATORS if f"insert_{name}" in result)
+                    log(f"{backend:6s} {kind:10s} n = {n:7d} : construction {result['build_s']:.3f} s, "
+                        f"insertion p50 {result['insert']['p50_us']:.0f} µs"
+                        + (f", avec localisateur {located}" if located else ""))
+    meta = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": seed,
+    }
+    return {"meta": meta, "results": results}
+
+def _flatten(result: Dict[str, object], prefix: str = "") -> Dict[str, float]:
+    """Mesures numériques d'un cas, à plat : {"build_s": ..., "insert.p50_us": ..., ...}."""
+    flat = {}
+    for key, value in result.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and key != "n":
+            flat[prefix + key] = value
+    return flat
+
+def compare(report: Dict[str, object], baseline: Dict[str, object], tolerance: float = 0.25) -> List[Dict[str, object]]:
+    """
+    Compare un rapport à la référence, cas par cas (même backend, distribution et taille).
+    Une mesure en secondes, microsecondes ou mégaoctets est une régression si elle dépasse
+    la référence de plus de tolerance (en proportion) et de plus de FLOORS (en absolu).
+    """
+    reference = {(r["backend"], r["kind"], r["n"]): _flatten(r) for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        case = (result["backend"], result["kind"], result["n"])
+        if case not in reference:
+            continue
+        for metric, value in _flatten(result).items():
+            unit = metric.rsplit("_", 1)[-1]
+            old = reference[case].get(metric)
+            if old is None or unit not in FLOORS:
+                continue
+            if value > old * (1 + tolerance) and value - old > FLOORS[unit]:
+                regressions.append({"case": "/".join(map(str, case)), "metric": metric,
+                                    "baseline": old, "value": value, "ratio": value / old if old else float("inf")})
+    return regressions
@@ -0,0 +1,137 @@
+"""
+Point d'entrée en ligne de commande, sans interface graphique (pygame n'est jamais importé) :
+lit un fichier de points, construit la triangulation, extrait les graphes demandés et les écrit.
+
+    python cli.py points.csv --graphs voronoi gabriel rng mst --format csv --profile
+
+Entrée : CSV ou binaire selon l'extension (cf. point_io). Sorties, préfixées par --output
+(par défaut le chemin d'entrée sans son extension), une par graphe :
+    - csv : PREFIXE.<graphe>.csv, une arête par ligne : i,j,x_i,y_i,x_j,y_j,length
+    - binary : PREFIXE.<graphe>.csr, matrice d'adjacence CSR avec les coordonnées des noeuds
+      (cf. storage.save_csr), plus PREFIXE.del pour la triangulation (relue par Delaunay_Triangulation.load)
+Les noeuds sont les sommets de la triangulation, numérotés comme DT.vertices (le sommet infini 0 reste isolé),
+sauf pour voronoi dont les noeuds sont les sommets de Voronoï finis (numérotés comme vertex_darts).
+
+--profile écrit sur la sortie d'erreur, en JSON, le temps de chaque phase (lecture, construction,
+extraction de chaque graphe, écriture) et le rapport de construction du module instrument.
+Les points en double sont ignorés et leur nombre est signalé une seule fois sur la sortie d'erreur.
+Une entrée illisible ou invalide (coordonnée non finie : nan, inf) est signalée sur la sortie d'erreur,
+avec la ligne fautive, et le code de sortie est 1 (rien n'est écrit).
+Les modules storage, parallel et instrument ne sont importés que s'ils servent, pour un démarrage rapide.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from array import array
+from typing import List, Optional
+
+import point_io
+from graphs import (Delaunay_Triangulation, Periodic_Delaunay_Triangulation, Voronoi_Diagram, Gabriel_Graph,
+                    Rel_Neighbor_Graph, Minimal_Spanning_Tree, Graph)
+
+GRAPHS = {"delaunay": None, "voronoi": Voronoi_Diagram, "gabriel": Gabriel_Graph,
+          "rng": Rel_Neighbor_Graph, "mst": Minimal_Spanning_Tree}
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Triangulation de Delaunay et graphes dérivés, sans interface.")
+    parser.add_argument("input", help="fichier de points (.csv/.txt : CSV, sinon binaire float64)")
+    parser.add_argument("--graphs", nargs="+", choices=list(GRAPHS), default=["delaunay"],
+                        help="graphes à écrire (par défaut : delaunay)")
+    parser.add_argument("--output", help="préfixe des fichiers écrits (par défaut : l'entrée sans extension)")
+    parser.add_argument("--format", choices=("csv", "binary"), default="csv", help="format de sortie")
+    parser.add_argument("--period", type=float, help="triangulation du tore plat [0, period)²")
+    parser.add_argument("--workers", type=int, help="construction parallèle avec ce nombre de processus")
+    parser.add_argument("--profile", action="store_true", help="temps par phase en JSON sur la sortie d'erreur")
+    return parser
+
+def _node_coords(DT: Delaunay_Triangulation, graph: Optional[Graph]) -> array:
+    """Coordonnées des noeuds de la matrice CSR du graphe, x et y à la suite."""
+    if isinstance(graph, Voronoi_Diagram):
+        return array('d', [c for i in graph.vertex_darts for c in graph.center(i).coord])
+    return array('d', [c for v in DT.vertices for c in (v.x, v.y)])
+
+def write_csv(path: str, coords: array, indptr: array, indices: array, lengths: array) -> int:
+    """Écrit chaque arête une fois (i < j, ou i = j pour une boucle du tore) et renvoie leur nombre."""
+    count = 0
+    with open(path, "w", newline="") as f:
+        f.write("i,j,x_i,y_i,x_j,y_j,length\n")
+        for i in range(len(indptr) - 1):
+            loop = False
+            for p in range(indptr[i], indptr[i + 1]):
+                j = indices[p]
+                if i == j: # une boucle apparaît deux fois dans sa ligne (un brin et son jumeau)
+                    loop = not loop
+                if i < j or loop:
+                    f.write(f"{i},{j},{coords[2*i]!r},{coords[2*i + 1]!r},{coords[2*j]!r},{coords[2*j + 1]!r},"
+                            f"{lengths[p]!r}\n")
+                    count += 1
+    return count
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    prefix = args.output or os.path.splitext(args.input)[0]
+    if not os.path.isdir(os.path.dirname(prefix) or "."):
+        print(f"{prefix} : répertoire de sortie inexistant", file=sys.stderr)
+        return 1
+    timings = {}
+    start = time.perf_counter()
+    try:
+        points = list(point_io.read_points(args.input))
+    except (OSError, ValueError) as error:
+        print(f"{args.input} : {error}", file=sys.stderr)
+        return 1
+    timings["read_s"] = time.perf_counter() - start
+
+    DT = Periodic_Delaunay_Triangulation(args.period) if args.period else Delaunay_Triangulation()
+    start = time.perf_counter()
+    report = None
+    if args.workers:
+        DT.build_parallel(points, args.workers)
+    elif args.profile:
+        report = DT.profile_build(points, brio=True)
+    else:
+        DT.build(points, brio=True)
+    timings["build_s"] = time.perf_counter() - start
+    if DT.duplicates:
+        print(f"{args.input} : {DT.duplicates} points en double ignorés", file=sys.stderr)
+
+    extracted = {}
+    for name in dict.fromkeys(args.graphs): # dans l'ordre demandé, sans doublons
+        start = time.perf_counter()
+        graph = GRAPHS[name]() if GRAPHS[name] is not None else None
+        if graph is not None:
+            graph.extract_from_Del(DT)
+        extracted[name] = graph
+        timings[f"extract_{name}_s"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    written = []
+    if args.format == "binary":
+        import storage
+        if "delaunay" in extracted:
+            DT.save(prefix + ".del")
+            written.append(prefix + ".del")
+    for name, graph in extracted.items():
+        indptr, indices, lengths = (graph or DT).csr(lengths=True)
+        coords = _node_coords(DT, graph)
+        path = f"{prefix}.{name}.{'csv' if args.format == 'csv' else 'csr'}"
+        if args.format == "csv":
+            write_csv(path, coords, indptr, indices, lengths)
+        else:
+            storage.save_csr(path, coords, indptr, indices, lengths)
+        written.append(path)
+    timings["write_s"] = time.perf_counter() - start
+
+    if args.profile:
+        profile = {"points": len(points), "vertices": len(DT.vertices) - 1, "duplicates": DT.duplicates, "phases_s": timings, "outputs": written}
+        if report is not None:
+            profile["build"] = report.as_dict()
+        json.dump(profile, sys.stderr, indent=2)
+        print(file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
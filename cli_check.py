@@ -0,0 +1,56 @@
+"""
+Vérification de la ligne de commande (cli.main) sur des entrées invalides ou douteuses.
+
+Une coordonnée non finie (nan, inf, -inf), en CSV ou en binaire, doit donner un message d'erreur sur
+la sortie d'erreur (avec la ligne ou le point) et le code de sortie 1, sans trace d'exception ni fichier écrit.
+Des points en double sont ignorés et signalés une seule fois, la sortie standard restant vide.
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+from typing import List, Tuple
+
+import cli
+import point_io
+
+def run(argv: List[str]) -> Tuple[int, str, str]:
+    """Lance cli.main et renvoie (code de sortie, sortie standard, sortie d'erreur)."""
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        code = cli.main(argv)
+    return code, out.getvalue(), err.getvalue()
+
+def check() -> int:
+    """Renvoie le nombre de cas en échec."""
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+        for bad in ("nan", "inf", "-inf"):
+            path = os.path.join(directory, f"points_{bad}.csv")
+            with open(path, "w") as f:
+                f.write("x,y\n0,0\n1,0\n0,1\n" + f"{bad},0.5\n" + "1,1\n")
+            code, out, err = run([path, "--graphs", "delaunay", "mst"])
+            written = [name for name in os.listdir(directory) if name.startswith(f"points_{bad}.")]
+            if code != 1 or out or "ligne 5" not in err or "Traceback" in err or written != [f"points_{bad}.csv"]:
+                failures += 1
+                print(f"échec : CSV avec {bad} : code {code}, sortie d'erreur {err!r}")
+        path = os.path.join(directory, "points.bin")
+        point_io.write_binary([(0.0, 0.0), (1.0, 0.0), (float("inf"), 1.0)], path)
+        code, out, err = run([path])
+        if code != 1 or "point 2" not in err:
+            failures += 1
+            print(f"échec : binaire avec inf : code {code}, sortie d'erreur {err!r}")
+        path = os.path.join(directory, "doubles.csv")
+        with open(path, "w") as f:
+            f.write("0,0\n1,0\n0,1\n1,0\n1,1\n0,0\n")
+        code, out, err = run([path, "--graphs", "gabriel"])
+        if code != 0 or out or err.count("2 points en double") != 1:
+            failures += 1
+            print(f"échec : points en double : code {code}, sortie {out!r}, sortie d'erreur {err!r}")
+    return failures
+
+
+if __name__ == "__main__":
+    failures = check()
+    print("cross-check :", "ok" if failures == 0 else f"{failures} échecs")
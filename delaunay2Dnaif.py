@@ -1,4 +1,4 @@
-import utils # prédicats
+import geom # prédicats
     
 class Del_Tri:
     def __init__(self, inftyPoint):
@@ -21,7 +21,7 @@ class Del_Tri:
 
         if len(self.points) == 3:
             a, b, c = self.points
-            if not utils.is_clockwise(a,b,c): # les triangles internes sont clockwise
+            if not geom.are_clockwise(a,b,c): # les triangles internes sont clockwise
                 b, c = c, b
             self.faces.append((a, b, c))
             self.faces.append((c, b, self.inftyPoint)) # les triangles exterieurs sont orientés dans le même sens 
@@ -41,10 +41,10 @@ class Del_Tri:
         for triangle in self.faces:
             a, b, c = triangle
             if c == self.inftyPoint:
-                if utils.is_clockwise(a, b, p):
+                if geom.are_clockwise(a, b, p):
                     conflict_zone.append(triangle)
             else :
-                if utils.in_circle(a, b, c, p):
+                if geom.in_circle(a, b, c, p):
                     conflict_zone.append(triangle)        
     
         # Trouver les aretes de la conflict zone
@@ -121,7 +121,7 @@ class Gabriel:
             for p in points:
                 # si il existe un point p dans le cercle, on n'ajoute pas l'arete
                 if p not in edge:
-                    if utils.in_Gab_Circle(edge, p):
+                    if geom.in_Gab_Circle(*edge, p):
                         good_edge = False
                         break
             if good_edge:
@@ -140,7 +140,7 @@ class Gabriel:
 
     def _update_Gabriel(self, new_p):
         # On supprimer les aretes en conflit
-        self.Gab_edges = [edge for edge in self.Gab_edges if not utils.in_Gab_Circle(edge, new_p)]
+        self.Gab_edges = [edge for edge in self.Gab_edges if not geom.in_Gab_Circle(*edge, new_p)]
         # et ajoute les nouvelles aretes (a, p)
         for a in self.points: # on teste si Gab(a,p) contient un point b
             if a != new_p:
@@ -148,7 +148,7 @@ class Gabriel:
                 for b in self.points:
                     if a != b and b != new_p:
                         # si il existe un point p dans le cercle, on n'ajoute pas l'arete
-                        if utils.in_Gab_Circle((a, new_p), b):
+                        if geom.in_Gab_Circle(a, new_p, b):
                             good_edge = False
                             break
                 if good_edge:
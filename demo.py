@@ -12,10 +12,14 @@ Merci à Copilot pour les docstrings et autres améliorations de code
 import sys #pour fermer proprement le script
 import pygame
 import random
+import time
+from array import array
+from functools import partial
 
 #imports locaux
 from graphs import *
 import interface
+import worker
 
 pygame.init()
 
@@ -26,10 +30,14 @@ WIDTH, HEIGHT = 700, 700 # fenetre de jeu
 MENU_WIDTH = 300 # fenetre du menu
 FONT_SIZE = 15
 SCALE = 3
+ZOOM_STEP = 1.25  # facteur de zoom par cran de molette
+SETTLE = 0.2  # secondes sans mouvement de la vue avant le rendu lissé (à l'échelle SCALE)
+FAST_BUDGET = 20000  # primitives dessinées au plus par calque pendant un zoom ou un déplacement
+FULL_BUDGET = 200000  # et à l'arrêt
+MIN_ZOOM, MAX_ZOOM = 0.1, 10000.0
 
 screen = pygame.display.set_mode((WIDTH + MENU_WIDTH, HEIGHT))
 font = pygame.font.SysFont("Verdana", FONT_SIZE)
-visu_surface = pygame.Surface((WIDTH * SCALE, HEIGHT * SCALE))  # "écran des graphes",sera rescalée, c'est pour le rendu
 
 #menu
 t_surf = interface.Button(font, "Surfaces :")
@@ -40,6 +48,7 @@ b_gen = interface.Button(font, " Générer points ", True)
 b_n = interface.Button(font, " 100   ", True)
 b_ajout = interface.Button(font, " Ajouter point ", True)
 b_suppr = interface.Button(font, " Supprimer points ", True)
+b_view = interface.Button(font, " Vue entière ", True)
 t_graph = interface.Button(font, "Graphes :")
 b_points = interface.Button(font, " Points ", True, True)
 b_Del = interface.Button(font, " Delaunay ", True, True)
@@ -62,7 +71,7 @@ for b in surface_buttons:
     HEIGHT_BOUTONS += INTER_BOUTONS
 
 HEIGHT_BOUTONS += INTER_BOUTONS
-action_buttons = [t_act, b_gen, b_ajout, b_suppr]
+action_buttons = [t_act, b_gen, b_ajout, b_suppr, b_view]
 for b in action_buttons:
     b.set_pos(MENU_LEFT, HEIGHT_BOUTONS)
     HEIGHT_BOUTONS += INTER_BOUTONS
@@ -82,7 +91,6 @@ for b in ON_OFF_buttons:
 all_buttons = surface_buttons + action_buttons + [b_n] + graph_buttons + ON_OFF_buttons
 
 # Pour la fenetre de dessin
-H_WIDTH = WIDTH // 2 # pour le tore
 P_COLOR = (50, 45, 100)
 DEL_COLOR = "black"
 VOR_COLOR = "magenta"
@@ -91,34 +99,225 @@ RNG_COLOR = "blue"
 MST_COLOR = "green"
 GRAPH_BACKGROUND = "white"
 
+def period_of(DT: Delaunay_Triangulation) -> float:
+    """Période de la triangulation (0 dans le plan) : dans le tore, on redessine les arêtes qui passent le bord."""
+    return DT.period if isinstance(DT, Periodic_Delaunay_Triangulation) else 0
+
+def edges_layer(button: Optional[interface.ON_OFF_Button], color, size: int, max: int = 0) -> interface.Layer:
+    """
+    Calque des arêtes du graphe d'un bouton ON/OFF (button.graph, qui change à chaque nouveau calcul)
+    ou de la triangulation elle-même si button est None.
+    """
+    return interface.Layer((WIDTH, HEIGHT), color, size, lambda DT:
+                           interface.segments(button.graph if button is not None else DT, max, period_of(DT)))
+
+def points_layer() -> interface.Layer:
+    """Calque des points de la triangulation (sommets et points alignés en attente), segments de longueur nulle."""
+    return interface.Layer((WIDTH, HEIGHT), P_COLOR, 2, lambda DT:
+                           array('d', [c for v in DT.vertices[1:] + DT.aligned for c in (v.x, v.y, v.x, v.y)]))
+
+#----------------------------------Calculs en arrière-plan (module worker)
+CHUNK = 500  # points insérés entre deux affichages partiels
+
+class Scene:
+    """
+    Résultat d'une tâche du worker : une nouvelle triangulation (None : la triangulation affichée,
+    inchangée pendant la tâche), les graphes qui en ont été extraits, par bouton ON/OFF,
+    et les index spatiaux recalculés, par calque.
+    """
+    def __init__(self, DT: Optional[Delaunay_Triangulation], graphs: dict, indexes: Optional[dict] = None):
+        self.DT = DT
+        self.graphs = graphs
+        self.indexes = indexes or {}
+
+    def release(self) -> None:
+        """Libère une scène abandonnée (appelé dans le thread du worker)."""
+        for graph in self.graphs.values():
+            graph.reset()
+        if self.DT is not None:
+            self.DT.release()
+
+def random_points(n: int, seed: int):
+    """n points aléatoires de la fenêtre, toujours les mêmes pour une même graine."""
+    rng = random.Random(seed)
+    return ((WIDTH * rng.random(), HEIGHT * rng.random()) for _ in range(n))
+
+def build_job(points, period: float, buttons: list) -> worker.Job:
+    """
+    Tâche : triangulation (du tore si period) des points renvoyés par points(), insérés par morceaux de CHUNK
+    (chaque morceau est publié pour l'affichage progressif), puis extraction des graphes des boutons.
+    """
+    classes = {b: type(b.graph) for b in buttons}
+    def job(report) -> Scene:
+        DT = Periodic_Delaunay_Triangulation(period) if period else Delaunay_Triangulation()
+        graphs = {b: cls() for b, cls in classes.items()}
+        shown = len(DT.vertices)
+        def progress(count: int) -> None:
+            nonlocal shown
+            report([v.coord for v in DT.vertices[shown:]])
+            shown = len(DT.vertices)
+        try:
+            DT.insert_stream(points(), CHUNK, progress)
+            for graph in graphs.values():
+                DT.subscribe(graph)
+                report([]) # interruption possible entre deux extractions
+        except worker.Cancelled:
+            DT.release()
+            raise
+        return Scene(DT, graphs)
+    return job
+
+def extract_job(DT: Delaunay_Triangulation, buttons: list) -> worker.Job:
+    """Tâche : extraction des graphes des boutons sur la triangulation affichée (qui n'est pas modifiée entre-temps)."""
+    classes = {b: type(b.graph) for b in buttons}
+    def job(report) -> Scene:
+        graphs = {b: cls().sync(DT) for b, cls in classes.items()}
+        return Scene(None, graphs)
+    return job
+
+def index_job(layers: list) -> worker.Job:
+    """Tâche : index spatiaux des calques, sur la triangulation affichée (qui n'est pas modifiée entre-temps)."""
+    revisions = {layer: layer.revision for layer in layers}
+    def job(report) -> Scene:
+        indexes = {}
+        for layer, revision in revisions.items():
+            indexes[layer] = (layer.build_index(), revision)
+            report([]) # interruption possible entre deux calques
+        return Scene(None, {}, indexes)
+    return job
+
 def main():
     running = True
     pygame.display.set_caption("Triangulation 2D")
     clock = pygame.time.Clock()
     first_refresh = True
 
-    points = []
     n = 300 # nombre de points à générer par defaut
     input_text = " " + str(n)
     b_n.change_text_to(font, input_text)
     DT = Delaunay_Triangulation()
-    VD = Voronoi_Diagram()
-    GG = Gabriel_Graph()
-    RNG = Rel_Neighbor_Graph()
-    MST = Minimal_Spanning_Tree()
-    b_Vor_ON_OFF.graph = VD
-    b_Gab_ON_OFF.graph = GG
-    b_RNG_ON_OFF.graph = RNG
-    b_MST_ON_OFF.graph = MST
-    graphs = (DT, VD, GG, RNG, MST)
+    b_Vor_ON_OFF.graph = Voronoi_Diagram()
+    b_Gab_ON_OFF.graph = Gabriel_Graph()
+    b_RNG_ON_OFF.graph = Rel_Neighbor_Graph()
+    b_MST_ON_OFF.graph = Minimal_Spanning_Tree()
+    # calques dans l'ordre de superposition, chacun affiché si son bouton est actif
+    layers = {b_Del: edges_layer(None, DEL_COLOR, 2), b_Vor: edges_layer(b_Vor_ON_OFF, VOR_COLOR, 3, WIDTH),
+              b_Gab: edges_layer(b_Gab_ON_OFF, GAB_COLOR, 3), b_RNG: edges_layer(b_RNG_ON_OFF, RNG_COLOR, 3),
+              b_MST: edges_layer(b_MST_ON_OFF, MST_COLOR, 3), b_points: points_layer()}
+    for layer in layers.values():
+        DT.subscribe(layer) # chaque modification de la triangulation marque les calques à redessiner
+
+    # Les constructions et les extractions se font dans le thread du worker : la boucle ne fait qu'afficher.
+    # Pendant un calcul, la triangulation affichée n'est pas modifiée (le worker peut la lire) :
+    # les points ajoutés attendent dans deferred, les graphes allumés sont extraits après.
+    background = worker.Worker()
+    deferred = []  # points cliqués pendant un calcul
+    source = None  # points de la construction en cours (fonction sans argument), None s'il n'y en a pas
+    preview = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)  # points déjà insérés par la construction en cours
+    built = []  # les mêmes, pour redessiner preview quand la vue change
+    view = (0.0, 0.0, 1.0)  # vue (x0, y0, zoom), cf. interface.View
+    moved = 0.0  # instant du dernier changement de vue
+    settled = True  # rendu lissé fait depuis le dernier changement de vue
+    drag = None  # (position de la souris, vue) au début d'un déplacement (bouton droit)
+
+    def to_world(x: float, y: float) -> Tuple[float, float]:
+        x0, y0, zoom = view
+        return x0 + x / zoom, y0 + y / zoom
+
+    def to_screen(points: list) -> list:
+        x0, y0, zoom = view
+        return [((x - x0) * zoom, (y - y0) * zoom) for x, y in points]
+
+    def set_view(new: interface.View) -> None:
+        nonlocal view, moved, settled
+        view, moved, settled = new, time.perf_counter(), False
+        if source is not None:
+            preview.fill((0, 0, 0, 0))
+            interface.draw_points(preview, to_screen(built), P_COLOR, 2, 1)
+
+    def on_buttons() -> list:
+        return [b for b in ON_OFF_buttons if b.cible.is_ON]
+
+    def build(points, period: float) -> None:
+        """Lance (ou relance, la précédente étant abandonnée) la construction de la scène."""
+        nonlocal source
+        source = points
+        built.clear()
+        preview.fill((0, 0, 0, 0))
+        background.submit(build_job(points, period, on_buttons()))
+
+    def extract_missing() -> None:
+        """Lance l'extraction des graphes allumés qui ne sont pas encore abonnés à la triangulation."""
+        missing = [b for b in on_buttons() if b.graph not in DT.subscribers]
+        if missing:
+            background.submit(extract_job(DT, missing))
+
+    def adopt(scene: Scene) -> None:
+        """Installe le résultat d'une tâche, applique les points en attente et lance les extractions manquantes."""
+        nonlocal DT, source
+        for layer, (index, revision) in scene.indexes.items():
+            layer.set_index(index, revision)
+        if scene.DT is not None:
+            old, DT, source = DT, scene.DT, None
+            built.clear()
+            for layer in layers.values():
+                old.unsubscribe(layer)
+                DT.subscribe(layer)
+            b_gen.change_text_to(font, " Générer points ")
+        for b, graph in scene.graphs.items():
+            b.graph = graph
+            if b.cible.is_ON:
+                DT.subscribe(graph, extract=False) # déjà extrait (et déjà abonné pour une nouvelle triangulation)
+            else: # éteint pendant le calcul : gardé tant que la triangulation ne change pas
+                DT.suspend(graph)
+            layers[b.cible].invalidate()
+        if scene.DT is not None:
+            background.discard(old) # avec les anciens graphes, qui lui sont abonnés
+        for p in deferred:
+            DT.insert_point(p)
+        deferred.clear()
+        extract_missing()
+
     while running:
         clock.tick(FPS)
         mouse_pos = pygame.mouse.get_pos()
-        for event in pygame.event.get():
+        messages = background.poll()
+        for kind, _, value in messages:
+            if kind == "progress":
+                interface.draw_points(preview, to_screen(value), P_COLOR, 2, 1)
+                built.extend(value)
+                b_gen.change_text_to(font, f" Calcul : {len(built)} points ")
+            elif kind == "done":
+                adopt(value)
+            else:
+                print("Erreur de calcul :", value)
+                source = None
+                built.clear()
+                b_gen.change_text_to(font, " Générer points ")
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+            elif event.type == pygame.MOUSEWHEEL: # zoom autour du curseur
+                x, y = mouse_pos
+                if x < WIDTH:
+                    wx, wy = to_world(x, y)
+                    zoom = min(MAX_ZOOM, max(MIN_ZOOM, view[2] * ZOOM_STEP ** event.y))
+                    set_view((wx - x / zoom, wy - y / zoom, zoom))
+
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 3: # déplacement de la vue
+                if mouse_pos[0] < WIDTH:
+                    drag = (mouse_pos, view)
+
+            elif event.type == pygame.MOUSEBUTTONUP and event.button == 3:
+                drag = None
+
+            elif event.type == pygame.MOUSEMOTION and drag is not None:
+                (x, y), (x0, y0, zoom) = drag
+                set_view((x0 - (mouse_pos[0] - x) / zoom, y0 - (mouse_pos[1] - y) / zoom, zoom))
+
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 x, y = mouse_pos
 
                 if x >= WIDTH:
@@ -128,39 +327,27 @@ def main():
                     if not b_plane.is_active:
                         b_plane.set_active()
                         b_torus.set_inactive()
-                        points = []
-                        for g in graphs:
-                            g.reset()
+                        deferred.clear()
+                        build(tuple, 0) # plan vide
                   
 
                 if b_torus.rect.collidepoint((x, y)):
                     if not b_torus.is_active:
                         b_plane.set_inactive()
                         b_torus.set_active()
-                        copies = interface.create_copies(points, WIDTH)
-                        points.extend(copies)
-                        DT.build(points)
-                        for b in ON_OFF_buttons:
-                            if b.is_ON:
-                                b.graph.extract_from_Del(DT)
+                        # chaque point n'est stocké qu'une fois, les arêtes qui traversent le bord portent leur translation
+                        # les points ne sont gardés que par la triangulation : on reprend ceux de l'ancienne
+                        # (ou ceux de la construction en cours), plus les points en attente
+                        coords = [v.coord for v in DT.vertices[1:] + DT.aligned]
+                        points, pending = source or (lambda: coords), list(deferred)
+                        deferred.clear()
+                        build(lambda: [*points(), *pending], WIDTH)
 
                 if b_gen.rect.collidepoint(mouse_pos):
-                    # Supprimer l'ancienne triangulation et genere des points
-                    # crée les graphes
-                    points = []                
-                    # Genere n points
-                    for _ in range(n):
-                        x = WIDTH * random.random()
-                        y = HEIGHT * random.random()
-                        points.append((x,y))
-                    if b_torus.is_active:  # on considère qu'il y a suffisament de points pour éviter les dummy points
-                        copies = interface.create_copies(points, WIDTH)
-                        points.extend(copies)
-                    # et crée les graphes
-                    DT.build(points)
-                    for b in ON_OFF_buttons:
-                        if b.cible.is_ON:
-                            b.graph.extract_from_Del(DT)
+                    # Supprimer l'ancienne triangulation et genere n points, insérés au fil de l'eau par le worker
+                    # (un nouveau clic abandonne la construction en cours : les clics se regroupent)
+                    deferred.clear()
+                    build(partial(random_points, n, random.randrange(2**32)), WIDTH if b_torus.is_active else 0)
 
                 if b_n.rect.collidepoint(mouse_pos):
                     b_n.set_active()
@@ -169,23 +356,20 @@ def main():
                 if b_ajout.rect.collidepoint(mouse_pos):
                     b_ajout.set_active()
 
+                if b_view.rect.collidepoint(mouse_pos):
+                    set_view((0.0, 0.0, 1.0))
+
                 if x < WIDTH and b_ajout.is_active:  # gère l'ajout de point dans la fenetre
-                    if x < WIDTH : # Si dans le jeu
-                        points.append((x, y))
-                        DT.insert_point((x,y))
-                        if b_torus.is_active:
-                            copies = interface.create_copies([(x,y)], WIDTH)
-                            for copie in copies:
-                                DT.insert_point(copie)
-                            points.extend(copies) 
-                        for b in ON_OFF_buttons:
-                            if b.cible.is_ON:
-                                b.graph.extract_from_Del(DT)  # ca recalcule integralement les sous graphs! => possibilité de les désactiver
+                    p = to_world(x, y)
+                    if background.busy: # la triangulation est en cours de lecture ou de remplacement
+                        deferred.append(p)
+                    else:
+                        DT.insert_point(p)
+                        # les graphes actifs, abonnés à DT, ne mettent à jour que les arêtes touchées par l'insertion
 
                 if b_suppr.rect.collidepoint(mouse_pos): # Supprimer les points
-                    points = []
-                    for g in graphs:
-                        g.reset()
+                    deferred.clear()
+                    build(tuple, WIDTH if b_torus.is_active else 0)
 
                 for b in graph_buttons:     # Affiche/masque les graphs actifs/inactifs
                     if b.rect.collidepoint(mouse_pos) and b.is_ON:
@@ -196,11 +380,18 @@ def main():
                         if b.cible.is_ON:
                             b.change_text_to(font," OFF ")
                             b.cible.set_inactive()
-                            b.graph.reset
+                            # vidé à la prochaine modification de la triangulation seulement : d'ici là, rallumer
+                            # est en O(1), et le worker (index d'un calque) peut encore le lire sans risque
+                            DT.suspend(b.graph)
                         else:
                             b.change_text_to(font," ON ")
-                            b.graph.extract_from_Del(DT)   
+                            if b.graph.is_current(DT): # suspendu sur la triangulation inchangée : rien à recalculer
+                                DT.subscribe(b.graph) # son calque non plus n'a pas changé
+                            else:
+                                layers[b.cible].invalidate()
                         b.cible.switch_ON_OFF()
+                        if not background.busy: # sinon, extrait à la fin du calcul en cours
+                            extract_missing()
 
             elif event.type == pygame.KEYDOWN:
                 if b_n.is_active:                       # selection du nombre de points
@@ -208,7 +399,7 @@ def main():
                         print("Nombre entré :", input_text)
                         try:
                             new_n = int(input_text)
-                            max_n = 5000
+                            max_n = 1000000
                             if 0 < new_n and new_n <= max_n:
                                 n = new_n
                             else:
@@ -224,34 +415,36 @@ def main():
                         input_text += event.unicode
                     b_n.change_text_to(font," " + input_text)
 
+        if source is None and not background.busy:
+            # index des calques visibles à refaire (la triangulation ou un graphe a changé), dans le worker
+            dirty = [layer for b, layer in layers.items() if b.is_active and layer.dirty]
+            if dirty:
+                background.submit(index_job(dirty))
+
+        # en mouvement, rendu rapide (pas de lissage, moins de primitives) ; à l'arrêt, une image nette
+        moving = time.perf_counter() - moved < SETTLE
+        if not moving and not settled:
+            settled = True
+            first_refresh = True
+        if events or messages or first_refresh:
+            # composition des calques visibles : seuls ceux qui ont changé (index, vue) sont redessinés
+            scale, budget = (1, FAST_BUDGET) if moving else (SCALE, FULL_BUDGET)
             screen.fill(interface.DARK_BLUE)
-            visu_surface.fill(GRAPH_BACKGROUND)
-            if b_Del.is_active:    
-                    interface.draw_edges(visu_surface, DT, DEL_COLOR, 2, SCALE)
-            if b_Vor.is_active:    
-                    interface.draw_edges(visu_surface, VD, VOR_COLOR, 3, SCALE, WIDTH)
-            if b_Gab.is_active:
-                interface.draw_edges(visu_surface, GG, GAB_COLOR, 3, SCALE)  
-            if b_RNG.is_active:
-                interface.draw_edges(visu_surface, RNG, RNG_COLOR, 3, SCALE)
-            if b_MST.is_active:
-                interface.draw_edges(visu_surface, MST, MST_COLOR, 3, SCALE)
-            if b_points.is_active:
-                interface.draw_points(visu_surface, points, P_COLOR, 2, SCALE)
-            scaled_surface = pygame.transform.smoothscale(visu_surface, (WIDTH, HEIGHT))
-            screen.blit(scaled_surface, (0, 0))
+            screen.fill(GRAPH_BACKGROUND, (0, 0, WIDTH, HEIGHT))
+            if source is not None: # construction en cours : ses points au fur et à mesure
+                screen.blit(preview, (0, 0))
+            else:
+                for b, layer in layers.items():
+                    if b.is_active:
+                        screen.blit(layer.surface(view, scale, budget), (0, 0))
+            interface.draw_points(screen, to_screen(deferred), P_COLOR, 2, 1)
             interface.draw_menu_line(screen, WIDTH, (MENU_WIDTH, HEIGHT))
             for b in all_buttons:
                 interface.draw_button(screen, b, mouse_pos)
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                pygame.display.flip()     # Affiche le rendu seulement aux clic pour éviter de rafraichir constamment
-
-        if first_refresh:
-            pygame.display.flip() # on fait quand même un refresh au début pour afficher le menu
+            pygame.display.flip()
             first_refresh = False
-        
 
+    background.close()
     pygame.quit()
     sys.exit()
 
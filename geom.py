@@ -14,6 +14,7 @@ Les classes sont :
 Des fonctions prédicats sont également fournies pour les tests d'appartenance, d'intersection, etc.
 """
 
+from fractions import Fraction
 from math import sqrt
 from dataclasses import dataclass, field
 from typing import Tuple, List
@@ -57,23 +58,109 @@ def circumcenter(a: tuple[float, float], b: tuple[float, float], c: tuple[float,
 
 # ------------------------ Prédicats ------------------------
 
-def in_circle(a: tuple[float, float], b: tuple[float, float], c: tuple[float, float], p: tuple[float, float]) -> bool:
-    """Teste si le point p est à l'intérieur du cercle circonscrit au triangle abc."""
+# Les prédicats de signe (orientation, cercle) sont filtrés : le déterminant est d'abord calculé
+# en flottants, et on ne refait le calcul en arithmétique exacte (fractions) que si sa valeur
+# est plus petite que la borne d'erreur d'arrondi (bornes statiques de Shewchuk).
+EPSILON = 2.0 ** -53
+ORIENT_ERRBOUND = (3.0 + 16.0 * EPSILON) * EPSILON
+INCIRCLE_ERRBOUND = (10.0 + 96.0 * EPSILON) * EPSILON
+
+# nombre de passages par le calcul exact, pour mesurer la fréquence des cas quasi dégénérés
+exact_fallbacks = {"orient2d": 0, "incircle": 0}
+
+def reset_exact_fallbacks() -> None:
+    """Remet à zéro les compteurs de calcul exact."""
+    for key in exact_fallbacks:
+        exact_fallbacks[key] = 0
+
+def orient2d(a: tuple[float, float], b: tuple[float, float], c: tuple[float, float]) -> float:
+    """
+    Renvoie un nombre du signe exact de det(b - a, c - a) : positif si abc est dans le sens
+    trigonométrique, négatif si horaire, nul si alignés.
+    """
     x_a, y_a = a
     x_b, y_b = b
     x_c, y_c = c
-    x_p, y_p = p
-    mat = [
-        [x_a - x_p, y_a - y_p, (x_a - x_p) ** 2 + (y_a - y_p) ** 2],
-        [x_b - x_p, y_b - y_p, (x_b - x_p) ** 2 + (y_b - y_p) ** 2],
-        [x_c - x_p, y_c - y_p, (x_c - x_p) ** 2 + (y_c - y_p) ** 2]
-    ]
-    det = (
-        mat[0][0] * (mat[1][1] * mat[2][2] - mat[2][1] * mat[1][2]) -
-        mat[1][0] * (mat[0][1] * mat[2][2] - mat[2][1] * mat[0][2]) +
-        mat[2][0] * (mat[0][1] * mat[1][2] - mat[1][1] * mat[0][2])
-    )
-    return det < 0
+    return orient2d_xy(x_a, y_a, x_b, y_b, x_c, y_c)
+
+def orient2d_xy(x_a: float, y_a: float, x_b: float, y_b: float, x_c: float, y_c: float) -> float:
+    """orient2d sur des coordonnées brutes, sans tuple à construire dans les boucles chaudes."""
+    det_left = (x_a - x_c) * (y_b - y_c)
+    det_right = (y_a - y_c) * (x_b - x_c)
+    det = det_left - det_right
+    if det_left > 0:
+        if det_right <= 0:
+            return det  # signes opposés : pas d'erreur possible sur le signe
+        det_sum = det_left + det_right
+    elif det_left < 0:
+        if det_right >= 0:
+            return det
+        det_sum = -det_left - det_right
+    else:
+        return det
+    if det >= ORIENT_ERRBOUND * det_sum or -det >= ORIENT_ERRBOUND * det_sum:
+        return det
+    exact_fallbacks["orient2d"] += 1
+    x_a, y_a, x_b, y_b, x_c, y_c = map(Fraction, (x_a, y_a, x_b, y_b, x_c, y_c))
+    return float((x_a - x_c) * (y_b - y_c) - (y_a - y_c) * (x_b - x_c))
+
+def incircle(a: tuple[float, float], b: tuple[float, float], c: tuple[float, float], p: tuple[float, float]) -> float:
+    """
+    Renvoie un nombre du signe exact du déterminant du cercle (a, b, c, p) :
+    pour abc dans le sens trigonométrique, positif si p est dans le cercle circonscrit.
+    """
+    return incircle_xy(a[0], a[1], b[0], b[1], c[0], c[1], p[0], p[1])
+
+def incircle_xy(x_a: float, y_a: float, x_b: float, y_b: float, x_c: float, y_c: float, x_p: float, y_p: float) -> float:
+    """incircle sur des coordonnées brutes, sans tuple à construire dans les boucles chaudes."""
+    adx, ady = x_a - x_p, y_a - y_p
+    bdx, bdy = x_b - x_p, y_b - y_p
+    cdx, cdy = x_c - x_p, y_c - y_p
+    bdxcdy = bdx * cdy
+    cdxbdy = cdx * bdy
+    a_lift = adx * adx + ady * ady
+    cdxady = cdx * ady
+    adxcdy = adx * cdy
+    b_lift = bdx * bdx + bdy * bdy
+    adxbdy = adx * bdy
+    bdxady = bdx * ady
+    c_lift = cdx * cdx + cdy * cdy
+    det = a_lift * (bdxcdy - cdxbdy) + b_lift * (cdxady - adxcdy) + c_lift * (adxbdy - bdxady)
+    permanent = ((abs(bdxcdy) + abs(cdxbdy)) * a_lift
+                 + (abs(cdxady) + abs(adxcdy)) * b_lift
+                 + (abs(adxbdy) + abs(bdxady)) * c_lift)
+    if det > INCIRCLE_ERRBOUND * permanent or -det > INCIRCLE_ERRBOUND * permanent:
+        return det
+    exact_fallbacks["incircle"] += 1
+    x_p, y_p = Fraction(x_p), Fraction(y_p)
+    adx, ady = Fraction(x_a) - x_p, Fraction(y_a) - y_p
+    bdx, bdy = Fraction(x_b) - x_p, Fraction(y_b) - y_p
+    cdx, cdy = Fraction(x_c) - x_p, Fraction(y_c) - y_p
+    det = ((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+           + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+           + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
+    return float(det)
+
+def incircle_perturbed(a: tuple[float, float], b: tuple[float, float], c: tuple[float, float], p: tuple[float, float],
+                       ranks: tuple) -> float:
+    """
+    incircle dont les cas cocycliques sont départagés par simulation de simplicité : le relèvement
+    x² + y² du point de plus petit rang (ranks donne un rang comparable pour a, b, c, p) est augmenté
+    d'un infinitésimal, qui domine ceux des autres. Le signe ne dépend que de l'ordre des rangs :
+    des quadruplets translatés, de rangs dans le même ordre, sont départagés de la même façon.
+    Les trois autres points, cocycliques et distincts, ne sont pas alignés : le résultat n'est jamais nul.
+    """
+    det = incircle(a, b, c, p)
+    if det != 0:
+        return det
+    points = [a, b, c, p]
+    k = min(range(4), key=ranks.__getitem__)
+    del points[k]
+    return orient2d(*points) if k % 2 == 0 else -orient2d(*points)
+
+def in_circle(a: tuple[float, float], b: tuple[float, float], c: tuple[float, float], p: tuple[float, float]) -> bool:
+    """Teste si le point p est à l'intérieur du cercle circonscrit au triangle abc (sens horaire)."""
+    return incircle(a, b, c, p) < 0
 
 def in_triangle(a: tuple[float, float], b: tuple[float, float], c: tuple[float, float], p: tuple[float, float]) -> bool:
     """Teste si le point p est à l'intérieur du triangle abc."""
@@ -89,12 +176,22 @@ def segments_intersect(p1: tuple[float, float], p2: tuple[float, float], q1: tup
     return test_1 and test_2
 
 def are_clockwise(a: tuple[float, float], b: tuple[float, float], c: tuple[float, float]) -> bool:
-    """Renvoie True si a, b, c sont dans le sens horaire."""
-    x_a, y_a = a
-    x_b, y_b = b
-    x_c, y_c = c
-    det = (x_b - x_a) * (y_c - y_a) - (y_b - y_a) * (x_c - x_a)
-    return det <= 0
+    """Renvoie True si a, b, c sont dans le sens horaire (ou alignés)."""
+    return orient2d(a, b, c) <= 0
+
+def in_infinite_face(a: tuple[float, float], b: tuple[float, float], p: tuple[float, float]) -> bool:
+    """
+    Teste si p est dans la face infinie portée par l'arête finie ab : strictement du côté horaire
+    de ab, ou aligné et sur le segment [a, b]. Aligné hors du segment, p est dans une face voisine.
+    """
+    return in_infinite_face_xy(a[0], a[1], b[0], b[1], p[0], p[1])
+
+def in_infinite_face_xy(x_a: float, y_a: float, x_b: float, y_b: float, x_p: float, y_p: float) -> bool:
+    """in_infinite_face sur des coordonnées brutes."""
+    det = orient2d_xy(x_a, y_a, x_b, y_b, x_p, y_p)
+    if det != 0:
+        return det < 0
+    return min(x_a, x_b) <= x_p <= max(x_a, x_b) and min(y_a, y_b) <= y_p <= max(y_a, y_b)
 
 def in_Gab_Circle(a: tuple[float, float], b: tuple[float, float], p: tuple[float, float]) -> bool:
     """Renvoie True si p est dans le cercle de diamètre [ab]."""
@@ -114,13 +211,40 @@ def in_RNG_Moon(a: tuple[float, float], b: tuple[float, float], p: tuple[float,
     d2bp = square_dist(b, p)
     return d2ap < d2ab and d2bp < d2ab
 
+def _disk_interval(x: tuple[float, float], y: tuple[float, float], c: tuple[float, float], r2: float) -> Tuple[float, float]:
+    """Renvoie l'intervalle des t de [0, 1] tels que x + t(y - x) est dans le disque fermé (c, r2), vide si t_min > t_max."""
+    dx, dy = y[0] - x[0], y[1] - x[1]
+    fx, fy = x[0] - c[0], x[1] - c[1]
+    A = dx * dx + dy * dy
+    B = 2 * (fx * dx + fy * dy)
+    C = fx * fx + fy * fy - r2
+    if A == 0: # segment réduit à un point
+        return (1.0, 0.0) if C > 0 else (0.0, 1.0)
+    disc = B * B - 4 * A * C
+    if disc < 0: # la droite ne coupe pas le disque
+        return (1.0, 0.0)
+    s = sqrt(disc)
+    return (max(0.0, (-B - s) / (2 * A)), min(1.0, (-B + s) / (2 * A)))
+
+def segment_meets_RNG_Moon(a: tuple[float, float], b: tuple[float, float], x: tuple[float, float], y: tuple[float, float]) -> bool:
+    """
+    Renvoie True si le segment [xy] rencontre la lune de RNG de l'arête ab.
+    La lune est l'intersection de deux disques : on intersecte les deux intervalles du segment.
+    Les rayons sont légèrement gonflés, un faux positif ne coûtant qu'une face visitée de plus.
+    """
+    r2 = square_dist(a, b) * (1 + 1e-9)
+    t_a, u_a = _disk_interval(x, y, a, r2)
+    t_b, u_b = _disk_interval(x, y, b, r2)
+    return max(t_a, t_b) <= min(u_a, u_b)
+
 # ------------------------ Objets géométriques ------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     """
     Représente un point du plan, éventuellement à l'infini.
     w (int): Poids homogène. Si w == 0, le point est à l'infini.
+    Les objets géométriques sont à slots (pas de __dict__) et comparés par valeur.
     """
     x: float
     y: float
@@ -148,12 +272,12 @@ class Point:
     def is_in_circumcircle(self, triangle: "Triangle") -> bool:
         """Teste si le point est dans le cercle circonscrit du triangle."""
         a, b, c = triangle.vertices
-        if c.is_infinite:
-            return are_clockwise(a.coord, b.coord, self.coord)
+        if c.is_infinite:  # le cercle d'un triangle infini est le demi-plan de sa face
+            return in_infinite_face(a.coord, b.coord, self.coord)
         elif a.is_infinite:
-            return are_clockwise(b.coord, c.coord, self.coord)
+            return in_infinite_face(b.coord, c.coord, self.coord)
         elif b.is_infinite:
-            return are_clockwise(c.coord, a.coord, self.coord)
+            return in_infinite_face(c.coord, a.coord, self.coord)
         elif self.is_infinite:
             return False
         else:
@@ -163,11 +287,11 @@ class Point:
         """Teste si le point est dans le triangle."""
         a, b, c = triangle.vertices
         if c.is_infinite:
-            return are_clockwise(a.coord, b.coord, self.coord)
+            return in_infinite_face(a.coord, b.coord, self.coord)
         elif a.is_infinite:
-            return are_clockwise(b.coord, c.coord, self.coord)
+            return in_infinite_face(b.coord, c.coord, self.coord)
         elif b.is_infinite:
-            return are_clockwise(c.coord, a.coord, self.coord)
+            return in_infinite_face(c.coord, a.coord, self.coord)
         elif self.is_infinite:
             return False
         else:
@@ -193,7 +317,7 @@ class Point:
         else:
             return in_RNG_Moon(a.coord, b.coord, self.coord)
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     """
     Représente une arête entre deux points (a, b).
@@ -254,7 +378,7 @@ class Edge:
             return Edge(b, a).desinfinite(dist)
 
 
-@dataclass
+@dataclass(slots=True)
 class Triangle:
     """
     Représente un triangle défini par trois sommets.
@@ -274,6 +398,14 @@ class Triangle:
         a, b, c = self.vertices
         return a.is_infinite or b.is_infinite or c.is_infinite
 
+    @property
+    def is_flat(self) -> bool:
+        """Renvoie True si le triangle est fini et ses sommets alignés."""
+        a, b, c = self.vertices
+        if self.is_infinite:
+            return False
+        return orient2d(a.coord, b.coord, c.coord) == 0
+
     @property
     def centroid(self) -> Point:
         """Renvoie le centre de gravité du triangle."""
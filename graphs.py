@@ -6,7 +6,9 @@ Ce module fournit des classes pour manipuler des graphes géométriques basés s
 Les principales classes sont :
     - Vertex : sommet du graphe, hérite de geom.Point
     - Dart : brin orienté pour la représentation combinatoire des arêtes
+    - Periodic_Dart : brin d'une triangulation périodique, qui porte la translation de son sommet d'arrivée
     - Delaunay_Triangulation : structure de triangulation de Delaunay
+    - Periodic_Delaunay_Triangulation : triangulation de Delaunay du tore plat (chaque point stocké une fois)
     - Voronoi_Diagram : structure pour le diagramme de Voronoï
     - Gabriel_Graph : graphe de Gabriel
     - Rel_Neighbor_Graph : graphe des voisins relatifs
@@ -15,19 +17,30 @@ Les principales classes sont :
 Chaque classe fournit des méthodes pour la construction, l'extraction et la manipulation des structures associées.
 """
 
+import heapq
 import random
+from array import array
+from math import sqrt
 import union_find as uf  # pour le MST
+import link_cut as lc  # pour le MST incrémental
 import geom  # prédicats et objets géométriques
+import spatial_sort  # ordre d'insertion BRIO pour la construction en bloc
 from dataclasses import dataclass, field
-from typing import List, Optional
+from itertools import islice
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Vertex(geom.Point):
     """
     Sommet du graphe, hérite de geom.Point.
     ref_dart : dart de référence du sommet, initialisé à l'ajout du premier dart sur ce point.
+    index : position du sommet dans la liste vertices de la triangulation.
+    Un sommet est un objet de la topologie : il est comparé (et hashé) par identité, pas par coordonnées.
     """
     ref_dart: Optional["Dart"] = field(default=None, compare=False, repr=False)
+    index: int = field(default=-1, compare=False, repr=False)
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
 
     def __repr__(self) -> str:
         if self.is_infinite:
@@ -45,7 +58,7 @@ class Vertex(geom.Point):
             current_d = current_d.rotate
         return darts
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Dart:
     """
     Brin orienté pour la représentation combinatoire des arêtes (carte combinatoire).
@@ -53,10 +66,16 @@ class Dart:
         origin (Vertex): Sommet de départ.
         twin (Dart): Brin opposé (même arête, sens inverse).
         next (Dart): Brin suivant dans la face.
+        index (int): Position du brin dans la liste darts de la triangulation.
+    La géométrie (edge, face, apex, target_point) est vue depuis l'origin du brin : dans le plan ce sont
+    les sommets eux-mêmes, dans le tore (Periodic_Dart) les copies voisines de l'origine.
+    Les brins sont à slots et comparés par identité.
     """
     origin: Vertex
     twin: Optional["Dart"] = field(default=None, compare=False, repr=False)
     next: Optional["Dart"] = field(default=None, compare=False, repr=False)
+    index: int = field(default=-1, compare=False, repr=False)
+    sx = sy = 0.0  # translation du sommet d'arrivée, toujours nulle dans le plan (pas un champ)
 
     def __repr__(self) -> str:
         return f"Dart from ({self.origin}) to ({self.target})"
@@ -66,6 +85,22 @@ class Dart:
         """Renvoie le sommet d'arrivée du brin."""
         return self.next.origin
 
+    @property
+    def target_point(self) -> geom.Point:
+        """Renvoie le sommet d'arrivée tel que vu depuis l'origine."""
+        return self.next.origin
+
+    @property
+    def apex(self) -> geom.Point:
+        """Renvoie le troisième sommet de la face, tel que vu depuis l'origine."""
+        return self.next.next.origin
+
+    @property
+    def square_length(self) -> float:
+        """Renvoie la longueur au carré de l'arête (brin fini)."""
+        a, b = self.origin, self.next.origin
+        return (b.x + self.sx - a.x) ** 2 + (b.y + self.sy - a.y) ** 2
+
     @property
     def rotate(self) -> "Dart":
         """Renvoie le brin suivant autour du sommet d'origine (rotation locale)."""
@@ -109,49 +144,308 @@ class Dart:
         """Détermine si le brin est fini et unique (pour affichage)."""
         a = self.origin
         b = self.target
-        inf_V = geom.Point(0, 0, 0)
-        if a == inf_V or b == inf_V or geom.are_clockwise(a.coord, b.coord, (0, 0)):
+        if a.is_infinite or b.is_infinite:
             return False
-        return True
+        det = geom.orient2d(a.coord, b.coord, (0, 0))
+        if det == 0: # arête alignée avec l'origine : on départage les deux brins par leurs coordonnées
+            return a.coord < b.coord
+        return det > 0
         
+    @property
+    def is_flat(self) -> bool:
+        """Renvoie True si la face est finie et ses sommets alignés (comme face.is_flat, sans construire le triangle)."""
+        d_bc = self.next
+        a, b, c = self.origin, d_bc.origin, d_bc.next.origin
+        if a.w == 0 or b.w == 0 or c.w == 0:
+            return False
+        return geom.orient2d_xy(a.x, a.y, b.x + self.sx, b.y + self.sy,
+                                c.x + (self.sx + d_bc.sx), c.y + (self.sy + d_bc.sy)) == 0
+
     def flip(self) -> None: 
-        """Flippe le brin dans un quadrilatère paqb, remplaçant ab par pq."""
-        d_ab, d_bp, d_pa = self.cycle # les 3 darts de abb
-        d_ba, d_aq, d_qb = self.twin.cycle # les 3 darts de aqb
-        # maj des darts de reference des sommets si besoin
-        for d in (d_ab, d_ba):
-            if d.origin.ref_dart == d:
-                d.origin.ref_dart = d.rotate # on choisit alors d.rotate car il n'est pas modifié par le flip en cours
+        """Flippe le brin dans un quadrilatère paqb, remplaçant ab par pq (sans liste intermédiaire)."""
+        d_ab, d_ba = self, self.twin
+        d_bp = d_ab.next
+        d_pa = d_bp.next
+        d_aq = d_ba.next
+        d_qb = d_aq.next
+        # maj des darts de reference des sommets si besoin : on prend le rotate, qui n'est pas modifié par le flip
+        if d_ab.origin.ref_dart is d_ab:
+            d_ab.origin.ref_dart = d_aq
+        if d_ba.origin.ref_dart is d_ba:
+            d_ba.origin.ref_dart = d_bp
         # flip des sommets
         d_ab.origin = d_qb.origin 
         d_ba.origin = d_pa.origin
         d_qp, d_pq = d_ab, d_ba # renommés juste pour la lisibilité
-        # maj des pointages next
-        tri_aqp = [d_aq, d_qp, d_pa]
-        Dart.set_next_each_other(tri_aqp)
-        tri_bpq = [d_bp, d_pq, d_qb]
-        Dart.set_next_each_other(tri_bpq)
-    
+        # maj des pointages next : faces aqp et bpq
+        d_aq.next, d_qp.next, d_pa.next = d_qp, d_pa, d_aq
+        d_bp.next, d_pq.next, d_qb.next = d_pq, d_qb, d_bp
+
+@dataclass(slots=True, eq=False)
+class Periodic_Dart(Dart):
+    """
+    Brin d'une triangulation périodique.
+    (sx, sy) est la translation (multiple de la période) à appliquer au sommet d'arrivée pour obtenir
+    sa copie voisine de l'origine. Le twin porte la translation opposée, et les translations
+    d'une face ont une somme nulle : la face est vue depuis l'origine de n'importe lequel de ses brins.
+    """
+    sx: float = field(default=0.0, compare=False, repr=False)
+    sy: float = field(default=0.0, compare=False, repr=False)
+
+    @property
+    def target_point(self) -> geom.Point:
+        """Renvoie la copie du sommet d'arrivée voisine de l'origine."""
+        b = self.next.origin
+        return geom.Point(b.x + self.sx, b.y + self.sy)
+
+    @property
+    def apex(self) -> geom.Point:
+        """Renvoie la copie du troisième sommet de la face voisine de l'origine."""
+        d = self.next
+        c = d.next.origin
+        return geom.Point(c.x + (self.sx + d.sx), c.y + (self.sy + d.sy)) # translations sommées d'abord : exactes
+
+    @property
+    def edge(self) -> geom.Edge:
+        return geom.Edge(self.origin, self.target_point)
+
+    @property
+    def face(self) -> geom.Triangle:
+        return geom.Triangle(self.origin, self.target_point, self.apex)
+
+    def choose_unique_finite(self) -> bool:
+        """Choisit un des deux brins de chaque arête : l'orientation dépend de la translation, pas des indices."""
+        a, b = self.origin.index, self.next.origin.index
+        if a == b: # boucle (triangulation très grossière) : on départage par la translation
+            return (self.sx, self.sy) > (0.0, 0.0)
+        return a < b
+
+    def flip(self) -> None:
+        """Flippe le brin comme dans le plan, puis recalcule la translation de la nouvelle arête qp."""
+        d_ab, d_bp = self, self.next
+        d_aq = self.twin.next
+        # depuis a : p est en (p + s_ab + s_bp), q en (q + s_aq)
+        sx = d_ab.sx + d_bp.sx - d_aq.sx
+        sy = d_ab.sy + d_bp.sy - d_aq.sy
+        twin = self.twin
+        Dart.flip(self) # pas de super() sans argument : dataclass(slots=True) recrée la classe
+        self.sx, self.sy = sx, sy
+        twin.sx, twin.sy = -sx, -sy
+
+
+def edge_key(a: Vertex, b: Vertex) -> Tuple[int, int]:
+    """Clé d'une arête non orientée, indépendante du sens (par identité des sommets)."""
+    return (id(a), id(b)) if id(a) < id(b) else (id(b), id(a))
+
+def _csr(n: int, rows: array, cols: array, weights: Optional[array]) -> Tuple[array, array, Optional[array]]:
+    """Range les arcs (rows[k], cols[k]) de poids weights[k] par ligne (tri par comptage, en O(n + arcs))."""
+    indptr = array('i', bytes(4 * (n + 1)))
+    for i in rows:
+        indptr[i + 1] += 1
+    for i in range(n):
+        indptr[i + 1] += indptr[i]
+    position = indptr[:-1]  # prochaine case libre de chaque ligne
+    indices = array('i', bytes(4 * len(rows)))
+    data = array('d', bytes(8 * len(rows))) if weights is not None else None
+    for k, i in enumerate(rows):
+        p = position[i]
+        position[i] = p + 1
+        indices[p] = cols[k]
+        if data is not None:
+            data[p] = weights[k]
+    return indptr, indices, data
+
+def _dart_csr(DT: "Delaunay_Triangulation", lengths: bool, keep: Optional[dict] = None) -> Tuple[array, array, Optional[array]]:
+    """CSR des arêtes finies de DT (seulement celles dont la clé est dans keep si keep est donné)."""
+    rows, cols = array('i'), array('i')
+    weights = array('d') if lengths else None
+    inf = DT.infinite
+    for d in DT.darts: # chaque brin donne un arc, son jumeau l'arc inverse
+        a, b = d.origin, d.next.origin
+        if a is inf or b is inf or (keep is not None and edge_key(a, b) not in keep):
+            continue
+        rows.append(a.index)
+        cols.append(b.index)
+        if lengths:
+            weights.append(sqrt((b.x + d.sx - a.x) ** 2 + (b.y + d.sy - a.y) ** 2))
+    return _csr(len(DT.vertices), rows, cols, weights)
+
+@dataclass
+class Change:
+    """
+    Modification locale de la triangulation, transmise aux graphes abonnés.
+    vertex : sommet inséré ou supprimé (après une suppression, vertex.index est l'indice qu'il occupait,
+             repris par le dernier sommet de la liste).
+    inserted : True pour une insertion, False pour une suppression.
+    darts : darts des faces créées ou modifiées (par création de darts ou flips), donc de toutes les arêtes
+            dont une face voisine a changé, ainsi que les darts qui ont changé d'indice.
+    removed : arêtes (paires de sommets) qui ont disparu de la triangulation (flippées ou supprimées).
+    """
+    vertex: Vertex
+    inserted: bool
+    darts: List[Dart]
+    removed: List[Tuple[Vertex, Vertex]]
 
 #-----------------------------------------------------GRAPHES---------------
 class Graph:
     """
     Classe de base pour les graphes géométriques.
+    Un graphe dérivé retient la triangulation dont il est extrait et sa version (Delaunay_Triangulation.version) :
+    c'est une vue paresseuse, que sync ne réextrait que si la triangulation a été modifiée depuis.
+    Chaque graphe concret fournit csr(lengths=False), sa matrice d'adjacence au format CSR : les voisins
+    du noeud i sont indices[indptr[i]:indptr[i + 1]] (tableaux d'entiers 32 bits), et les longueurs des arêtes
+    correspondantes sont aux mêmes positions du tableau de flottants lengths (None si lengths est faux).
+    Chaque arête apparaît dans les deux sens. Les noeuds sont les sommets de la triangulation
+    (le sommet infini 0 restant isolé), sauf pour le diagramme de Voronoï.
     """
+    triangulation: Optional["Delaunay_Triangulation"] = None
+    version = -1  # version de la triangulation au dernier calcul (-1 : vide)
+
     def reset(self) -> None:   # a modifier
         self.__init__()
+        self.version = -1
+
+    def is_current(self, DT: "Delaunay_Triangulation") -> bool:
+        """Vrai si le graphe est celui de la triangulation DT telle qu'elle est (rien à recalculer)."""
+        return self.triangulation is DT and self.version == DT.version
+
+    def sync(self, DT: "Delaunay_Triangulation") -> "Graph":
+        """Renvoie le graphe à jour de DT, réextrait seulement s'il est périmé : O(1) sur une triangulation inchangée."""
+        if not self.is_current(DT):
+            self.extract_from_Del(DT)
+            self.version = DT.version
+        return self
+
+    def update(self, DT: "Delaunay_Triangulation", change: Change) -> None:
+        """Met à jour le graphe après une modification locale de la triangulation (par défaut : extraction complète)."""
+        self.extract_from_Del(DT)
+
+    def sparse_matrix(self, lengths: bool = True) -> "scipy.sparse.csr_matrix":
+        """
+        Renvoie la matrice d'adjacence en scipy.sparse.csr_matrix, de coefficients les longueurs des arêtes
+        (ou 1), qui partage les tableaux de csr sans les copier. scipy et numpy ne sont importés qu'ici.
+        """
+        import numpy
+        import scipy.sparse
+        indptr, indices, data = self.csr(lengths)
+        n = len(indptr) - 1
+        values = numpy.frombuffer(data, dtype=numpy.float64) if lengths else numpy.ones(len(indices))
+        return scipy.sparse.csr_matrix((values, numpy.frombuffer(indices, dtype=numpy.int32),
+                                        numpy.frombuffer(indptr, dtype=numpy.int32)), shape=(n, n), copy=False)
 
 #----------------------------------------------------Delaunay triangulation
 class Delaunay_Triangulation(Graph):
     """
     Structure de triangulation de Delaunay.
+    Tant que tous les points sont alignés, seuls les deux premiers sont triangulés (une arête) et les autres
+    attendent dans aligned un point hors de la droite : les graphes dérivés (Voronoï, Gabriel, RNG, MST)
+    restent alors vides, plutôt que de donner des arêtes qui enjambent des points en attente.
     """
     vertices: List[Vertex]
     darts: List[Dart]
+    aligned: List[Vertex]
+    dart_class = Dart  # classe des brins créés par _new_dart
 
     def __init__(self):
-        self.vertices: List[Vertex] = [Vertex(0, 0, 0)]
+        self.infinite = Vertex(0, 0, 0, index=0)  # sommet infini, unique : on le reconnaît par identité
+        self.vertices: List[Vertex] = [self.infinite]
         self.darts: List[Dart] = []
+        self.free_darts: List[Dart] = []  # darts libérés par les suppressions, réutilisés par _new_dart
+        self.aligned: List[Vertex] = []  # points alignés avec les deux premiers, en attente
+        self.subscribers: List[Graph] = []  # graphes mis à jour à chaque modification
+        self.suspended: List[Graph] = []  # graphes désabonnés gardés tant que la triangulation ne change pas (suspend)
+        self.locator = None  # fournit le dart de départ des marches (cf. set_locator), aléatoire si None
+        self.version = 0  # incrémentée à chaque modification (cf. Graph.is_current)
+        self.duplicates = 0  # points doubles ignorés depuis la construction, signalés une fois par cli
+
+    def reset(self) -> None:
+        """Vide la triangulation ainsi que les graphes abonnés, qui restent abonnés (de même pour le localisateur)."""
+        subscribers, suspended, locator, version = self.subscribers, self.suspended, self.locator, self.version
+        self.__init__()
+        self.subscribers, self.suspended, self.locator, self.version = subscribers, suspended, locator, version
+        self._modified()
+        for graph in self.subscribers:
+            graph.reset()
+        if locator is not None:
+            locator.rebuild(self)
+
+    def release(self) -> None:
+        """
+        Vide la triangulation pour de bon : casse les cycles de références entre brins et sommets, puis vide
+        et désabonne ses graphes et retire le localisateur. La mémoire est rendue aussitôt par le comptage
+        de références, sans attendre un passage du ramasse-miettes (cf. worker, qui le suspend).
+        """
+        for d in self.darts + self.free_darts:
+            d.origin = d.twin = d.next = None
+        for v in self.vertices:
+            v.ref_dart = None
+        subscribers = self.subscribers
+        self.subscribers, self.locator = [], None
+        for graph in subscribers:
+            graph.reset()
+        self.reset()
+
+    def set_locator(self, locator) -> None:
+        """
+        Choisit le localisateur des insertions une à une (None : départ aléatoire), par exemple
+        locators.Delaunay_Hierarchy(). Un localisateur fournit start(x, y), le dart de départ de la marche
+        (ou None), est prévenu de chaque sommet inséré ou supprimé (inserted(v), removed(v)),
+        et reconstruit par rebuild(triangulation) après une construction en bloc.
+        """
+        self.locator = locator
+        if locator is not None:
+            locator.rebuild(self)
+
+    def subscribe(self, graph: Graph, extract: bool = True) -> None:
+        """
+        Abonne un graphe aux modifications de la triangulation et l'extrait une première fois, sauf s'il est
+        déjà à jour (graphe suspendu, triangulation inchangée : O(1)) ou si extract est faux (le graphe
+        a déjà été extrait de la triangulation telle qu'elle est).
+        """
+        if graph in self.suspended:
+            self.suspended.remove(graph)
+        if graph not in self.subscribers:
+            self.subscribers.append(graph)
+        if extract and not (graph.triangulation is self and graph.version == self.version):
+            graph.extract_from_Del(self)
+        graph.version = self.version
+
+    def unsubscribe(self, graph: Graph) -> None:
+        """Désabonne un graphe, qui n'est plus mis à jour."""
+        if graph in self.subscribers:
+            self.subscribers.remove(graph)
+
+    def suspend(self, graph: Graph) -> None:
+        """
+        Désabonne un graphe (affichage coupé...) sans le vider : tant que la triangulation n'est pas modifiée,
+        il reste à jour et un nouvel abonnement est en O(1). À la première modification, il est vidé (reset)
+        et sa mémoire rendue ; il ne sera recalculé qu'à la demande (sync ou subscribe).
+        """
+        self.unsubscribe(graph)
+        if graph not in self.suspended:
+            self.suspended.append(graph)
+
+    def _modified(self) -> None:
+        """Nouvelle version de la triangulation : les graphes suspendus, désormais périmés, sont vidés."""
+        self.version += 1
+        if self.suspended:
+            suspended, self.suspended = self.suspended, []
+            for graph in suspended:
+                graph.reset()
+
+    def _advance_subscribers(self) -> None:
+        """Modification sans effet sur les graphes abonnés (vides tant que les points sont alignés) : ils restent à jour."""
+        for graph in self.subscribers:
+            graph.version = self.version
+
+    def _notify(self, change: Optional[Change] = None) -> None:
+        """Prévient les graphes abonnés d'une modification (sans change : tout est à réextraire)."""
+        for graph in self.subscribers:
+            if change is None:
+                graph.extract_from_Del(self)
+            else:
+                graph.update(self, change)
+            graph.version = self.version
 
     @property
     def unique_finite_darts(self) -> List[Dart]:
@@ -163,100 +457,379 @@ class Delaunay_Triangulation(Graph):
         """Renvoie la liste des arêtes géométriques du graphe."""
         return [dart.edge for dart in self.unique_finite_darts]
 
-    def build(self, points: List[geom.Point]) -> None:
-        """Construit la triangulation à partir d'une liste de points."""
+    def csr(self, lengths: bool = False) -> Tuple[array, array, Optional[array]]:
+        """Matrice d'adjacence CSR des arêtes finies (cf. Graph), lue directement sur les brins."""
+        return _dart_csr(self, lengths)
+
+    def build(self, points: List[geom.Point], brio: bool = False) -> None:
+        """
+        Construit la triangulation à partir d'une liste de points.
+        brio : insère les points dans l'ordre BRIO (rounds triés par Hilbert)
+        et lance chaque marche depuis le dernier sommet inséré, construction quasi linéaire.
+        """
         self.reset()
+        if brio:
+            points = spatial_sort.brio_order(points)
+        # pas de mise à jour des abonnés (ni du localisateur) à chaque insertion : une seule fois à la fin
+        subscribers, self.subscribers = self.subscribers, []
+        locator, self.locator = self.locator, None
         for p in points:
-            self.insert_point(p)
+            self.insert_point(p, brio)
+        self.subscribers = subscribers
+        self.set_locator(locator)
+        self._notify()
 
-    def insert_point(self, p: geom.Point) -> None:
-        """Insère un point dans la triangulation."""
+    def insert_stream(self, points: Union[Iterable[geom.Point], str], chunk_size: int = 10000,
+                      progress: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Insère les points d'un itérable (générateur...) ou d'un fichier (chemin, cf. point_io.read_points)
+        dans la triangulation, sans la vider : ils sont lus par morceaux de chunk_size points, chaque morceau
+        étant inséré dans l'ordre BRIO tant que la triangulation a moins de sommets que lui, puis simplement
+        trié par Hilbert (l'aléa ne sert plus, les marches sont plus courtes), avec des marches depuis
+        le dernier sommet inséré.
+        Seul un morceau est en mémoire en plus de la triangulation.
+        progress(n) est appelé après chaque morceau, n étant le nombre de points lus depuis le début.
+        Comme pour build, les graphes abonnés et le localisateur ne sont mis à jour qu'une fois, à la fin.
+        """
+        if isinstance(points, str):
+            import point_io
+            points = point_io.read_points(points)
+        points = iter(points)
+        subscribers, self.subscribers = self.subscribers, []
+        locator, self.locator = self.locator, None
+        count = 0
+        try:
+            while True:
+                chunk = list(islice(points, chunk_size))
+                if not chunk:
+                    break
+                order = spatial_sort.brio_order if len(self.vertices) <= len(chunk) else spatial_sort.hilbert_sort
+                for p in order(chunk):
+                    self.insert_point(p, True)
+                count += len(chunk)
+                if progress is not None:
+                    progress(count)
+        finally:
+            self.subscribers = subscribers
+            self.set_locator(locator)
+            self._notify()
+
+    def build_parallel(self, points: List[geom.Point], workers: Optional[int] = None) -> None:
+        """
+        Construit la triangulation comme build (ordre BRIO), en découpant les points en bandes verticales
+        triangulées en parallèle par workers processus (par défaut un par cœur), puis recollées (module parallel).
+        En dessous de parallel.MIN_POINTS points par processus, la construction reste en série.
+        """
+        import parallel # importé ici seulement : multiprocessing n'est chargé que pour les grandes constructions
+        parallel.build_parallel(self, points, workers)
+
+    def save(self, path: str) -> None:
+        """Écrit la triangulation dans un fichier binaire (format du module storage), relu par load."""
+        import storage
+        storage.save(self, path)
+
+    @staticmethod
+    def load(path: str) -> "Delaunay_Triangulation":
+        """Relit une triangulation écrite par save, sans la reconstruire (aucun prédicat n'est évalué)."""
+        import storage
+        return storage.load(path)
+
+    def profile_build(self, points: List[geom.Point], brio: bool = False) -> "instrument.Build_Report":
+        """
+        Construit la triangulation comme build, avec l'instrumentation du module instrument
+        (pas de marche, prédicats, flips, temps par phase), et renvoie le rapport de la construction.
+        """
+        import instrument # importé ici seulement : sans profilage, le noyau n'est jamais modifié
+        with instrument.instrumented(type(self)) as report: # les méthodes redéfinies (tore) sont instrumentées
+            self.build(points, brio)
+        return report
+
+    def insert_point(self, p: geom.Point, walk_from_last: bool = False) -> None:
+        """
+        Insère un point dans la triangulation.
+        walk_from_last : la marche part du dernier sommet inséré au lieu du dart donné par le localisateur
+        (ou d'un dart aléatoire sans localisateur).
+        Un point double est ignoré : la triangulation, et donc sa version, ne changent pas.
+        """
         x, y = p
-        v = Vertex(x, y)
+        v = Vertex(x, y, index=len(self.vertices))
         self.vertices.append(v)
         if len(self.vertices) == 2:
+            self._modified()
+            if self.locator is not None:
+                self.locator.inserted(v)
+            self._advance_subscribers()
             return
         if len(self.vertices) == 3:
-            if p == self.vertices[1]:
+            if (x, y) == (self.vertices[1].x, self.vertices[1].y):
                 self.vertices.pop() # pour éviter les points doubles (doubles clics)
+                self.duplicates += 1
                 return
             else:
+                self._modified()
                 self._init_first_faces()
+                if self.locator is not None:
+                    self.locator.inserted(v)
+                self._notify()
+            return
+        if len(self.vertices) == 4 and geom.orient2d(self.vertices[1].coord, self.vertices[2].coord, v.coord) == 0:
+            # tous les points sont alignés : on attend un point hors de la droite pour trianguler
+            self.vertices.pop()
+            if any(u.x == x and u.y == y for u in self.vertices[1:] + self.aligned):
+                self.duplicates += 1 # point double
+                return
+            self._modified()
+            self.aligned.append(v)
+            if len(self.aligned) == 1: # l'arête des deux premiers points enjambe peut-être v : graphes vidés
+                self._notify()
+            else:
+                self._advance_subscribers()
             return
         # si la triangulation est déjà créée, on insert le point
-        self._insert_in_Delaunay(v)
+        if walk_from_last:
+            start = self.vertices[-2].ref_dart
+        else:
+            start = self.locator.start(x, y) if self.locator is not None else None
+        removed = self._insert_in_Delaunay(v, start)
+        if removed is None: # point double
+            return
+        self._modified()
+        if self.locator is not None:
+            self.locator.inserted(v)
+        if self.aligned:  # la triangulation n'est plus plate, on insère les points en attente
+            aligned, self.aligned = self.aligned, []
+            subscribers, self.subscribers = self.subscribers, []
+            for u in aligned:
+                self.insert_point(u.coord)
+            self.subscribers = subscribers
+            self._notify()
+        elif removed is not None and self.subscribers:
+            star = [d for spoke in v.incident_darts for d in spoke.cycle]
+            self._notify(Change(v, True, star, removed))
 
     def _init_first_faces(self) -> None:
         """Crée et initialise les 6 premiers darts (4 infinis et 2 finis)."""
         a, b, c = self.vertices
         # initialisation des darts
-        darts_A = [Dart(a), Dart(b), Dart(c)]
-        darts_B = [Dart(b), Dart(c), Dart(a)]
+        darts_A = [self._new_dart(a), self._new_dart(b), self._new_dart(c)]
+        darts_B = [self._new_dart(b), self._new_dart(c), self._new_dart(a)]
         # maj des refs, twin, next
         for i in range(3):
             self.vertices[i].ref_dart = darts_A[i]
             Dart.set_twin_each_other(darts_A[i], darts_B[i])
         Dart.set_next_each_other(darts_A)
         Dart.set_next_each_other(darts_B[::-1])
-        self.darts.extend(darts_A)
-        self.darts.extend(darts_B)
 
-    def _insert_in_Delaunay(self, v: Vertex) -> None:
-        """Insère un sommet dans la triangulation de Delaunay et met à jour les darts."""
-        dart = self.segment_walk_to(v) # On trouve une face en conflit
+    def _new_dart(self, origin: Vertex) -> Dart:
+        """Crée (ou recycle) un brin, l'ajoute à la liste des darts et renseigne son indice."""
+        if self.free_darts:
+            dart = self.free_darts.pop()
+            dart.origin = origin
+            dart.index = len(self.darts)
+        else:
+            dart = self.dart_class(origin, index=len(self.darts))
+        self.darts.append(dart)
+        return dart
+
+    def _free_dart(self, dart: Dart) -> Optional[Dart]:
+        """
+        Retire un brin de la liste des darts en O(1) (le dernier prend sa place) et le met de côté.
+        Renvoie le brin déplacé (qui a changé d'indice), s'il y en a un.
+        """
+        last = self.darts.pop()
+        moved = None
+        if last is not dart:
+            self.darts[dart.index] = last
+            last.index = dart.index
+            moved = last
+        dart.twin = dart.next = None
+        dart.index = -1
+        self.free_darts.append(dart)
+        return moved
+
+    def _insert_in_Delaunay(self, v: Vertex, start: Optional[Dart] = None) -> Optional[List[Tuple[Vertex, Vertex]]]:
+        """
+        Insère un sommet dans la triangulation de Delaunay et met à jour les darts.
+        Renvoie les arêtes supprimées par les flips, ou None si le point existait déjà.
+        """
+        dart = self.segment_walk_to(v, start) # On trouve une face en conflit
         if dart == "Point deja existant":
             self.vertices.pop()
-            print("Point non ajouté.")
-            return
+            self.duplicates += 1
+            return None
+        # les arêtes flippées ne servent qu'aux abonnés : sans abonné, on ne les collecte pas
+        flipped: Optional[List[Tuple[Vertex, Vertex]]] = [] if self.subscribers else None
         darts_to_flip = self._init_new_darts(dart, v) # On relie la triangualtion avec les nouveaux darts
-        for dart in darts_to_flip: # Et on rétablit recursivement la propriété de Delanuay
-            Delaunay_Triangulation._flip_until_Del(dart)
-
-    def segment_walk_to(self, target: Vertex) -> Dart:
-        """Recherche le triangle contenant le point cible par segment walk."""
-        dart = random.choice(self.darts)
-        triangle = dart.face
-        found = target.is_in_triangle(triangle)
-        if not found:
-            if triangle.is_infinite: # si c'est une face infinie, on change de dart pour rentrer dans l'enveloppe convexe
-                while dart.edge.is_infinite: # on cherche le dart fini du triangle
-                    dart = dart.next
-                dart = dart.twin # puis on switch à l'intérieur de l'enveloppe convexe
-                triangle = dart.face # 2 cas possibles: Soit target est dans triangle, soit triangle est fini
-                found = target.is_in_triangle(triangle)
-            source = triangle.centroid
-            segment = geom.Edge(source, target)
-        # Recherche du triangle contenant p
-        while not found:
-            dart = Delaunay_Triangulation._find_crossing_dart(dart, segment) # identification du segment du triangle qui coupe [sp] 
-            triangle = dart.face
-            found = target.is_in_triangle(triangle)
-            if triangle.is_infinite:
-                break # dans ce cas, target est hors de l'enveloppe convexe, comme on en vient, dart est visible par target
-        # Si le point est un sommet du triangle, on ne l'ajoutera pas
-        if target in triangle.vertices:
-            return "Point deja existant"
+        for dart in darts_to_flip: # Et on rétablit la propriété de Delanuay
+            # un triangle plat apparaît quand le point est inséré sur une arête : on flippe d'office cette arête
+            self._flip_until_Del(dart, dart.is_flat, flipped)
+        return flipped if flipped is not None else []
+
+    def segment_walk_to(self, target: Vertex, start: Optional[Dart] = None) -> Dart:
+        """
+        Recherche le triangle contenant le point cible par segment walk, depuis start (aléatoire par défaut) :
+        on suit le segment qui va du centre de gravité de la face de départ à la cible.
+        La marche travaille sur les coordonnées des sommets et les brins, sans créer d'objet à chaque pas.
+        Renvoie un dart de la face trouvée (le dart fini si la cible est hors de l'enveloppe convexe),
+        ou "Point deja existant" si la cible est un sommet de cette face.
+        """
+        orient = geom.orient2d_xy
+        inf = self.infinite
+        x, y = target.x, target.y
+        dart = start if start is not None else random.choice(self.darts)
+        if dart.origin is inf or dart.next.origin is inf or dart.next.next.origin is inf:
+            while dart.origin is inf or dart.next.origin is inf: # on cherche le dart fini de la face infinie
+                dart = dart.next
+            a, b = dart.origin, dart.next.origin
+            if geom.in_infinite_face_xy(a.x, a.y, b.x, b.y, x, y):
+                return self._unless_vertex(dart, x, y)
+            dart = dart.twin # on rentre dans l'enveloppe convexe
+            if dart.next.next.origin is inf: # deux sommets seulement : la cible est dans l'autre face infinie
+                return self._unless_vertex(dart, x, y)
+        a, b, c = dart.origin, dart.next.origin, dart.next.next.origin
+        g_x = (a.x + b.x + c.x) / 3 # source du segment : centre de gravité de la face de départ
+        g_y = (a.y + b.y + c.y) / 3
+        # on part d'un brin de la face dont la cible est du côté intérieur (il y en a toujours un)
+        for _ in range(2):
+            a, b = dart.origin, dart.next.origin
+            if orient(a.x, a.y, b.x, b.y, x, y) <= 0:
+                break
+            dart = dart.next
+        find_crossing_dart = self._find_crossing_dart # par l'instance : instrument peut le remplacer sur une sous-classe
+        while True:
+            crossing = find_crossing_dart(dart, g_x, g_y, x, y)
+            if crossing is None: # la cible est dans la face
+                break
+            dart = crossing
+            if dart.next.next.origin is inf:
+                break # target est hors de l'enveloppe convexe, comme on en vient, dart est visible par target
+        return self._unless_vertex(dart, x, y)
+
+    @staticmethod
+    def _unless_vertex(dart: Dart, x: float, y: float) -> Dart:
+        """Renvoie dart, ou "Point deja existant" si (x, y) est un sommet de sa face."""
+        d = dart
+        for _ in range(3):
+            u = d.origin
+            if u.w != 0 and u.x == x and u.y == y:
+                return "Point deja existant"
+            d = d.next
         return dart
 
     @staticmethod
-    def _find_crossing_dart(d: Dart, segment: geom.Edge) -> Dart:
-        """Trouve le brin de la face qui intersecte un segment donné."""
-        found = False
-        while not found:
-            d = d.next # on teste deja d.next sinon on repartirai en arrière
-            edge = d.edge
-            found = edge.intersects(segment)
-        return d.twin
+    def _find_crossing_dart(d: Dart, g_x: float, g_y: float, x: float, y: float) -> Optional[Dart]:
+        """
+        Un pas de la marche : d est un brin d'une face finie dont la cible (x, y) n'est pas strictement
+        de l'autre côté (le brin par lequel on est entré). Renvoie None si la cible est dans la face (fermée),
+        sinon le twin du brin que le segment [g, cible] traverse pour en sortir.
+        Si le segment passe exactement par un sommet, aucune arête ne le coupe franchement :
+        on traverse alors une arête dont la cible est strictement de l'autre côté (pas de marche
+        de visibilité, qui termine toujours dans une triangulation de Delaunay).
+        """
+        orient = geom.orient2d_xy
+        d_bc = d.next
+        d_ca = d_bc.next
+        a, b, c = d.origin, d_bc.origin, d_ca.origin
+        if orient(b.x, b.y, c.x, c.y, x, y) <= 0:
+            if orient(c.x, c.y, a.x, a.y, x, y) <= 0:
+                return None
+            return d_ca.twin
+        # bc est traversable, ca aussi si la cible est de l'autre côté : on garde celle que coupe le segment
+        if (orient(c.x, c.y, a.x, a.y, x, y) > 0
+                and not Delaunay_Triangulation._crosses(b, c, g_x, g_y, x, y)
+                and Delaunay_Triangulation._crosses(c, a, g_x, g_y, x, y)):
+            return d_ca.twin
+        return d_bc.twin
+
+    @staticmethod
+    def _crosses(u: Vertex, w: Vertex, g_x: float, g_y: float, x: float, y: float) -> bool:
+        """
+        Teste si le segment [uw] coupe le segment [g, cible], la cible étant strictement de l'autre côté de uw
+        (mêmes conventions que geom.segments_intersect, sur les coordonnées brutes).
+        """
+        orient = geom.orient2d_xy
+        return (orient(u.x, u.y, w.x, w.y, g_x, g_y) <= 0
+                and (orient(u.x, u.y, g_x, g_y, x, y) <= 0) != (orient(w.x, w.y, g_x, g_y, x, y) <= 0))
+
+    def locate(self, x: float, y: float, start: Optional[Dart] = None) -> Dart:
+        """
+        Marche de visibilité jusqu'à la face contenant (x, y), depuis start (aléatoire par défaut).
+        Renvoie un dart de cette face, ou le dart fini d'une face infinie si le point est hors de l'enveloppe convexe.
+        """
+        orient = geom.orient2d_xy
+        inf = self.infinite
+        d = start if start is not None else random.choice(self.darts)
+        if d.origin is inf or d.next.origin is inf or d.next.next.origin is inf:
+            while d.origin is inf or d.next.origin is inf: # on cherche le dart fini de la face infinie
+                d = d.next
+            if geom.in_infinite_face(d.origin.coord, d.target.coord, (x, y)):
+                return d
+            d = d.twin # on rentre dans l'enveloppe convexe
+            if d.next.next.origin is inf: # deux sommets seulement : le point est dans l'autre face infinie
+                return d
+        while True:
+            e = d
+            for _ in range(3):
+                a, b = e.origin, e.next.origin
+                if orient(a.x, a.y, b.x, b.y, x, y) > 0:
+                    break # le point est strictement de l'autre côté de e
+                e = e.next
+            else:
+                return d
+            d = e.twin
+            if d.next.next.origin is inf: # on est sorti de l'enveloppe convexe par l'arête d
+                return d
+
+    def nearest_vertex(self, x: float, y: float) -> Optional[Vertex]:
+        """
+        Renvoie le sommet le plus proche de (x, y), None si la triangulation est vide.
+        On localise le point (depuis le localisateur s'il y en a un), puis on passe de sommet en voisin
+        plus proche tant qu'il y en a un : dans une triangulation de Delaunay, cette descente termine
+        sur le plus proche sommet.
+        """
+        candidates = self.aligned + (self.vertices[1:] if not self.darts else [])
+        v = None
+        if self.darts:
+            inf = self.infinite
+            d = self.locate(x, y, self.locator.start(x, y) if self.locator is not None else None)
+            v = d.origin if d.origin is not inf else d.next.origin
+            best = (v.x - x) ** 2 + (v.y - y) ** 2
+            improved = True
+            while improved:
+                improved = False
+                for e in v.incident_darts:
+                    u = e.next.origin
+                    if u is not inf and (u.x - x) ** 2 + (u.y - y) ** 2 < best:
+                        v, best, improved = u, (u.x - x) ** 2 + (u.y - y) ** 2, True
+        for u in candidates: # points en attente (ou triangulation sans face)
+            if v is None or (u.x - x) ** 2 + (u.y - y) ** 2 < (v.x - x) ** 2 + (v.y - y) ** 2:
+                v = u
+        return v
+
+    def locate_many(self, points: List[Tuple[float, float]]) -> array:
+        """
+        Localise une suite de points (liste de couples, ou tableau (N, 2)).
+        Renvoie le tableau des indices des darts trouvés par locate, dans l'ordre des points.
+        Les points sont parcourus dans l'ordre de Hilbert, chaque marche partant du résultat précédent.
+        """
+        coords = [(float(x), float(y)) for x, y in points]
+        result = array('i', [-1]) * len(coords)
+        if not self.darts:
+            return result
+        dart = None
+        for i in spatial_sort.hilbert_order(coords):
+            x, y = coords[i]
+            dart = self.locate(x, y, dart)
+            result[i] = dart.index
+        return result
 
     def _init_new_darts(self, dart: Dart, v: Vertex) -> List[Dart]:
         """Crée et initialise les nouveaux darts liés à l'ajout d'un sommet."""
         triangle_darts = dart.cycle
         # création et ajout des 6 nouveaux darts
-        new_darts_from_v = [Dart(v), Dart(v), Dart(v)]
+        new_darts_from_v = [self._new_dart(v) for _ in range(3)]
         v.ref_dart = new_darts_from_v[0]
-        new_darts_to_v = [Dart(d.origin) for d in triangle_darts]
-        self.darts.extend(new_darts_from_v)
-        self.darts.extend(new_darts_to_v)
+        new_darts_to_v = [self._new_dart(d.origin) for d in triangle_darts]
         # mise à jour des alpha 0
         for i in range(3):
             Dart.set_twin_each_other(new_darts_from_v[i], new_darts_to_v[i])
@@ -268,146 +841,1005 @@ class Delaunay_Triangulation(Graph):
         return triangle_darts
 
     @staticmethod
-    def _flip_until_Del(dart: Dart) -> None:
-        """Réétablit récursivement la propriété de Delaunay après l'ajout d'un point."""
-        d_ab = dart
-        # les 2 darts qu'il faudra aussi checker si flip
-        d_aq = d_ab.rotate
-        d_qb = d_aq.next
-        triangle = d_ab.face
-        p = d_qb.origin
-        if p.is_in_circumcircle(triangle):
-            d_ab.flip()
-            Delaunay_Triangulation._flip_until_Del(d_aq)
-            Delaunay_Triangulation._flip_until_Del(d_qb)
+    def _flip_until_Del(dart: Dart, force: bool = False, flipped: Optional[list] = None) -> None:
+        """
+        Réétablit la propriété de Delaunay après l'ajout d'un point (force : flip du premier brin sans test).
+        Pile explicite et coordonnées des sommets : ni récursion ni objet géométrique par test.
+        Les arêtes flippées sont ajoutées à flipped si fourni.
+        """
+        incircle = geom.incircle_xy
+        in_infinite_face = geom.in_infinite_face_xy
+        stack = [dart]
+        while stack:
+            d_ab = stack.pop()
+            d_bp = d_ab.next
+            d_aq = d_ab.twin.next
+            a, b, p, q = d_ab.origin, d_bp.origin, d_bp.next.origin, d_aq.next.origin
+            # q est-il dans le cercle circonscrit de abp ? (cf. geom.Point.is_in_circumcircle)
+            if force:
+                conflict, force = True, False
+            elif p.w == 0: # le cercle d'une face infinie est le demi-plan de sa face
+                conflict = in_infinite_face(a.x, a.y, b.x, b.y, q.x, q.y)
+            elif a.w == 0:
+                conflict = in_infinite_face(b.x, b.y, p.x, p.y, q.x, q.y)
+            elif b.w == 0:
+                conflict = in_infinite_face(p.x, p.y, a.x, a.y, q.x, q.y)
+            elif q.w == 0:
+                conflict = False
+            else:
+                conflict = incircle(a.x, a.y, b.x, b.y, p.x, p.y, q.x, q.y) < 0
+            if conflict:
+                if flipped is not None:
+                    flipped.append((a, b))
+                d_qb = d_aq.next
+                d_ab.flip()
+                stack.append(d_qb) # aq est traité avant qb, comme dans la version récursive
+                stack.append(d_aq)
+
+    def remove_vertex(self, v: Vertex) -> None:
+        """
+        Supprime un sommet sans reconstruire la triangulation.
+        Le trou étoilé laissé par le sommet (ses faces incidentes) est retriangulé puis les arêtes
+        du trou sont flippées jusqu'à la propriété de Delaunay : O(deg(v)) en moyenne.
+        """
+        if v in self.aligned:  # point en attente, pas encore dans la triangulation
+            self._modified()
+            self.aligned.remove(v)
+            if not self.aligned: # plus de point en attente : les graphes de l'arête restante sont justes
+                self._notify()
+            else:
+                self._advance_subscribers()
+            return
+        if v is self.infinite or not 0 <= v.index < len(self.vertices) or self.vertices[v.index] is not v:
+            raise ValueError(f"{v} n'est pas un sommet de la triangulation")
+        self._modified()
+        if self.locator is not None:
+            self.locator.removed(v)
+        if len(self.vertices) <= 4: # il resterait moins de 3 sommets : on reconstruit
+            self._rebuild_without(v)
+            return
+        spokes = v.incident_darts
+        boundary = [d.next for d in spokes]  # bord du trou, dans le sens des faces
+        # ordonne le bord : le brin suivant part de la cible du précédent
+        polygon = [boundary[0]]
+        for _ in range(len(boundary) - 1):
+            polygon.append(polygon[-1].next.twin.next)
+        vertices = [d.origin for d in polygon]
+        if self.infinite in vertices: # sommet de l'enveloppe convexe
+            i = vertices.index(self.infinite)
+            polygon = polygon[i+1:] + polygon[:i+1] # le sommet infini en dernier
+            chain = [d.origin.coord for d in polygon[:-1]]
+            if len(chain) == len(self.vertices) - 2 and all(
+                    geom.orient2d(chain[0], chain[-1], p) == 0 for p in chain[1:-1]):
+                self._rebuild_without(v) # les sommets restants seraient tous alignés
+                return
+        removed = [(v, d.target) for d in spokes]
+        # libération des darts du sommet, recyclés pour les diagonales du trou
+        moved = []
+        for d in spokes:
+            for dart in (d, d.twin):
+                moved.append(self._free_dart(dart))
+        moved = [d for d in moved if d is not None and d.index >= 0]
+        for d in polygon:
+            d.origin.ref_dart = d
+        last = self.vertices.pop()
+        if last is not v:
+            self.vertices[v.index] = last
+            last.index = v.index
+        v.ref_dart = None # v.index garde l'indice qu'il occupait, pour les abonnés
+        diagonals = self._triangulate_hole(polygon, v)
+        # les oreilles choisies sont déjà de Delaunay dans le cas intérieur, les flips servent surtout sur l'enveloppe
+        Delaunay_Triangulation._flip_until_Del_all(diagonals)
+        if self.subscribers:
+            # les darts déplacés par la libération ont changé d'indice : leurs faces sont signalées aussi
+            touched = polygon + diagonals + [d.twin for d in diagonals] + moved
+            self._notify(Change(v, False, touched, removed))
+
+    def _rebuild_without(self, v: Vertex) -> None:
+        """Reconstruit la triangulation sans le sommet v (cas dégénérés de la suppression)."""
+        points = [u.coord for u in self.vertices[1:] + self.aligned if u is not v]
+        self.build(points)
+
+    def _triangulate_hole(self, polygon: List[Dart], v: Vertex) -> List[Dart]:
+        """
+        Triangule le polygone étoilé dont le bord est la liste de darts polygon, par ajout d'oreilles.
+        Sans sommet infini, on choisit l'oreille convexe dont le cercle circonscrit donne à v la plus grande
+        puissance (v est dans tous ces cercles) : c'est un triangle de Delaunay (Devillers). Avec le sommet infini
+        (placé en dernier), on construit l'enveloppe convexe de la chaîne finie comme un parcours de Graham,
+        puis les faces infinies en éventail. Renvoie les diagonales créées.
+        """
+        n = len(polygon)
+        out = list(polygon)  # out[i] : brin du bord partant du i-ème sommet
+        prev = [(i - 1) % n for i in range(n)]
+        nxt = [(i + 1) % n for i in range(n)]
+        alive = [True] * n
+        diagonals: List[Dart] = []
+
+        def clip(i: int) -> None:
+            """Découpe l'oreille (prev(i), i, next(i)), le brin prev(i) -> next(i) rejoint le bord."""
+            p, q = prev[i], nxt[i]
+            e1, e2 = out[p], out[i]
+            closing = self._new_dart(out[q].origin)
+            diagonal = self._new_dart(e1.origin)
+            Dart.set_twin_each_other(closing, diagonal)
+            Dart.set_next_each_other([e1, e2, closing])
+            out[p] = diagonal
+            nxt[p], prev[q] = q, p
+            alive[i] = False
+            diagonals.append(diagonal)
+
+        def coord(i: int) -> Tuple[float, float]:
+            return out[i].origin.coord
+
+        remaining = n
+        if polygon[-1].origin is self.infinite:
+            i_inf = n - 1
+            i = nxt[0]
+            while i != i_inf: # parcours de Graham de la chaîne finie
+                while prev[i] != 0 and geom.orient2d(coord(prev[prev[i]]), coord(prev[i]), coord(i)) < 0:
+                    clip(prev[i])
+                    remaining -= 1
+                i = nxt[i]
+            while remaining > 3: # faces infinies sur les nouvelles arêtes de l'enveloppe
+                clip(nxt[i_inf])
+                remaining -= 1
+        else:
+            heap = []
+            def push_ear(i: int) -> None:
+                a, b, c = coord(prev[i]), coord(i), coord(nxt[i])
+                orient = geom.orient2d(a, b, c)
+                if orient < 0: # oreille convexe
+                    power = -geom.incircle(a, b, c, v.coord) / orient
+                    heapq.heappush(heap, (-power, i, prev[i], nxt[i]))
+            for i in range(n):
+                push_ear(i)
+            while remaining > 3:
+                _, i, p, q = heapq.heappop(heap)
+                if not alive[i] or prev[i] != p or nxt[i] != q:
+                    continue # oreille périmée
+                clip(i)
+                remaining -= 1
+                push_ear(p)
+                push_ear(q)
+        # dernier triangle
+        i = alive.index(True)
+        Dart.set_next_each_other([out[prev[i]], out[i], out[nxt[i]]])
+        return diagonals
+
+    @staticmethod
+    def _flip_until_Del_all(darts: List[Dart]) -> None:
+        """Flippe les arêtes données et leurs voisines (pile explicite) jusqu'à la propriété de Delaunay."""
+        stack = list(darts)
+        while stack:
+            d_ab = stack.pop()
+            d_aq = d_ab.rotate
+            d_qb = d_aq.next
+            d_bp = d_ab.next
+            d_pa = d_bp.next
+            if d_aq.target_point.is_in_circumcircle(d_ab.face):
+                d_ab.flip()
+                stack.extend((d_aq, d_qb, d_bp, d_pa))
+
+#----------------------------------------------------Triangulation périodique (tore plat)
+class Periodic_Delaunay_Triangulation(Delaunay_Triangulation):
+    """
+    Triangulation de Delaunay du tore plat [0, period)², c'est-à-dire de l'ensemble périodique des points
+    du plan, vue modulo la période. Chaque point est stocké une seule fois (ramené dans le carré) et les
+    arêtes qui traversent le bord sont des Periodic_Dart portant la translation de leur sommet d'arrivée.
+    Il n'y a pas de sommet infini : vertices[0] est gardé, isolé, pour que les indices des sommets
+    soient les mêmes que dans le plan.
+    Tant qu'un cercle circonscrit a un rayon >= period / 4, une face peut toucher sa propre copie et
+    les flips ne sont pas sûrs : la triangulation est alors repliée à partir de celle des 9 copies
+    de ses points (_fold), ce qui n'arrive que pour quelques dizaines de points. Ensuite (fine),
+    les insertions sont locales : marche, découpe de la face et flips, comme dans le plan.
+    Une triangulation grossière peut avoir deux arêtes entre les mêmes sommets : Gabriel et RNG,
+    indexés par paire de sommets, n'en gardent alors qu'une.
+    """
+    dart_class = Periodic_Dart
+    SEED_SIZE = 64  # nombre de points de la première triangulation repliée de build
+
+    def __init__(self, period: float = 1.0):
+        super().__init__()
+        self.period = period
+        self.fine = False  # tous les rayons circonscrits < period / 4 : les insertions locales sont sûres
+
+    def reset(self) -> None:
+        period = self.period
+        super().reset()
+        self.period = period
+
+    def _wrap(self, p: geom.Point) -> Tuple[float, float]:
+        """Ramène un point dans le carré [0, period)²."""
+        L = self.period
+        x, y = p
+        x, y = x % L, y % L
+        return (0.0 if x == L else x, 0.0 if y == L else y) # -1e-20 % L vaut L en flottants
+
+    def build(self, points: List[geom.Point], brio: bool = False) -> None:
+        """
+        Construit la triangulation : les premiers points (un échantillon aléatoire avec brio) sont repliés
+        depuis leurs 9 copies, jusqu'à obtenir une triangulation fine, puis les autres sont insérés un à un.
+        """
+        self.reset()
+        wrapped = [self._wrap(p) for p in points]
+        points = list(dict.fromkeys(wrapped))
+        self.duplicates = len(wrapped) - len(points)
+        if brio:
+            points = spatial_sort.brio_order(points)
+        subscribers, self.subscribers = self.subscribers, []
+        k = min(len(points), self.SEED_SIZE)
+        self._fold(points[:k])
+        while not self.fine and k < len(points):
+            k = min(2 * k, len(points))
+            self._fold(points[:k])
+        for p in points[k:]:
+            self.insert_point(p, brio)
+        self.subscribers = subscribers
+        self._notify()
+
+    def build_parallel(self, points: List[geom.Point], workers: Optional[int] = None) -> None:
+        """Pas de découpe en bandes sur le tore : construction en série (build, ordre BRIO)."""
+        self.build(points, brio=True)
+
+    def insert_point(self, p: geom.Point, walk_from_last: bool = False) -> None:
+        """
+        Insère un point (ramené dans le carré) dans la triangulation.
+        walk_from_last : la marche part du dernier sommet inséré au lieu d'un dart aléatoire.
+        """
+        x, y = self._wrap(p)
+        if not self.fine: # triangulation grossière : on replie tout (peu de points)
+            points = [u.coord for u in self.vertices[1:]]
+            if (x, y) in points:
+                self.duplicates += 1
+                return
+            self._modified()
+            self._fold(points + [(x, y)])
+            self._notify()
+            return
+        v = Vertex(x, y, index=len(self.vertices))
+        self.vertices.append(v)
+        start = self.vertices[-2].ref_dart if walk_from_last else None
+        flipped = self._insert_in_Delaunay(v, start)
+        if flipped is None: # point double
+            return
+        self._modified()
+        if self.subscribers:
+            star = [d for spoke in v.incident_darts for d in spoke.cycle]
+            self._notify(Change(v, True, star, flipped))
+
+    def _insert_in_Delaunay(self, v: Vertex, start: Optional[Dart] = None) -> Optional[List[Tuple[Vertex, Vertex]]]:
+        """
+        Comme dans le plan : marche jusqu'à la face dont une copie contient v, découpe de cette face et flips.
+        Renvoie les arêtes supprimées par les flips, ou None si le point existait déjà.
+        """
+        x, y = v.x, v.y
+        dart, tx, ty = self._walk(x, y, start)
+        e, ex, ey = dart, tx, ty
+        for _ in range(3):
+            if (e.origin.x + ex, e.origin.y + ey) == (x, y):
+                self.vertices.pop()
+                self.duplicates += 1
+                return None
+            ex, ey, e = ex + e.sx, ey + e.sy, e.next
+        flipped: List[Tuple[Vertex, Vertex]] = []
+        for d in self._split(dart, tx, ty, v):
+            self._flip_until_Del(d, d.is_flat, flipped)
+        return flipped
+
+    def _walk(self, x: float, y: float, start: Optional[Dart] = None) -> Tuple[Dart, float, float]:
+        """
+        Marche de visibilité dans le plan périodique jusqu'à une face contenant (x, y), depuis start.
+        Renvoie un dart de cette face et la translation (tx, ty) de la copie de la face qui contient le point :
+        son origine y est en (origin.x + tx, origin.y + ty).
+        """
+        d = start if start is not None else random.choice(self.darts)
+        tx = ty = 0.0
+        walk_step = self._walk_step
+        while True:
+            crossing = walk_step(d, tx, ty, x, y)
+            if crossing is None: # le point est dans la face
+                return d, tx, ty
+            d, tx, ty = crossing
+
+    @staticmethod
+    def _walk_step(d: Dart, tx: float, ty: float, x: float, y: float) -> Optional[Tuple[Dart, float, float]]:
+        """
+        Un pas de la marche : renvoie None si (x, y) est dans la copie translatée de (tx, ty) de la face de d,
+        sinon le twin d'une arête dont il est strictement de l'autre côté, avec la translation de sa face.
+        Les deux arêtes de sortie possibles sont testées dans un ordre tiré au hasard : sur des points cocycliques
+        (grilles), une marche déterministe peut tourner sans fin entre faces d'un même cercle.
+        """
+        orient = geom.orient2d_xy
+        e, ex, ey = d, tx, ty
+        if random.random() < 0.5: # on commence par d.next.next au lieu de d.next
+            for _ in range(2):
+                ex, ey, e = ex + e.sx, ey + e.sy, e.next
+        for _ in range(3):
+            a, b = e.origin, e.next.origin
+            if orient(a.x + ex, a.y + ey, b.x + (ex + e.sx), b.y + (ey + e.sy), x, y) > 0:
+                return e.twin, ex + e.sx, ey + e.sy # le point est strictement de l'autre côté de e
+            ex, ey, e = ex + e.sx, ey + e.sy, e.next
+        return None
+
+    @staticmethod
+    def _flip_until_Del(dart: Dart, force: bool = False, flipped: Optional[list] = None) -> None:
+        """Comme dans le plan (pile explicite), le quadrilatère étant vu depuis a avec les translations des brins."""
+        incircle = geom.incircle_xy
+        stack = [dart]
+        while stack:
+            d_ab = stack.pop()
+            d_bp = d_ab.next
+            d_aq = d_ab.twin.next
+            a, b, p, q = d_ab.origin, d_bp.origin, d_bp.next.origin, d_aq.next.origin
+            b_x, b_y = b.x + d_ab.sx, b.y + d_ab.sy
+            if force or incircle(a.x, a.y, b_x, b_y, p.x + (d_ab.sx + d_bp.sx), p.y + (d_ab.sy + d_bp.sy),
+                                 q.x + d_aq.sx, q.y + d_aq.sy) < 0:
+                if flipped is not None:
+                    flipped.append((a, b))
+                d_qb = d_aq.next
+                d_ab.flip()
+                stack.append(d_qb)
+                stack.append(d_aq)
+            force = False
+
+    def locate(self, x: float, y: float, start: Optional[Dart] = None) -> Dart:
+        """Renvoie un dart de la face contenant le point (x, y) ramené dans le carré."""
+        x, y = self._wrap((x, y))
+        return self._walk(x, y, start)[0]
+
+    def _split(self, dart: Dart, tx: float, ty: float, v: Vertex) -> List[Dart]:
+        """Découpe en 3 la face de dart, dont la copie translatée de (tx, ty) contient v, et renvoie ses darts."""
+        frames = []
+        e = dart
+        for _ in range(3):
+            frames.append((tx, ty)) # translation de la copie de e.origin vue depuis v
+            tx, ty, e = tx + e.sx, ty + e.sy, e.next
+        triangle_darts = self._init_new_darts(dart, v)
+        for i, d in enumerate(triangle_darts):
+            to_v = triangle_darts[i - 1].next # de d.origin vers v
+            fx, fy = frames[i]
+            to_v.sx, to_v.sy = -fx, -fy
+            to_v.twin.sx, to_v.twin.sy = fx, fy
+        return triangle_darts
+
+    def remove_vertex(self, v: Vertex) -> None:
+        """Supprime un sommet en reconstruisant la triangulation (les graphes abonnés sont réextraits)."""
+        if v is self.infinite or not 0 <= v.index < len(self.vertices) or self.vertices[v.index] is not v:
+            raise ValueError(f"{v} n'est pas un sommet de la triangulation")
+        self._rebuild_without(v)
+
+    def _fold(self, points: List[Tuple[float, float]]) -> None:
+        """
+        Remplace la triangulation par celle des points donnés (dans le carré, sans doublons), repliée depuis
+        la triangulation plane de leurs 9 copies : l'étoile de chaque copie centrale donne les darts de son sommet.
+        L'étoile n'est juste que si les cercles circonscrits de ses faces restent dans la zone copiée :
+        sinon (trop peu de points), la triangulation reste sans darts jusqu'au prochain point.
+        Les copies translatées en flottants ne sont pas exactement superposables (x + period arrondi) : si leurs
+        étoiles ne se recollent pas, on recommence avec des copies exactes (entiers mis à l'échelle), plus lentes.
+        """
+        if not self._fold_copies(points, False):
+            self._fold_copies(points, True)
+
+    def _fold_copies(self, points: List[Tuple[float, float]], exact: bool) -> bool:
+        """
+        Repli de _fold, depuis des copies en flottants ou exactes (exact). Les points cocycliques sont
+        triangulés de la même façon dans toutes les copies (_break_ties). Renvoie False si les étoiles
+        des copies centrales ne se recollent pas (triangulation laissée sans darts).
+        """
+        L = self.period
+        self.vertices = [self.vertices[0]] + [Vertex(x, y, index=i + 1) for i, (x, y) in enumerate(points)]
+        self.darts, self.free_darts = [], []
+        self.fine = False
+        if exact: # les flottants sont des entiers sur une puissance de 2 : copies en entiers exacts, mis à l'échelle
+            scale = max(u.as_integer_ratio()[1] for p in points for u in p + (L,))
+            exact_int = lambda u: u.as_integer_ratio()[0] * (scale // u.as_integer_ratio()[1])
+            L = exact_int(L)
+        copies = []
+        copy_of = {}  # coordonnées d'une copie -> (indice du sommet, décalage en x, décalage en y)
+        for i, (x, y) in enumerate(points, 1):
+            if exact:
+                x, y = exact_int(x), exact_int(y)
+            for ox in (-1, 0, 1):
+                for oy in (-1, 0, 1):
+                    c = (x + ox * L, y + oy * L)
+                    copies.append(c)
+                    copy_of[c] = (i, ox, oy)
+        plane = Delaunay_Triangulation()
+        plane.build(copies, brio=True)
+        Periodic_Delaunay_Triangulation._break_ties(plane, copy_of)
+        try:
+            glued = self._glue_stars(plane, copy_of)
+        finally:
+            plane.release() # casse les cycles brins-sommets : rendue aussitôt, sans attendre le ramasse-miettes
+        if not glued:
+            return glued is None # None : étoile infinie, trop peu de points (recommencer ne servirait à rien)
+        L = self.period
+        max_r2 = 0.0
+        for dart in self.darts:
+            if dart.next.next.next is not dart:
+                self._unfold()
+                return False
+            a, b, c = dart.origin, dart.target_point, dart.apex
+            cx, cy = geom.circumcenter(a.coord, b.coord, c.coord)
+            r2 = geom.square_dist((cx, cy), a.coord)
+            r = sqrt(r2)
+            if cx - r < -L or cx + r > 2 * L or cy - r < -L or cy + r > 2 * L: # sort de la zone copiée
+                self._unfold()
+                return True
+            max_r2 = max(max_r2, r2)
+        self.fine = bool(self.darts) and 16 * max_r2 < L * L
+        return True
+
+    def _glue_stars(self, plane: Delaunay_Triangulation, copy_of: dict) -> Optional[bool]:
+        """
+        Crée les darts des sommets à partir des étoiles de leurs copies centrales dans plane, et les recolle.
+        Renvoie True si tout se recolle, False sinon, None si une étoile touche le sommet infini
+        (la triangulation est alors laissée sans darts).
+        """
+        L = self.period
+        darts_of = {}  # (i, j, ox, oy) -> dart de i vers la copie (ox, oy) de j
+        pairs = []
+        for u in plane.vertices[1:]:
+            i, ox, oy = copy_of[u.coord]
+            if ox or oy or u.ref_dart is None:
+                continue
+            for d in u.incident_darts:
+                if d.target.is_infinite: # cercle infini : trop peu de points
+                    self._unfold()
+                    return None
+                j, wx, wy = copy_of[d.target.coord]
+                dart = self._new_dart(self.vertices[i])
+                dart.sx, dart.sy = wx * L, wy * L
+                darts_of[(i, j, wx, wy)] = dart
+                pairs.append((dart, d))
+            self.vertices[i].ref_dart = pairs[-1][0]
+        if len(darts_of) != len(pairs) or any(v.ref_dart is None for v in self.vertices[1:]):
+            self._unfold()
+            return False
+        for dart, d in pairs:
+            j, wx, wy = copy_of[d.target.coord]
+            k, kx, ky = copy_of[d.next.target.coord]
+            dart.next = darts_of.get((j, k, kx - wx, ky - wy))
+            dart.twin = darts_of.get((j, dart.origin.index, -wx, -wy))
+            if dart.next is None or dart.twin is None:
+                self._unfold()
+                return False
+        return True
+
+    @staticmethod
+    def _break_ties(plane: Delaunay_Triangulation, copy_of: dict) -> None:
+        """
+        Flippe les arêtes des quadrilatères cocycliques de la triangulation plane des copies selon
+        geom.incircle_perturbed, les rangs étant (indice du sommet, décalage) : le choix ne dépend que des
+        décalages relatifs, c'est le même dans toutes les copies. La triangulation obtenue est l'unique
+        triangulation de Delaunay des points perturbés (Lawson).
+        """
+        stack = [d for d in plane.darts if d.index < d.twin.index] # une fois par arête
+        while stack:
+            d_ab = stack.pop()
+            d_ba = d_ab.twin
+            d_bp = d_ab.next
+            d_aq = d_ba.next
+            a, b, p, q = d_ab.origin, d_bp.origin, d_bp.next.origin, d_aq.next.origin
+            if a.w == 0 or b.w == 0 or p.w == 0 or q.w == 0 or d_ab.is_flat or d_ba.is_flat:
+                continue
+            ranks = (copy_of[a.coord], copy_of[b.coord], copy_of[p.coord], copy_of[q.coord])
+            if geom.incircle_perturbed(a.coord, b.coord, p.coord, q.coord, ranks) < 0:
+                d_qb, d_pa = d_aq.next, d_bp.next
+                d_ab.flip()
+                stack.extend((d_aq, d_qb, d_bp, d_pa))
+
+    def _unfold(self) -> None:
+        """Laisse les sommets sans darts (repli impossible)."""
+        self.darts, self.free_darts = [], []
+        for v in self.vertices:
+            v.ref_dart = None
 
 #-------------------------Diagramme de Voronoi-----------------------
 
 class Voronoi_Diagram(Graph):
     """
     Structure pour le diagramme de Voronoï.
+    Les centres des cercles circonscrits sont mis en cache par face : (centers[2*i], centers[2*i+1])
+    est le centre de la face du dart d'indice i (une direction si la face est infinie, infinite[i] vaut alors 1).
+    La cellule d'un sommet est la liste des indices des darts qui en partent, c'est-à-dire les indices
+    de ses sommets de Voronoï dans centers. cells est aligné sur les sommets de la triangulation.
+    Dans le tore, le centre est vu depuis l'origine du dart : les cellules sont d'un seul tenant.
     """
-    cells: List[geom.Cell]
+    triangulation: Optional[Delaunay_Triangulation]
+    centers: array
+    infinite: bytearray
+    cells: List[List[int]]
 
     def __init__(self):
-        self.cells: List[geom.Cell] = []
+        self.triangulation: Optional[Delaunay_Triangulation] = None
+        self.centers = array('d')
+        self.infinite = bytearray()
+        self.cells: List[List[int]] = []
 
     @property
     def edges(self) -> List[geom.Edge]:
-        """Renvoie la liste des arêtes des cellules du diagramme."""
+        """Renvoie la liste des arêtes des cellules du diagramme (construites à la demande pour l'affichage)."""
         edges: List[geom.Edge] = []
-        for cell in self.cells:
-            edges.extend(cell.edges)
+        if self.triangulation is None:
+            return edges
+        darts = self.triangulation.darts
+        for v1, cell in zip(self.triangulation.vertices, self.cells):
+            for k, i in enumerate(cell):
+                if darts[i].target.is_infinite:
+                    continue
+                v2 = darts[i].target_point
+                j = cell[k + 1] if k + 1 < len(cell) else cell[0]  # face suivante autour de v1
+                edges.append(geom.Edge(self.center(i), self.center(j), geom.Point.midpoint(v1, v2)))
         return edges
 
+    @property
+    def vertex_darts(self) -> array:
+        """
+        Renvoie les sommets de Voronoï finis, numérotés comme les noeuds de csr : le noeud k est
+        le centre center(vertex_darts[k]) de la face de ce dart (le plus petit indice de la face).
+        """
+        return self._number_faces()[1]
+
+    def csr(self, lengths: bool = False) -> Tuple[array, array, Optional[array]]:
+        """
+        Matrice d'adjacence CSR des arêtes finies du diagramme (cf. Graph) : les noeuds sont les sommets
+        de Voronoï finis, numérotés comme vertex_darts, reliés quand leurs faces ont une arête commune.
+        """
+        node, firsts = self._number_faces()
+        rows, cols = array('i'), array('i')
+        weights = array('d') if lengths else None
+        if self.cells: # diagramme extrait et non vide
+            centers = self.centers
+            for d in self.triangulation.darts:
+                i, j = d.index, d.twin.index
+                if node[i] < 0 or node[j] < 0:
+                    continue
+                rows.append(node[i])
+                cols.append(node[j])
+                if lengths: # centre de la face voisine vu depuis l'origine de d (translation de d dans le tore)
+                    weights.append(sqrt((centers[2*j] + d.sx - centers[2*i]) ** 2 +
+                                        (centers[2*j + 1] + d.sy - centers[2*i + 1]) ** 2))
+        return _csr(len(firsts), rows, cols, weights)
+
+    def _number_faces(self) -> Tuple[array, array]:
+        """Numérote les faces finies : noeud de chaque dart (-1 si sa face est infinie) et premier dart de chaque noeud."""
+        node = array('i', [-1]) * len(self.infinite)
+        firsts = array('i')
+        if not self.cells:
+            return node, firsts
+        for d in self.triangulation.darts:
+            if node[d.index] < 0 and not self.infinite[d.index]:
+                for e in (d, d.next, d.next.next):
+                    node[e.index] = len(firsts)
+                firsts.append(d.index)
+        return node, firsts
+
+    def center(self, i: int) -> geom.Point:
+        """Renvoie le sommet de Voronoï (centre de la face) du dart d'indice i."""
+        x, y = self.centers[2*i], self.centers[2*i + 1]
+        if self.infinite[i]:
+            return geom.Point(x, y, 0)
+        return geom.Point(x, y)
+
     def extract_from_Del(self, DT: Delaunay_Triangulation) -> None:
         """Détermine les cellules de Voronoï à partir d'une triangulation de Delaunay."""
         self.reset()
-        vertices = DT.vertices[1:]
-        if len(vertices) <= 1:
+        self.triangulation = DT # même vide, le diagramme est celui de DT (cf. Graph.is_current)
+        if len(DT.vertices) <= 2 or not DT.darts or DT.aligned: # points tous alignés : diagramme vide
             return
-        for v1 in vertices:  # pour chaque sommet fini
-            cell_edges: List[geom.Edge] = []
-            d = v1.incident_darts[0]
-            triangle = d.face
-            first_center = triangle.circumcenter
-            for d in v1.incident_darts:
-                v2 = d.target
-                next_d = d.rotate
-                next_triangle = next_d.face
-                second_center = next_triangle.circumcenter
-                new_edge = geom.Edge(first_center, second_center, geom.Point.midpoint(v1, v2))
-                first_center = second_center
-                if v2.is_infinite:
-                    continue
-                cell_edges.append(new_edge)
-            self.cells.append(geom.Cell(cell_edges))
+        n = len(DT.darts)
+        self.centers = array('d', bytes(16 * n))
+        self.infinite = bytearray(n)
+        self._compute_centers(DT.darts)
+        self.cells = [Voronoi_Diagram._cell(v) for v in DT.vertices]
+
+    def update(self, DT: Delaunay_Triangulation, change: Change) -> None:
+        """Ne recalcule que les centres des faces touchées et les cellules de leurs sommets."""
+        if self.triangulation is not DT or len(DT.vertices) <= 3 or not self.cells:
+            self.extract_from_Del(DT)
+            return
+        n = len(DT.darts)
+        if n > len(self.infinite): # les darts créés sont ajoutés en fin de liste
+            grow = n - len(self.infinite)
+            self.centers.frombytes(bytes(16 * grow))
+            self.infinite.extend(bytes(grow))
+        else:
+            del self.centers[2*n:]
+            del self.infinite[n:]
+        v = change.vertex
+        if change.inserted:
+            self.cells.append([])
+        else: # même échange que dans la liste des sommets
+            last = self.cells.pop()
+            if v.index < len(self.cells):
+                self.cells[v.index] = last
+        self._compute_centers(change.darts)
+        for d in change.darts:
+            u = d.origin
+            if not u.is_infinite:
+                self.cells[u.index] = Voronoi_Diagram._cell(u)
+
+    @staticmethod
+    def _cell(v: Vertex) -> List[int]:
+        """Renvoie la cellule du sommet v : les indices des darts issus de v, dans l'ordre de rotation."""
+        if v.is_infinite:
+            return []
+        return [d.index for d in v.incident_darts]
+
+    def _compute_centers(self, darts: List[Dart]) -> None:
+        """
+        Calcule le centre de chaque face des darts donnés, une seule fois par face,
+        directement sur les coordonnées (sans objets Triangle ni Point intermédiaires).
+        """
+        centers, infinite = self.centers, self.infinite
+        done = set()
+        for d in darts:
+            if d.index in done:
+                continue
+            d_b = d.next
+            d_c = d_b.next
+            done.update((d.index, d_b.index, d_c.index))
+            a, b, c = d.origin, d_b.origin, d_c.origin
+            if a.is_infinite or b.is_infinite or c.is_infinite:
+                while a.is_infinite or b.is_infinite: # le sommet infini en dernier
+                    a, b, c = b, c, a
+                # direction sortante, orthogonale à l'arête finie
+                dx, dy = b.x - a.x, b.y - a.y
+                norm = sqrt(dx * dx + dy * dy)
+                for i in (d.index, d_b.index, d_c.index):
+                    centers[2*i] = dy / norm
+                    centers[2*i + 1] = -dx / norm
+                    infinite[i] = 1
+                continue
+            # centre du cercle circonscrit, en coordonnées relatives à a (copies de b et c vues depuis a dans le tore)
+            bx, by = b.x + d.sx - a.x, b.y + d.sy - a.y
+            cx, cy = c.x + (d.sx + d_b.sx) - a.x, c.y + (d.sy + d_b.sy) - a.y
+            b2, c2 = bx * bx + by * by, cx * cx + cy * cy
+            den = 2 * (bx * cy - by * cx)
+            x, y = a.x + (cy * b2 - by * c2) / den, a.y + (bx * c2 - cx * b2) / den
+            # chaque dart voit le centre depuis son origine (translations sommées avant d'être retranchées)
+            sx = sy = 0.0
+            for e in (d, d_b, d_c):
+                i = e.index
+                centers[2*i] = x - sx
+                centers[2*i + 1] = y - sy
+                infinite[i] = 0
+                sx, sy = sx + e.sx, sy + e.sy
 
 #-------------------------Graphe de Gabriel-----------------------
 
 class Gabriel_Graph(Graph):
     """
     Graphe de Gabriel extrait d'une triangulation de Delaunay.
+    Abonné à la triangulation, il ne reteste que les arêtes dont une face voisine a changé :
+    un sommet inséré dans le cercle diamétral d'une arête est dans le cercle circonscrit d'une de ses faces.
     """
-    edges: List[geom.Edge]
+    triangulation: Optional[Delaunay_Triangulation]
+    edge_map: dict
 
     def __init__(self):
-        self.edges: List[geom.Edge] = []
+        self.triangulation: Optional[Delaunay_Triangulation] = None
+        self.edge_map: dict = {}  # clé de l'arête -> geom.Edge
+
+    @property
+    def edges(self) -> List[geom.Edge]:
+        """Renvoie la liste des arêtes du graphe."""
+        return list(self.edge_map.values())
+
+    def csr(self, lengths: bool = False) -> Tuple[array, array, Optional[array]]:
+        """Matrice d'adjacence CSR (cf. Graph), lue sur les brins de la triangulation dont l'arête est gardée."""
+        if self.triangulation is None:
+            return _csr(0, array('i'), array('i'), array('d') if lengths else None)
+        return _dart_csr(self.triangulation, lengths, self.edge_map)
+
+    @staticmethod
+    def is_Gabriel(d: Dart) -> bool:
+        """Teste si l'arête de Delaunay du brin d est de Gabriel (les sommets opposés sont hors du cercle diamétral)."""
+        # chaque sommet opposé est testé contre l'arête vue depuis le même brin (mêmes copies dans le tore)
+        return not(d.apex.is_in_Gab_circle(d.edge) or d.twin.apex.is_in_Gab_circle(d.twin.edge))
 
     def extract_from_Del(self, DT: Delaunay_Triangulation) -> None:
-        """Extrait le graphe de Gabriel à partir des arêtes de Delaunay."""
+        """Extrait le graphe de Gabriel à partir des arêtes de Delaunay (vide tant que les points sont alignés)."""
         self.reset()
+        self.triangulation = DT
+        if DT.aligned:
+            return
         for d in DT.unique_finite_darts:
-            edge = d.edge
-            p = d.next.target
-            q = d.twin.next.target             
-            if not(p.is_in_Gab_circle(edge) or q.is_in_Gab_circle(edge)):
-                self.edges.append(edge)
+            if Gabriel_Graph.is_Gabriel(d):
+                self.edge_map[edge_key(d.origin, d.target)] = d.edge
+
+    def update(self, DT: Delaunay_Triangulation, change: Change) -> None:
+        """Met à jour les arêtes touchées par une insertion ou une suppression, en O(deg)."""
+        self.triangulation = DT
+        for a, b in change.removed:
+            self.edge_map.pop(edge_key(a, b), None)
+        for d in change.darts:
+            a, b = d.origin, d.target
+            if a.is_infinite or b.is_infinite:
+                continue
+            key = edge_key(a, b)
+            if Gabriel_Graph.is_Gabriel(d):
+                if key not in self.edge_map:
+                    self.edge_map[key] = d.edge
+            else:
+                self.edge_map.pop(key, None)
 
 #-------------------------Relative neighbors graph-----------------------
 
 class Rel_Neighbor_Graph(Graph):
     """
     Graphe des voisins relatifs extrait d'une triangulation de Delaunay.
+    Une arête de Delaunay ab est gardée si sa lune (points plus proches de a et de b que |ab|) est vide.
+    Le test ne parcourt que les faces qui rencontrent la lune : linéaire en moyenne sur des points répartis,
+    O(n log n) avec la triangulation.
+    Abonné à la triangulation : seules changent les arêtes des faces modifiées et celles dont la lune
+    contient le sommet inséré ou supprimé v. Ces dernières sont atteintes depuis les faces modifiées
+    de proche en proche, en ne traversant que des arêtes dont la lune (fermée) contient v.
     """
-    edges: List[geom.Edge]
+    triangulation: Optional[Delaunay_Triangulation]
+    edge_map: dict
 
     def __init__(self):
-        self.edges: List[geom.Edge] = []
+        self.triangulation: Optional[Delaunay_Triangulation] = None
+        self.edge_map: dict = {}  # clé de l'arête -> geom.Edge
+
+    @property
+    def edges(self) -> List[geom.Edge]:
+        """Renvoie la liste des arêtes du graphe."""
+        return list(self.edge_map.values())
+
+    def csr(self, lengths: bool = False) -> Tuple[array, array, Optional[array]]:
+        """Matrice d'adjacence CSR (cf. Graph), lue sur les brins de la triangulation dont l'arête est gardée."""
+        if self.triangulation is None:
+            return _csr(0, array('i'), array('i'), array('d') if lengths else None)
+        return _dart_csr(self.triangulation, lengths, self.edge_map)
+
+    @staticmethod
+    def is_RNG(d: Dart) -> bool:
+        """
+        Teste si l'arête de Delaunay du brin d est une arête du RNG (lune vide).
+        Les deux sommets opposés sont testés d'abord (filtre d'Urquhart : l'arête la plus longue d'un triangle
+        n'est pas dans le RNG). On parcourt ensuite les faces qui rencontrent la lune, de proche en proche
+        depuis les deux faces de l'arête, en ne traversant que des arêtes qui rencontrent la lune.
+        La lune étant convexe, ces faces sont toutes atteintes, et un point dans la lune est sommet de l'une d'elles.
+        """
+        a = d.origin.coord
+        b = d.target_point.coord
+        # dans le tore, chaque face est parcourue avec la translation (tx, ty) de sa copie vue depuis a :
+        # l'origine du brin f y est en (f.origin.x + tx, f.origin.y + ty)
+        seen = set()
+        stack = []
+        def push(f: Dart, tx: float, ty: float) -> bool:
+            """Empile la face de f, renvoie False si son troisième sommet est dans la lune."""
+            for _ in range(3):
+                seen.add((id(f), tx, ty))
+                tx, ty, f = tx + f.sx, ty + f.sy, f.next
+            stack.append((f, tx, ty))
+            p = f.next.next.origin
+            if p.is_infinite:
+                return True
+            g = f.next
+            return not geom.in_RNG_Moon(a, b, (p.x + (tx + f.sx + g.sx), p.y + (ty + f.sy + g.sy)))
+        if not (push(d, 0.0, 0.0) and push(d.twin, d.sx, d.sy)):
+            return False
+        while stack:
+            f, tx, ty = stack.pop()
+            for _ in range(3):
+                x, y = f.origin, f.next.origin
+                gx, gy = tx + f.sx, ty + f.sy
+                g = f.twin
+                if not (x.is_infinite or y.is_infinite or (id(g), gx, gy) in seen) and \
+                        geom.segment_meets_RNG_Moon(a, b, (x.x + tx, x.y + ty), (y.x + gx, y.y + gy)):
+                    if not push(g, gx, gy):
+                        return False
+                tx, ty, f = gx, gy, f.next
+        return True
 
     def extract_from_Del(self, DT: Delaunay_Triangulation) -> None:
-        """Extrait le RNG à partir des arêtes de Delaunay."""
+        """Extrait le RNG à partir des arêtes de Delaunay (vide tant que les points sont alignés)."""
         self.reset()
+        self.triangulation = DT
+        if DT.aligned:
+            return
         for d in DT.unique_finite_darts:
-            edge = d.edge          
-            if Rel_Neighbor_Graph.empty_right_RNG_moon(d) and Rel_Neighbor_Graph.empty_right_RNG_moon(d.twin):
-                self.edges.append(edge)
+            if Rel_Neighbor_Graph.is_RNG(d):
+                self.edge_map[edge_key(d.origin, d.target)] = d.edge
+
+    def update(self, DT: Delaunay_Triangulation, change: Change) -> None:
+        """Met à jour les arêtes incidentes aux sommets des faces touchées par une insertion ou une suppression."""
+        self.triangulation = DT
+        for a, b in change.removed:
+            self.edge_map.pop(edge_key(a, b), None)
+        v = change.vertex
+        stack = []
+        for d in change.darts:
+            sx = sy = 0.0 # translation de la copie de v vue depuis l'origine de d (dans le tore)
+            if change.inserted: # d est une face de l'étoile de v
+                e = d
+                while e.origin is not v:
+                    sx, sy, e = sx + e.sx, sy + e.sy, e.next
+            stack.append((d, sx, sy))
+        tested, spread = set(), set()
+        while stack:
+            d, sx, sy = stack.pop()
+            a, b = d.origin, d.target
+            if a.is_infinite or b.is_infinite:
+                continue
+            key = edge_key(a, b)
+            if key not in tested:
+                tested.add(key)
+                if Rel_Neighbor_Graph.is_RNG(d):
+                    if key not in self.edge_map:
+                        self.edge_map[key] = d.edge
+                else:
+                    self.edge_map.pop(key, None)
+            if key not in spread and Rel_Neighbor_Graph._in_closed_moon((v.x + sx, v.y + sy), a.coord, d.target_point.coord):
+                spread.add(key) # v peut aussi être dans la lune des arêtes voisines
+                d1, t1 = d.next, d.twin.next
+                stack.append((t1, sx, sy))
+                stack.append((t1.next, sx - t1.sx, sy - t1.sy))
+                stack.append((d1, sx - d.sx, sy - d.sy))
+                stack.append((d1.next, sx - (d.sx + d1.sx), sy - (d.sy + d1.sy)))
 
     @staticmethod
-    def empty_right_RNG_moon(dart: Dart) -> bool:
-        """Teste si la lune RNG à droite de l'arête est vide."""
-        edge = dart.edge
-        a, b = edge.vertices
-        m = geom.Point((a.x + b.x) / 2, (a.y + b.y) / 2)
-        t_x = m.x + (b.y - a.y)
-        t_y = m.y - (b.x - a.x)
-        t = geom.Point(t_x, t_y)
-        segment = geom.Edge(m, t)                      
-        triangle = dart.face
-        # On marche de triangle en triangle en suivant l'axe (mt) et testant le sommet p du triangle jusqu'atteindre t
-        # Si on atteint t, les circumcircles des triangles recouvrent (je crois....) Right-RNG-Moon qui est donc vide 
-        while not t.is_in_triangle(triangle):
-            p = dart.next.target
-            if p.is_in_RNG_moon(edge):
-                return False
-            dart = Delaunay_Triangulation._find_crossing_dart(dart, segment)
-            triangle = dart.face
-        return True
-    
+    def _in_closed_moon(p: Tuple[float, float], a: Tuple[float, float], b: Tuple[float, float]) -> bool:
+        """Teste si p est dans la lune fermée de l'arête ab."""
+        length = geom.square_dist(a, b)
+        return geom.square_dist(p, a) <= length and geom.square_dist(p, b) <= length
+
 #-------------------------Minimal spanning tree-----------------------
 
 class Minimal_Spanning_Tree(Graph):
     """
     Arbre couvrant minimal extrait d'une triangulation de Delaunay.
+    L'arbre est un tableau d'indices de sommets (ceux de la triangulation) : l'arête k est
+    (tree[2*k], tree[2*k + 1]), soit un tableau (n-1, 2) aplati, vu en 2D par index_array.
+    Les geom.Edge ne sont construits qu'à la demande (edges). Dans le tore, shifts donne pour chaque arête
+    la translation (shifts[2*k], shifts[2*k + 1]) de la copie de son second sommet.
+    Abonné à la triangulation, il est mis à jour à chaque insertion en O(deg log n) :
+    MST(S + v) est l'arbre couvrant minimal de MST(S) plus les arêtes de Delaunay incidentes à v.
+    La forêt est alors maintenue par des arbres link-cut (max sur un chemin). Une suppression réextrait tout.
     """
-    edges: List[geom.Edge]
+    triangulation: Optional[Delaunay_Triangulation]
+    tree: array
+    shifts: array
+    positions: dict
+    nodes: Optional[List[lc.Node]]
 
     def __init__(self):
-        self.edges: List[geom.Edge] = []
+        self.triangulation: Optional[Delaunay_Triangulation] = None
+        self.tree = array('i')
+        self.shifts = array('d')
+        self.positions: dict = {}  # (i, j) avec i < j -> rang de l'arête dans tree
+        self.nodes: Optional[List[lc.Node]] = None  # noeuds link-cut des sommets, créés à la première mise à jour
+
+    def reset(self) -> None:
+        """Vide l'arbre en cassant les cycles de la forêt link-cut, qui serait sinon perdue une fois gelée (cf. worker)."""
+        if self.nodes is not None:
+            lc.release(self.nodes)
+        super().reset()
+
+    @property
+    def index_array(self) -> memoryview:
+        """Renvoie l'arbre vu comme un tableau d'indices de forme (n-1, 2), sans copie."""
+        return memoryview(self.tree).cast('B').cast('i', [len(self.tree) // 2, 2]) if self.tree else memoryview(self.tree)
+
+    @property
+    def edges(self) -> List[geom.Edge]:
+        """Renvoie la liste des arêtes du graphe (construites à la demande)."""
+        if self.triangulation is None:
+            return []
+        vertices, tree, shifts = self.triangulation.vertices, self.tree, self.shifts
+        edges = []
+        for k in range(0, len(tree), 2):
+            a, b = vertices[tree[k]], vertices[tree[k + 1]]
+            if shifts[k] or shifts[k + 1]:
+                b = geom.Point(b.x + shifts[k], b.y + shifts[k + 1])
+            edges.append(geom.Edge(a, b))
+        return edges
+
+    def csr(self, lengths: bool = False) -> Tuple[array, array, Optional[array]]:
+        """Matrice d'adjacence CSR de l'arbre (cf. Graph), lue sur le tableau tree."""
+        n = len(self.triangulation.vertices) if self.triangulation is not None else 0
+        tree, shifts = self.tree, self.shifts
+        rows = tree[0::2] + tree[1::2]
+        cols = tree[1::2] + tree[0::2]
+        weights = array('d') if lengths else None
+        if lengths and tree:
+            vertices = self.triangulation.vertices
+            weights = array('d', [sqrt((vertices[tree[k + 1]].x + shifts[k] - vertices[tree[k]].x) ** 2 +
+                                       (vertices[tree[k + 1]].y + shifts[k + 1] - vertices[tree[k]].y) ** 2)
+                                  for k in range(0, len(tree), 2)])
+            weights += weights # même longueur dans les deux sens
+        return _csr(n, rows, cols, weights)
 
     def extract_from_Del(self, DT: Delaunay_Triangulation) -> None:
-        """Extrait l'arbre couvrant minimal à partir des arêtes de Delaunay. """
+        """Extrait l'arbre couvrant minimal à partir des arêtes de Delaunay (Kruskal), vide tant que les points sont alignés."""
         self.reset()
-        edges = DT.edges
-        edges.sort(key = lambda edge: edge.square_length)
+        self.triangulation = DT
+        if DT.aligned:
+            return
+        darts = DT.unique_finite_darts
+        lengths = array('d', [d.square_length for d in darts])
+        # un seul tri des indices par longueur, la clé étant lue directement dans le tableau
+        order = sorted(range(len(lengths)), key=lengths.__getitem__)
+        sets = uf.Union_Find(len(DT.vertices))
+        for k in order:
+            d = darts[k]
+            i, j = d.origin.index, d.next.origin.index
+            if sets.union(i, j):
+                self._add(i, j, d.sx, d.sy)
+
+    def update(self, DT: Delaunay_Triangulation, change: Change) -> None:
+        """Ajoute le sommet inséré : chaque arête incidente remplace l'arête la plus longue du cycle qu'elle ferme."""
+        if not change.inserted or self.triangulation is not DT:
+            self.extract_from_Del(DT)
+            return
+        v = change.vertex
+        if self.nodes is None:
+            self._build_forest() # v y a déjà son noeud, isolé
+        else:
+            self.nodes.append(lc.Node())
+        node_v = self.nodes[v.index]
+        spokes = [(d.square_length, d.target.index, d.sx, d.sy)
+                  for d in v.incident_darts if not d.target.is_infinite]
+        spokes.sort()
+        for length, u, sx, sy in spokes:
+            node_u = self.nodes[u]
+            if lc.connected(node_v, node_u):
+                heaviest = lc.path_max(node_v, node_u)
+                if heaviest.weight <= length:
+                    continue
+                self._cut(heaviest)
+            self._link(v.index, u, length, sx, sy)
+
+    def _add(self, i: int, j: int, sx: float = 0.0, sy: float = 0.0) -> None:
+        """Ajoute l'arête ij (j translaté de (sx, sy)) au tableau de l'arbre."""
+        self.positions[(i, j) if i < j else (j, i)] = len(self.tree) // 2
+        self.tree.append(i)
+        self.tree.append(j)
+        self.shifts.append(sx)
+        self.shifts.append(sy)
+
+    def _remove(self, i: int, j: int) -> None:
+        """Retire l'arête ij du tableau de l'arbre en O(1) : la dernière arête prend sa place."""
+        k = self.positions.pop((i, j) if i < j else (j, i))
+        last_i, last_j = self.tree[-2], self.tree[-1]
+        last_sx, last_sy = self.shifts[-2], self.shifts[-1]
+        del self.tree[-2:]
+        del self.shifts[-2:]
+        if 2 * k < len(self.tree):
+            self.tree[2*k], self.tree[2*k + 1] = last_i, last_j
+            self.shifts[2*k], self.shifts[2*k + 1] = last_sx, last_sy
+            self.positions[(last_i, last_j) if last_i < last_j else (last_j, last_i)] = k
+
+    def _build_forest(self) -> None:
+        """Crée la forêt link-cut de l'arbre courant (arêtes = noeuds pesant leur longueur au carré)."""
+        vertices, tree, shifts = self.triangulation.vertices, self.tree, self.shifts
+        self.nodes = [lc.Node() for _ in vertices]
+        for k in range(0, len(tree), 2):
+            i, j = tree[k], tree[k + 1]
+            a, b = vertices[i], vertices[j]
+            self._link_nodes(i, j, (b.x + shifts[k] - a.x) ** 2 + (b.y + shifts[k + 1] - a.y) ** 2)
+
+    def _link(self, i: int, j: int, length: float, sx: float = 0.0, sy: float = 0.0) -> None:
+        """Ajoute l'arête ij à l'arbre et à la forêt link-cut."""
+        self._add(i, j, sx, sy)
+        self._link_nodes(i, j, length)
 
-        for v in DT.vertices:
-            uf.make_set(v)
+    def _link_nodes(self, i: int, j: int, length: float) -> None:
+        node_e = lc.Node(length, (i, j))
+        lc.link(node_e, self.nodes[i])
+        lc.link(self.nodes[j], node_e)
 
-        for edge in edges:
-            a, b = edge.vertices
-            if uf.union(a, b):
-                self.edges.append(edge)
+    def _cut(self, node_e: lc.Node) -> None:
+        """Retire de l'arbre l'arête portée par le noeud node_e."""
+        i, j = node_e.payload
+        self._remove(i, j)
+        lc.cut(self.nodes[i], node_e)
+        lc.cut(node_e, self.nodes[j])
+        lc.release((node_e,)) # isolé : seul son cycle max_node = node_e reste à casser
 
 if __name__ == "__main__":
     # Exemple de liste de points
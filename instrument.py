@@ -0,0 +1,185 @@
+"""
+Instrumentation optionnelle de l'insertion dans Delaunay_Triangulation.
+
+Dans un bloc `with instrumented(cls) as report:`, les méthodes du noyau d'insertion de la classe de
+triangulation cls (Delaunay_Triangulation par défaut, ou Periodic_Delaunay_Triangulation : ses propres
+versions de la marche, des flips et de l'insertion sont instrumentées) et les prédicats de geom sont remplacés
+par des versions qui comptent et chronomètrent, puis remis en place à la sortie du bloc.
+Hors du bloc, rien n'est modifié : aucun test ni compteur ne reste dans les boucles (coût nul).
+Le remplacement se fait sur la classe (et sa classe de brins) et sur le module geom : il vaut pour toutes
+les triangulations de cette classe pendant le bloc, y compris celles construites par d'autres threads
+(cf. worker), et tous les appels aux prédicats sont comptés. Les blocs sont donc exclusifs : un verrou
+fait attendre un bloc tant qu'un autre est ouvert, dans n'importe quel thread.
+
+Le rapport compte :
+    - les insertions et les pas de marche (faces traversées par segment_walk_to)
+    - les appels aux prédicats d'orientation et de cercle
+    - les flips, par insertion, et la plus longue cascade de flips partie d'une seule arête (_flip_until_Del)
+et chronomètre les phases : localisation, découpe de la face, flips, mise à jour des graphes abonnés.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+import geom
+from graphs import Delaunay_Triangulation
+
+PHASES = ("locate", "split", "flip", "notify")
+LOCATE_METHODS = ("segment_walk_to", "_walk")  # marche de l'insertion, dans le plan et dans le tore
+STEP_METHODS = ("_find_crossing_dart", "_walk_step")  # un pas de marche (une face), renvoie None à l'arrivée
+
+_lock = threading.Lock()  # un seul bloc instrumenté à la fois (les remplacements sont globaux)
+
+@dataclass
+class Build_Report:
+    """Compteurs et temps (en secondes) relevés pendant un bloc instrumenté."""
+    inserts: int = 0
+    walk_steps: int = 0
+    orient_calls: int = 0
+    incircle_calls: int = 0
+    flips: int = 0
+    max_flip_cascade: int = 0
+    flips_per_insert: List[int] = field(default_factory=list)
+    phases: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    total_s: float = 0.0
+
+    def as_dict(self) -> dict:
+        """Rapport exportable (JSON) : les compteurs, les phases et des moyennes par insertion."""
+        per_insert = max(1, self.inserts)
+        return {
+            "inserts": self.inserts,
+            "walk_steps": self.walk_steps,
+            "orient_calls": self.orient_calls,
+            "incircle_calls": self.incircle_calls,
+            "flips": self.flips,
+            "max_flip_cascade": self.max_flip_cascade,
+            "max_flips_per_insert": max(self.flips_per_insert, default=0),
+            "walk_steps_per_insert": self.walk_steps / per_insert,
+            "flips_per_insert": self.flips / per_insert,
+            "phases_s": dict(self.phases),
+            "total_s": self.total_s,
+        }
+
+    def __str__(self) -> str:
+        d = self.as_dict()
+        lines = [
+            f"insertions : {d['inserts']} en {d['total_s']:.3f} s",
+            f"pas de marche : {d['walk_steps']} ({d['walk_steps_per_insert']:.1f} par insertion)",
+            f"prédicats : {d['orient_calls']} orientations, {d['incircle_calls']} cercles",
+            f"flips : {d['flips']} ({d['flips_per_insert']:.2f} par insertion, max {d['max_flips_per_insert']}), "
+            f"cascade max {d['max_flip_cascade']}",
+        ]
+        for phase, seconds in self.phases.items():
+            lines.append(f"  {phase:7s} {seconds:.3f} s")
+        return "\n".join(lines)
+
+class instrumented:
+    """Bloc with pendant lequel le noyau d'insertion de la classe cls est instrumenté, renvoie le Build_Report rempli."""
+
+    def __init__(self, cls: type = Delaunay_Triangulation):
+        self.cls = cls
+        self.report = Build_Report()
+        self._saved: List[tuple] = []
+
+    def _patch(self, owner: object, name: str, wrapper: Callable, static: bool = False) -> None:
+        """Remplace owner.name, éventuellement hérité : il sera alors supprimé, et non réécrit, à la sortie."""
+        own = not isinstance(owner, type) or name in owner.__dict__
+        original = (owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)) if own else None
+        self._saved.append((owner, name, own, original))
+        setattr(owner, name, staticmethod(wrapper) if static else wrapper)
+
+    def _timed(self, function: Callable, phase: str) -> Callable:
+        phases = self.report.phases
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                phases[phase] += time.perf_counter() - start
+        return wrapper
+
+    def __enter__(self) -> Build_Report:
+        _lock.acquire()
+        report = self.report
+        DT = self.cls
+
+        # prédicats : les versions sur tuples délèguent aux versions _xy, appelées par leur nom dans geom
+        orient2d_xy, incircle_xy = geom.orient2d_xy, geom.incircle_xy
+        def count_orient2d(*args):
+            report.orient_calls += 1
+            return orient2d_xy(*args)
+        def count_incircle(*args):
+            report.incircle_calls += 1
+            return incircle_xy(*args)
+        self._patch(geom, "orient2d_xy", count_orient2d)
+        self._patch(geom, "incircle_xy", count_incircle)
+
+        # marche : le pas est appelé une fois par face, et renvoie None dans la dernière
+        for name in STEP_METHODS:
+            if hasattr(DT, name):
+                self._patch(DT, name, self._count_steps(getattr(DT, name)), static=True)
+        for name in LOCATE_METHODS:
+            if hasattr(DT, name):
+                self._patch(DT, name, self._timed(getattr(DT, name), "locate"))
+        self._patch(DT, "_init_new_darts", self._timed(DT._init_new_darts, "split"))
+        self._patch(DT, "_notify", self._timed(DT._notify, "notify"))
+
+        # flips : chaque appel de _flip_until_Del vide sa pile, la cascade partie d'une arête
+        flip_until_Del = DT._flip_until_Del
+        def flip_until(dart, force=False, flipped=None):
+            flips = report.flips
+            start = time.perf_counter()
+            try:
+                return flip_until_Del(dart, force, flipped)
+            finally:
+                report.phases["flip"] += time.perf_counter() - start
+                report.max_flip_cascade = max(report.max_flip_cascade, report.flips - flips)
+        self._patch(DT, "_flip_until_Del", flip_until, static=True)
+        flip = DT.dart_class.flip
+        def count_flip(dart):
+            report.flips += 1
+            return flip(dart)
+        self._patch(DT.dart_class, "flip", count_flip)
+
+        insert_in_Delaunay = DT._insert_in_Delaunay
+        def count_insert(triangulation, v, start=None):
+            flips = report.flips
+            result = insert_in_Delaunay(triangulation, v, start)
+            report.inserts += 1
+            report.flips_per_insert.append(report.flips - flips)
+            return result
+        self._patch(DT, "_insert_in_Delaunay", count_insert)
+
+        self._start = time.perf_counter()
+        return report
+
+    def _count_steps(self, step: Callable) -> Callable:
+        report = self.report
+        def count_step(*args):
+            crossing = step(*args)
+            if crossing is not None:
+                report.walk_steps += 1
+            return crossing
+        return count_step
+
+    def __exit__(self, *exc) -> None:
+        self.report.total_s += time.perf_counter() - self._start
+        for owner, name, own, original in reversed(self._saved):
+            if own:
+                setattr(owner, name, original)
+            else:
+                delattr(owner, name)
+        self._saved = []
+        _lock.release()
+
+
+if __name__ == "__main__":
+    import random
+    points = [(random.random(), random.random()) for _ in range(10000)]
+    DT = Delaunay_Triangulation()
+    for brio in (False, True):
+        with instrumented() as report:
+            DT.build(points, brio)
+        print("brio" if brio else "ordre donné", "\n" + str(report) + "\n")
@@ -1,10 +1,24 @@
 """
 Module d'affichage graphique pour la visualisation des graphes et de la triangulation.
 Utilise pygame pour dessiner points, arêtes, boutons et menus.
+
+Le rendu des graphes passe par des calques (Layer) : chaque graphe est dessiné une fois dans sa propre
+surface transparente, qui n'est redessinée que lorsque la triangulation ou le graphe a changé.
+Une image n'est alors qu'une composition des calques visibles, en temps indépendant du nombre de points.
+Le dessin lui-même est groupé : les arêtes sont mises bout à bout en lignes brisées (une seule commande
+pygame.draw.lines par ligne), les points sont copiés d'un seul appel à blits.
+
+Pour les grands maillages, les primitives d'un calque sont rangées dans un index spatial (Grid_Index) :
+seules celles de la vue courante (zoom, déplacement) sont dessinées, et quand elles sont trop nombreuses
+(vue éloignée), chaque case de l'index n'en dessine qu'une part, le coût d'un rendu restant borné.
 """
 
 import pygame
-from typing import Tuple, List, Any
+from array import array
+from math import isqrt
+from typing import Callable, Dict, Tuple, List, Any
+
+View = Tuple[float, float, float]  # (x0, y0, zoom) : le point (x, y) est affiché en ((x - x0) * zoom, (y - y0) * zoom)
 
 #------------------------------------Définitions des couleurs
 
@@ -82,46 +96,245 @@ def draw_menu_line(surface: pygame.Surface, x_pos: int, size: int) -> None:
     pygame.draw.line(surface, GRAY, (x_pos, 0), (x_pos, h)) # ligne grise verticale
 
 def draw_points(surface: Any, points: List[Tuple[float, float]], color, size , scale: int) -> None:
-    """Dessine une liste de points sur la surface pygame."""
-    for p in points:
-        x, y = p
-        pygame.draw.circle(surface, color, (x*scale, y*scale), size*scale) 
+    """Dessine une liste de points sur la surface pygame (un disque dessiné une fois, copié en un seul appel)."""
+    r = size*scale
+    disc = pygame.Surface((2*r + 1, 2*r + 1), pygame.SRCALPHA)
+    pygame.draw.circle(disc, color, (r, r), r)
+    surface.blits([(disc, (x*scale - r, y*scale - r)) for x, y in points], False)
 
-def draw_edges(surface: pygame.Surface, graph, color, size: int, scale: int, max: int = 0) -> None:
-    """Dessine les arêtes d'un graphe sur la surface pygame."""
+def segments(graph, max: int = 0, period: float = 0) -> array:
+    """
+    Renvoie les extrémités des arêtes du graphe à dessiner, à la suite (ax, ay, bx, by) dans un tableau.
+    Les arêtes infinies sont ramenées à la distance max. period : pour le tore plat, les arêtes qui sortent
+    du carré [0, period)² sont aussi ajoutées translatées d'une période, là où elles y rentrent.
+    """
+    coords = array('d')
     for edge in graph.edges:
         if edge.is_infinite:
             edge = edge.desinfinite(max)
         a, b = edge.vertices
         ax, ay = a.coord
         bx, by = b.coord
-        pygame.draw.line(surface, color, (ax*scale, ay*scale), (bx*scale, by*scale), size*scale)
-
-
-#----------------------Pour représenter le tore plat------------
-
-def create_copies(points: List[Tuple[float, float]], width: int) -> List[Tuple[float, float]]:
-    """Crée des copies translatées des points pour simuler un tore plat."""
-    # crée 3 copies de la liste de points autour de l'écran
-    # w est la largueur de l'écran
-    copies = []
-    h_width = width // 2
-    for p in points: # faire une fonction
-        px, py = p
-        if px < h_width and py < h_width:
-            copies.append((px + width, py))
-            copies.append((px, py + width))
-            copies.append((px + width, py + width))
-        if px < h_width and py >= h_width:
-            copies.append((px + width, py))
-            copies.append((px, py - width))
-            copies.append((px + width, py - width))
-        if px >= h_width and py < h_width:
-            copies.append((px - width, py))
-            copies.append((px, py + width))
-            copies.append((px - width, py + width))
-        if px >= h_width and py >= h_width:
-            copies.append((px - width, py))
-            copies.append((px, py - width))
-            copies.append((px - width, py - width))
-    return(copies)
+        coords.extend((ax, ay, bx, by))
+        if period:
+            x_lo, x_hi = (ax, bx) if ax < bx else (bx, ax)
+            y_lo, y_hi = (ay, by) if ay < by else (by, ay)
+            xs = [dx for dx in (-period, period) if x_lo + dx < period and x_hi + dx > 0]
+            ys = [dy for dy in (-period, period) if y_lo + dy < period and y_hi + dy > 0]
+            for dx, dy in [(dx, 0) for dx in xs] + [(0, dy) for dy in ys] + [(dx, dy) for dx in xs for dy in ys]:
+                coords.extend((ax + dx, ay + dy, bx + dx, by + dy))
+    return coords
+
+def polylines(coords: array, scale: int = 1) -> List[List[Tuple[float, float]]]:
+    """
+    Met bout à bout les segments (tableau de segments) en lignes brisées, chaque segment servant une fois
+    (les doublons, comme les arêtes de Voronoï vues des deux cellules, sont écartés) : on part d'un segment libre
+    et on le prolonge aux deux bouts tant qu'un segment libre y touche (extrémités de mêmes coordonnées).
+    Pour une triangulation, il y a environ dix fois moins de lignes que d'arêtes.
+    """
+    ends: Dict[Tuple[float, float], List[int]] = {}  # extrémité -> segments qui y touchent
+    used = bytearray(len(coords) // 4)
+    seen = set()
+    for k in range(len(used)):
+        a, b = (coords[4*k], coords[4*k + 1]), (coords[4*k + 2], coords[4*k + 3])
+        key = (a, b) if a < b else (b, a)
+        if key in seen:
+            used[k] = 1
+            continue
+        seen.add(key)
+        ends.setdefault(a, []).append(k)
+        ends.setdefault(b, []).append(k)
+
+    def extend(p: Tuple[float, float], line: List[Tuple[float, float]]) -> None:
+        while True:
+            touching = ends[p]
+            while touching and used[touching[-1]]:
+                touching.pop()
+            if not touching:
+                return
+            k = touching.pop()
+            used[k] = 1
+            a = (coords[4*k], coords[4*k + 1])
+            p = (coords[4*k + 2], coords[4*k + 3]) if a == p else a
+            line.append(p)
+
+    lines = []
+    for k in range(len(used)):
+        if used[k]:
+            continue
+        used[k] = 1
+        a, b = (coords[4*k], coords[4*k + 1]), (coords[4*k + 2], coords[4*k + 3])
+        back, line = [a], [b]
+        extend(a, back)
+        extend(b, line)
+        lines.append([(x*scale, y*scale) for x, y in back[::-1] + line])
+    return lines
+
+def draw_polylines(surface: pygame.Surface, lines: List[List[Tuple[float, float]]], color, size: int, scale: int) -> None:
+    """Dessine des lignes brisées (cf. polylines), une commande pygame par ligne."""
+    for line in lines:
+        pygame.draw.lines(surface, color, False, line, size*scale)
+
+def draw_edges(surface: pygame.Surface, graph, color, size: int, scale: int, max: int = 0, period: float = 0) -> None:
+    """
+    Dessine les arêtes d'un graphe sur la surface pygame.
+    period : pour le tore plat, les arêtes qui sortent du carré [0, period)² sont aussi dessinées
+    translatées d'une période, là où elles y rentrent.
+    """
+    draw_polylines(surface, polylines(segments(graph, max, period), scale), color, size, scale)
+
+#---------------------------------Index spatial et calques------------------------------
+
+class Grid_Index:
+    """
+    Index spatial des primitives d'un calque, données comme des segments (tableau ax, ay, bx, by à la suite,
+    cf. segments ; un point est un segment de longueur nulle) : grille uniforme de side × side cases
+    sur leur boîte englobante, visant LOAD segments par case. Chaque case garde, mis bout à bout
+    en lignes brisées (polylines), les segments dont le milieu y tombe, ainsi que ses points.
+    Un segment plus long qu'une case (arête infinie du diagramme de Voronoï...) est gardé à part et testé seul :
+    les autres débordent de leur case d'au plus une demi-case, il suffit donc d'élargir la vue d'une case.
+    L'index ne contient que des coordonnées : il peut être construit dans un autre thread (cf. worker).
+    """
+    LOAD = 32  # segments par case visés
+
+    def __init__(self, coords: array):
+        n = len(coords) // 4
+        self.side = side = max(1, isqrt(n // self.LOAD))
+        xs, ys = coords[0::2], coords[1::2]
+        self.x_min, self.y_min = (min(xs), min(ys)) if n else (0.0, 0.0)
+        self.cell_w = ((max(xs) - self.x_min) if n else 0.0) / side or 1.0
+        self.cell_h = ((max(ys) - self.y_min) if n else 0.0) / side or 1.0
+        buckets = [array('d') for _ in range(side * side)]
+        self.long = array('d')  # segments plus longs qu'une case
+        for k in range(0, len(coords), 4):
+            ax, ay, bx, by = coords[k], coords[k + 1], coords[k + 2], coords[k + 3]
+            if abs(bx - ax) > self.cell_w or abs(by - ay) > self.cell_h:
+                self.long.extend((ax, ay, bx, by))
+                continue
+            buckets[self._cell((ax + bx) / 2, (ay + by) / 2)].extend((ax, ay, bx, by))
+        self.lines: List[List[List[Tuple[float, float]]]] = []  # par case, ses lignes brisées
+        self.points: List[List[Tuple[float, float]]] = []  # par case, ses points
+        self.counts = array('i')  # par case, son nombre de segments et de points
+        for bucket in buckets:
+            edges, points = array('d'), []
+            for k in range(0, len(bucket), 4):
+                if bucket[k] == bucket[k + 2] and bucket[k + 1] == bucket[k + 3]:
+                    points.append((bucket[k], bucket[k + 1]))
+                else:
+                    edges.extend(bucket[k:k + 4])
+            self.lines.append(polylines(edges))
+            self.points.append(points)
+            self.counts.append(len(bucket) // 4)
+
+    def _cell(self, x: float, y: float) -> int:
+        """Indice de la case de (x, y), ramenée dans la grille."""
+        side = self.side
+        i = min(side - 1, max(0, int((x - self.x_min) / self.cell_w)))
+        j = min(side - 1, max(0, int((y - self.y_min) / self.cell_h)))
+        return j * side + i
+
+    def draw(self, surface: pygame.Surface, view: View, color, size: int, scale: int, budget: int) -> int:
+        """
+        Dessine dans surface (scale fois plus grande que la vue) les primitives de la vue, traits de largeur size
+        et points de rayon size. Au-delà de budget primitives dans la vue, chaque case n'en dessine qu'une part
+        proportionnelle (décimation uniforme, par lignes brisées entières). Renvoie le nombre de primitives dessinées.
+        """
+        x0, y0, zoom = view
+        z = zoom * scale
+        w, h = surface.get_size()
+        side = self.side
+        i0 = max(0, int((x0 - self.x_min) / self.cell_w) - 1)
+        i1 = min(side - 1, int((x0 + w / z - self.x_min) / self.cell_w) + 1)
+        j0 = max(0, int((y0 - self.y_min) / self.cell_h) - 1)
+        j1 = min(side - 1, int((y0 + h / z - self.y_min) / self.cell_h) + 1)
+        cells = [j * side + i for j in range(j0, j1 + 1) for i in range(i0, i1 + 1)]
+        total = sum(self.counts[c] for c in cells)
+        share = min(1.0, budget / total) if total else 1.0
+        width = size * scale
+        disc = pygame.Surface((2*width + 1, 2*width + 1), pygame.SRCALPHA)
+        pygame.draw.circle(disc, color, (width, width), width)
+        draw_lines = pygame.draw.lines
+        drawn, quota = 0, 0.0  # quota : primitives encore à dessiner, reporté d'une case à l'autre
+        for c in cells:
+            quota += self.counts[c] * share
+            for line in self.lines[c]:
+                if quota < 1:
+                    break
+                draw_lines(surface, color, False, [((x - x0) * z, (y - y0) * z) for x, y in line], width)
+                quota -= len(line) - 1
+                drawn += len(line) - 1
+            points = self.points[c]
+            if points and quota >= 1:
+                m = min(len(points), int(quota))
+                surface.blits([(disc, ((x - x0) * z - width, (y - y0) * z - width)) for x, y in points[:m]], False)
+                quota -= m
+                drawn += m
+        long, x1, y1 = self.long, x0 + w / z, y0 + h / z
+        for k in range(0, len(long), 4):
+            ax, ay, bx, by = long[k], long[k + 1], long[k + 2], long[k + 3]
+            if min(ax, bx) <= x1 and max(ax, bx) >= x0 and min(ay, by) <= y1 and max(ay, by) >= y0:
+                pygame.draw.line(surface, color, ((ax - x0) * z, (ay - y0) * z), ((bx - x0) * z, (by - y0) * z), width)
+                drawn += 1
+        return drawn
+
+class Layer:
+    """
+    Calque d'un graphe : ses primitives, calculées par source(triangulation) (segments, cf. Grid_Index),
+    rangées dans un Grid_Index et dessinées dans une surface transparente de taille size.
+    Le calque s'abonne à la triangulation comme un graphe (DT.subscribe(layer)) : chaque modification
+    le marque dirty, l'index est alors à refaire par build_index (qui ne modifie rien, et peut donc tourner
+    dans le worker) puis set_index, avec le numéro revision lu avant le calcul : un index calculé pendant
+    une modification reste affiché, mais le calque reste dirty. La surface n'est redessinée que si l'index, la vue ou la qualité ont changé :
+    une surface scale fois plus grande, réduite avec lissage, pour une image nette à l'arrêt, scale = 1 en mouvement.
+    """
+    def __init__(self, size: Tuple[int, int], color, width: int, source: Callable[[Any], array]):
+        self.size = size
+        self.color = pygame.Color(color)
+        self.width = width
+        self.source = source
+        self.triangulation = None
+        self.version = -1  # version de la triangulation vue (tenue par la triangulation, comme pour un graphe)
+        self.index = None
+        self.dirty = True
+        self.revision = 0  # nombre de modifications du calque
+        self._surface = None
+        self._key = None  # (index, vue, échelle, budget) de la surface dessinée
+
+    def invalidate(self) -> None:
+        self.dirty = True
+        self.revision += 1
+
+    # interface d'abonné de la triangulation
+    def reset(self) -> None:
+        self.invalidate()
+
+    def extract_from_Del(self, DT) -> None:
+        self.triangulation = DT
+        self.invalidate()
+
+    def update(self, DT, change) -> None:
+        self.triangulation = DT
+        self.invalidate()
+
+    def build_index(self) -> Grid_Index:
+        """Index des primitives de la triangulation (et de ses graphes) telle qu'elle est."""
+        return Grid_Index(self.source(self.triangulation) if self.triangulation is not None else array('d'))
+
+    def set_index(self, index: Grid_Index, revision: int) -> None:
+        """Installe un index calculé quand le calque en était à revision."""
+        self.index = index
+        self.dirty = revision != self.revision
+
+    def surface(self, view: View, scale: int = 1, budget: int = 50000) -> pygame.Surface:
+        """Surface du calque pour la vue, redessinée seulement si l'index, la vue, l'échelle ou le budget ont changé."""
+        key = (self.index, view, scale, budget)
+        if self._surface is None or key != self._key:
+            w, h = self.size
+            big = pygame.Surface((w*scale, h*scale), pygame.SRCALPHA)
+            # fond transparent de la couleur du calque : le lissage ne fonce pas les bords des traits
+            big.fill((self.color.r, self.color.g, self.color.b, 0))
+            if self.index is not None:
+                self.index.draw(big, view, self.color, self.width, scale, budget)
+            self._surface = pygame.transform.smoothscale(big, self.size) if scale > 1 else big
+            self._key = key
+        return self._surface
@@ -0,0 +1,158 @@
+"""
+Arbres link-cut (Sleator-Tarjan) pour maintenir une forêt dynamique.
+
+Chaque noeud porte un poids ; on sait en O(log n) amorti relier deux arbres (link),
+couper une arête (cut), tester si deux noeuds sont dans le même arbre (connected)
+et trouver le noeud de poids maximal sur le chemin entre deux noeuds (path_max).
+Utilisé par l'arbre couvrant minimal incrémental : les arêtes y sont des noeuds à part entière,
+pesant leur longueur, et les sommets pèsent -1.
+"""
+
+from typing import Any, Iterable, Optional
+
+class Node:
+    """Noeud d'un arbre link-cut (noeud d'un arbre splay représentant un chemin préféré)."""
+    __slots__ = ("left", "right", "parent", "rev", "weight", "max_node", "payload")
+
+    def __init__(self, weight: float = -1, payload: Any = None):
+        self.left: Optional["Node"] = None
+        self.right: Optional["Node"] = None
+        self.parent: Optional["Node"] = None  # père dans l'arbre splay ou path-parent
+        self.rev = False  # inversion paresseuse du sous-arbre (pour make_root)
+        self.weight = weight
+        self.max_node = self  # noeud de poids max du sous-arbre splay
+        self.payload = payload
+
+def _is_splay_root(x: Node) -> bool:
+    p = x.parent
+    return p is None or (p.left is not x and p.right is not x)
+
+def _update(x: Node) -> None:
+    m = x
+    if x.left is not None and x.left.max_node.weight > m.weight:
+        m = x.left.max_node
+    if x.right is not None and x.right.max_node.weight > m.weight:
+        m = x.right.max_node
+    x.max_node = m
+
+def _push(x: Node) -> None:
+    if x.rev:
+        x.left, x.right = x.right, x.left
+        if x.left is not None:
+            x.left.rev = not x.left.rev
+        if x.right is not None:
+            x.right.rev = not x.right.rev
+        x.rev = False
+
+def _rotate(x: Node) -> None:
+    p = x.parent
+    g = p.parent
+    if not _is_splay_root(p):
+        if g.left is p:
+            g.left = x
+        else:
+            g.right = x
+    x.parent = g
+    if p.left is x:
+        p.left = x.right
+        if x.right is not None:
+            x.right.parent = p
+        x.right = p
+    else:
+        p.right = x.left
+        if x.left is not None:
+            x.left.parent = p
+        x.left = p
+    p.parent = x
+    _update(p)
+    _update(x)
+
+def _splay(x: Node) -> None:
+    # on propage d'abord les inversions depuis la racine splay (pile explicite, pas de récursion)
+    path = [x]
+    while not _is_splay_root(path[-1]):
+        path.append(path[-1].parent)
+    for y in reversed(path):
+        _push(y)
+    while not _is_splay_root(x):
+        p = x.parent
+        if not _is_splay_root(p):
+            g = p.parent
+            if (g.left is p) == (p.left is x):
+                _rotate(p) # zig-zig
+            else:
+                _rotate(x) # zig-zag
+        _rotate(x)
+
+def _access(x: Node) -> None:
+    """Rend préféré le chemin de la racine à x ; x devient la racine de son arbre splay."""
+    last = None
+    y = x
+    while y is not None:
+        _splay(y)
+        y.right = last
+        _update(y)
+        last = y
+        y = y.parent
+    _splay(x)
+
+def make_root(x: Node) -> None:
+    """Fait de x la racine de son arbre."""
+    _access(x)
+    x.rev = not x.rev
+
+def find_root(x: Node) -> Node:
+    """Renvoie la racine de l'arbre contenant x."""
+    _access(x)
+    _push(x)
+    while x.left is not None:
+        x = x.left
+        _push(x)
+    _splay(x)
+    return x
+
+def connected(x: Node, y: Node) -> bool:
+    """Teste si x et y sont dans le même arbre."""
+    return x is y or find_root(x) is find_root(y)
+
+def link(x: Node, y: Node) -> None:
+    """Relie x et y, qui doivent être dans deux arbres différents."""
+    make_root(x)
+    x.parent = y
+
+def cut(x: Node, y: Node) -> None:
+    """Coupe l'arête entre x et y, qui doivent être voisins."""
+    make_root(x)
+    _access(y)
+    # x est maintenant le fils gauche de y, seul noeud avant y sur le chemin
+    y.left.parent = None
+    y.left = None
+    _update(y)
+
+def path_max(x: Node, y: Node) -> Node:
+    """Renvoie le noeud de poids maximal sur le chemin de x à y (même arbre)."""
+    make_root(x)
+    _access(y)
+    return y.max_node
+
+def release(nodes: Iterable[Node]) -> None:
+    """
+    Casse les cycles de références (max_node, pères et fils) des noeuds donnés et de tous ceux de leurs arbres,
+    pour que le comptage de références libère la forêt sans passage du ramasse-miettes (cf. worker).
+    """
+    stack = list(nodes)
+    while stack:
+        x = stack.pop()
+        stack.extend(u for u in (x.parent, x.left, x.right) if u is not None)
+        x.parent = x.left = x.right = x.max_node = None
+
+
+if __name__ == "__main__":
+    # chemin a - e1 - b - e2 - c, puis on remplace l'arête la plus lourde
+    a, b, c = Node(), Node(), Node()
+    e1, e2 = Node(1.0, "ab"), Node(3.0, "bc")
+    link(e1, a); link(b, e1)
+    link(e2, b); link(c, e2)
+    print(connected(a, c), path_max(a, c).payload)  # True bc
+    cut(b, e2); cut(e2, c)
+    print(connected(a, c))  # False
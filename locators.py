@@ -0,0 +1,228 @@
+"""
+Localisateurs : ils fournissent à Delaunay_Triangulation le dart de départ de la marche d'une insertion.
+
+Sans localisateur, la marche part d'un dart aléatoire et fait O(√n) pas. Un localisateur se branche par
+DT.set_locator(...) (None pour revenir au départ aléatoire) et doit fournir :
+    - start(x, y) : un dart proche du point (x, y), ou None
+    - inserted(v), removed(v) : appelés à chaque sommet inséré ou supprimé de la triangulation
+    - rebuild(DT) : reconstruction complète, après une construction en bloc (build) ou un reset
+
+Les classes sont :
+    - Locator : classe de base (départ aléatoire)
+    - Delaunay_Hierarchy : hiérarchie de Delaunay (Devillers), O(log n) pas en moyenne par insertion
+    - Grid_Locator : grille uniforme de cases retenant chacune un sommet récent, O(1) pas pour des points uniformes
+
+Le localisateur sert aussi aux requêtes de plus proche sommet (Delaunay_Triangulation.nearest_vertex).
+"""
+
+import random
+from math import ceil, sqrt
+from typing import Dict, List, Optional, Tuple
+
+from graphs import Dart, Delaunay_Triangulation, Vertex
+
+class Locator:
+    """Localisateur de base : pas d'indication, la marche part d'un dart aléatoire."""
+
+    def rebuild(self, DT: Delaunay_Triangulation) -> None:
+        pass
+
+    def start(self, x: float, y: float) -> Optional[Dart]:
+        return None
+
+    def inserted(self, v: Vertex) -> None:
+        pass
+
+    def removed(self, v: Vertex) -> None:
+        pass
+
+class Delaunay_Hierarchy(Locator):
+    """
+    Hiérarchie de Delaunay : level est la triangulation d'un échantillon aléatoire d'environ 1/ratio
+    des sommets de la triangulation localisée, et a elle-même pour localisateur une hiérarchie
+    (jusqu'à depth niveaux). Un point est localisé dans le niveau le plus grossier, puis on redescend
+    niveau par niveau en repartant du sommet de la face trouvée le plus proche du point :
+    chaque niveau ne coûte qu'un nombre constant de pas en moyenne, soit O(log n) pour la localisation,
+    quel que soit l'ordre d'insertion. Chaque sommet inséré est promu au niveau supérieur avec une
+    probabilité 1/ratio, la mémoire supplémentaire est donc d'environ n / (ratio - 1) sommets.
+    """
+    RATIO = 30
+    DEPTH = 5  # 30^5 ≈ 24 millions de points
+
+    def __init__(self, ratio: int = RATIO, depth: int = DEPTH, rng: random.Random = random):
+        self.ratio = ratio
+        self.rng = rng
+        self.level = Delaunay_Triangulation()
+        if depth > 1:
+            self.level.locator = Delaunay_Hierarchy(ratio, depth - 1, rng)
+        self.promoted: Dict[Tuple[float, float], Vertex] = {}  # coordonnées -> sommet du niveau inférieur
+
+    @property
+    def depth(self) -> int:
+        """Nombre de niveaux non vides au-dessus de la triangulation localisée."""
+        if len(self.level.vertices) <= 1:
+            return 0
+        above = self.level.locator
+        return 1 + (above.depth if above is not None else 0)
+
+    def rebuild(self, DT: Delaunay_Triangulation) -> None:
+        """Tire un nouvel échantillon des sommets de DT et reconstruit les niveaux."""
+        self.promoted = {(v.x, v.y): v for v in DT.vertices[1:] if self.rng.random() * self.ratio < 1}
+        self.level.build(list(self.promoted), brio=True) # reconstruit aussi les niveaux supérieurs
+
+    def start(self, x: float, y: float) -> Optional[Dart]:
+        """Localise (x, y) dans le niveau, puis renvoie le dart de référence du sommet correspondant, en dessous."""
+        level = self.level
+        if not level.darts:
+            return None
+        above = level.locator
+        d = level.locate(x, y, above.start(x, y) if above is not None else None)
+        nearest, best = None, float("inf")
+        for _ in range(3): # sommet fini de la face le plus proche du point
+            u = d.origin
+            if u is not level.infinite:
+                d2 = (u.x - x) ** 2 + (u.y - y) ** 2
+                if d2 < best:
+                    nearest, best = u, d2
+            d = d.next
+        below = self.promoted.get((nearest.x, nearest.y))
+        return below.ref_dart if below is not None else None
+
+    def inserted(self, v: Vertex) -> None:
+        """Promeut le sommet au niveau supérieur avec une probabilité 1/ratio (qui le promeut à son tour...)."""
+        if self.rng.random() * self.ratio < 1:
+            self.promoted[(v.x, v.y)] = v
+            self.level.insert_point((v.x, v.y))
+
+    def removed(self, v: Vertex) -> None:
+        """Retire le sommet du niveau (et des niveaux supérieurs) s'il avait été promu."""
+        if self.promoted.pop((v.x, v.y), None) is None:
+            return
+        level = self.level
+        if level.darts:
+            above = level.locator
+            d = level.locate(v.x, v.y, above.start(v.x, v.y) if above is not None else None)
+            candidates = [d.origin, d.next.origin, d.next.next.origin]
+        else: # moins de trois sommets dans le niveau
+            candidates = level.vertices[1:]
+        for u in candidates + level.aligned: # le point peut aussi être en attente dans le niveau
+            if u is not level.infinite and (u.x, u.y) == (v.x, v.y):
+                level.remove_vertex(u)
+                return
+
+class Grid_Locator(Locator):
+    """
+    Grille uniforme sur la boîte englobante des sommets : chaque case retient le dernier sommet inséré
+    qui y tombe (ou, s'il est supprimé, un de ses voisins), et la marche part du dart de référence
+    du sommet de la case du point. Les points hors de la boîte sont ramenés dans la case du bord la plus proche.
+    La grille vise LOAD sommets par case : elle est reconstruite, avec deux fois plus de cases par côté,
+    quand le nombre de sommets a quadruplé (O(1) amorti par insertion), ou plus tôt si beaucoup de points
+    tombent hors de la boîte. Plus simple et plus légère que la hiérarchie, mais faite pour des données
+    à peu près uniformes : sur des amas, la plupart des cases restent vides.
+    """
+    LOAD = 2  # nombre moyen de sommets par case visé
+    RING = 2  # rayon (en cases) de la recherche autour d'une case vide
+
+    def __init__(self):
+        self.DT: Optional[Delaunay_Triangulation] = None
+        self.side = 0
+        self.cells: List[Optional[Vertex]] = []
+        self.count = 0  # sommets de la triangulation
+        self.outside = 0  # insertions hors de la boîte depuis la dernière reconstruction
+        self.x_min = self.y_min = 0.0
+        self.scale_x = self.scale_y = 1.0  # cases par unité de longueur
+        self.last: Optional[Vertex] = None  # dernier sommet inséré, pour les cases vides
+
+    def rebuild(self, DT: Delaunay_Triangulation) -> None:
+        """Recalcule la boîte et la taille de la grille à partir des sommets de DT."""
+        self.DT = DT
+        vertices = DT.vertices[1:]
+        self.count, self.outside = len(vertices), 0
+        self.side = side = max(1, ceil(sqrt(len(vertices) / self.LOAD)))
+        if vertices:
+            xs = [v.x for v in vertices]
+            ys = [v.y for v in vertices]
+            self.x_min, self.y_min = min(xs), min(ys)
+            self.scale_x = side / ((max(xs) - self.x_min) or 1.0)
+            self.scale_y = side / ((max(ys) - self.y_min) or 1.0)
+        self.cells = [None] * (side * side)
+        for v in vertices:
+            self.cells[self._cell(v.x, v.y)] = v
+        self.last = vertices[-1] if vertices else None
+
+    def _cell(self, x: float, y: float) -> int:
+        """Indice de la case de (x, y), ramenée dans la grille."""
+        side = self.side
+        i = int((x - self.x_min) * self.scale_x)
+        j = int((y - self.y_min) * self.scale_y)
+        i = 0 if i < 0 else side - 1 if i >= side else i
+        j = 0 if j < 0 else side - 1 if j >= side else j
+        return j * side + i
+
+    def _in_box(self, x: float, y: float) -> bool:
+        return 0 <= (x - self.x_min) * self.scale_x <= self.side and 0 <= (y - self.y_min) * self.scale_y <= self.side
+
+    def nearby(self, x: float, y: float) -> Optional[Vertex]:
+        """Sommet retenu par la case de (x, y), ou à défaut par une case proche, ou le dernier inséré."""
+        if not self.cells:
+            return None
+        c = self._cell(x, y)
+        v = self.cells[c]
+        if v is not None:
+            return v
+        side = self.side
+        i, j = c % side, c // side
+        for r in range(1, self.RING + 1): # cases à distance r (norme infinie) de la case vide
+            for jj in range(max(0, j - r), min(side, j + r + 1)):
+                step = 1 if jj in (j - r, j + r) else 2 * r
+                for ii in range(i - r, i + r + 1, step):
+                    if 0 <= ii < side:
+                        v = self.cells[jj * side + ii]
+                        if v is not None:
+                            return v
+        return self.last
+
+    def start(self, x: float, y: float) -> Optional[Dart]:
+        v = self.nearby(x, y)
+        return v.ref_dart if v is not None else None
+
+    def inserted(self, v: Vertex) -> None:
+        if self.DT is None:
+            return
+        self.count += 1
+        self.last = v
+        if not self._in_box(v.x, v.y):
+            self.outside += 1
+        if self.count > 4 * self.LOAD * self.side * self.side or 4 * self.outside > self.count:
+            self.rebuild(self.DT)
+        else:
+            self.cells[self._cell(v.x, v.y)] = v
+
+    def removed(self, v: Vertex) -> None:
+        if self.DT is None:
+            return
+        self.count -= 1
+        # v est encore dans la triangulation : un de ses voisins le remplace dans sa case
+        neighbor = None
+        if v.ref_dart is not None:
+            for d in v.incident_darts:
+                if d.next.origin is not self.DT.infinite:
+                    neighbor = d.next.origin
+                    break
+        c = self._cell(v.x, v.y)
+        if self.cells[c] is v:
+            self.cells[c] = neighbor
+        if self.last is v:
+            self.last = neighbor
+
+if __name__ == "__main__":
+    import time
+    n = 100000
+    points = [(random.random(), random.random()) for _ in range(n)]
+    for name, locator in (("départ aléatoire", None), ("hiérarchie", Delaunay_Hierarchy()), ("grille", Grid_Locator())):
+        DT = Delaunay_Triangulation()
+        DT.set_locator(locator)
+        start = time.perf_counter()
+        for p in points: # insertions une à une, dans un ordre quelconque
+            DT.insert_point(p)
+        print(f"{name} : {n} insertions en {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,205 @@
+"""
+Construction parallèle de la triangulation de Delaunay (Delaunay_Triangulation.build_parallel).
+
+Les points sont répartis en bandes verticales de tailles égales, triangulées chacune dans un processus
+(multiprocessing). Un processus renvoie, dans des tableaux d'indices (array), les faces finales de sa bande,
+celles dont le disque circonscrit reste dans la bande (il ne peut contenir aucun point d'une autre bande :
+ce sont des faces de la triangulation de l'ensemble des points), leurs brins déjà appariés sauf ceux
+des arêtes de bord (qui les séparent des faces non finales), et les sommets en attente, ceux d'une face non finale.
+
+Le recollement retriangule en série les seuls sommets en attente, peu nombreux (quelques rangées de points
+le long des bords des bandes, plus l'enveloppe convexe), et garde de cette triangulation les faces
+hors de la zone finale : on part des faces infinies et des faces collées aux arêtes de bord,
+sans jamais traverser une arête de bord. Ces arêtes sont strictement de Delaunay, elles sont donc dans
+la triangulation des sommets en attente quelle qu'elle soit. Reste à créer les brins, à partir des tableaux.
+
+Le résultat a les mêmes faces que build quand il n'y a pas quatre points cocycliques ; sinon c'est
+une triangulation de Delaunay qui peut choisir d'autres diagonales dans les polygones cocycliques (comme build
+avec un autre ordre d'insertion). Si le recollement échoue (aucune face finale, ou brins sans jumeau),
+on revient à build.
+"""
+
+import gc
+import multiprocessing
+import os
+import random
+from array import array
+from bisect import bisect_right
+from math import inf, sqrt
+from typing import List, Optional, Tuple
+
+import geom
+from graphs import Delaunay_Triangulation, Vertex
+
+MIN_POINTS = 20000  # points par processus en dessous desquels la construction reste en série
+SAMPLE = 1000  # points tirés par bande pour choisir les coupures
+
+def build_parallel(DT: Delaunay_Triangulation, points: List[geom.Point], workers: Optional[int] = None) -> None:
+    """Construit DT sur les points avec workers processus (cf. Delaunay_Triangulation.build_parallel)."""
+    workers = workers or os.cpu_count() or 1
+    coords = list(dict.fromkeys((x, y) for x, y in points)) # sans doublons, dans l'ordre des points
+    _build_strips(DT, coords, workers)
+    DT.duplicates = len(points) - len(coords)
+
+def _build_strips(DT: Delaunay_Triangulation, coords: List[Tuple[float, float]], workers: int) -> None:
+    """Triangule des points sans doublons par bandes verticales recousues, ou en série s'ils s'y prêtent mal."""
+    if workers < 2 or len(coords) < MIN_POINTS * workers:
+        DT.build(coords, brio=True)
+        return
+    # coupures aux quantiles en x d'un échantillon : bande k = [cuts[k - 1], cuts[k])
+    sample = sorted(x for x, _ in random.sample(coords, min(len(coords), SAMPLE * workers)))
+    cuts = sorted(set(sample[len(sample) * k // workers] for k in range(1, workers)))
+    bounds = [-inf] + cuts + [inf]
+    strips = [(array('d'), array('l')) for _ in range(len(cuts) + 1)]
+    for i, (x, y) in enumerate(coords, 1): # indice i du sommet dans DT.vertices
+        xy, ids = strips[bisect_right(cuts, x)]
+        xy.append(x)
+        xy.append(y)
+        ids.append(i)
+    tasks = [(bounds[k], bounds[k + 1], xy, ids) for k, (xy, ids) in enumerate(strips) if ids]
+    if len(tasks) < 2: # toutes les abscisses (ou presque) égales : une seule bande
+        DT.build(coords, brio=True)
+        return
+    with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+        results = pool.map(_triangulate_strip, tasks)
+    if not _stitch(DT, coords, results):
+        DT.build(coords, brio=True)
+
+def _triangulate_strip(task: Tuple[float, float, array, array]) -> Tuple[array, array, array, array]:
+    """
+    Triangule une bande (dans un processus) et renvoie, dans des tableaux :
+    les origines des brins des faces finales (3 brins par face, en indices des sommets de la triangulation
+    finale), l'indice du jumeau de chaque brin parmi eux (-1 si le jumeau est dans une face non finale),
+    les brins de bord (ceux dont le jumeau est dans une face non finale) et les sommets en attente.
+    """
+    x_lo, x_hi, xy, ids = task
+    points = [(xy[2 * k], xy[2 * k + 1]) for k in range(len(ids))]
+    id_of = dict(zip(points, ids))
+    strip = Delaunay_Triangulation()
+    strip.build(points, brio=True)
+    inf_v = strip.infinite
+    final, twins, boundary, pending = array('l'), array('l'), array('l'), array('l')
+    status = bytearray(len(strip.darts))  # par brin : 1 face finale, 2 face non finale
+    for d in strip.darts:
+        if status[d.index]:
+            continue
+        d1, d2 = d.next, d.next.next
+        a, b, c = d.origin, d1.origin, d2.origin
+        is_final = False
+        if inf_v is not a and inf_v is not b and inf_v is not c:
+            # centre du cercle circonscrit, calculé relativement à a pour limiter les erreurs d'arrondi
+            bx, by, qx, qy = b.x - a.x, b.y - a.y, c.x - a.x, c.y - a.y
+            det = 2 * (bx * qy - by * qx)
+            if det:
+                ux = (qy * (bx * bx + by * by) - by * (qx * qx + qy * qy)) / det
+                uy = (bx * (qx * qx + qy * qy) - qx * (bx * bx + by * by)) / det
+                r, cx = sqrt(ux * ux + uy * uy), a.x + ux
+                margin = 1e-6 * r + 1e-12 * abs(cx)
+                is_final = x_lo < cx - r - margin and cx + r + margin < x_hi
+        status[d.index] = status[d1.index] = status[d2.index] = 1 if is_final else 2
+    # brins des faces finales, renumérotés de 0 à 3 * (nombre de faces finales) - 1, face par face
+    local = array('l', [-1]) * len(strip.darts)
+    ordered = []
+    for d in strip.darts:
+        if status[d.index] == 1 and local[d.index] < 0:
+            for e in (d, d.next, d.next.next):
+                local[e.index] = len(ordered)
+                ordered.append(e)
+                final.append(id_of[(e.origin.x, e.origin.y)])
+        elif status[d.index] == 2 and d.origin is not inf_v:
+            pending.append(id_of[(d.origin.x, d.origin.y)])
+    for d in ordered:
+        twins.append(local[d.twin.index])
+    for k, t in enumerate(twins):
+        if t < 0:  # jumeau dans une face non finale
+            boundary.append(k)
+    for u in strip.vertices[1:] + strip.aligned: # bande sans face : tous ses points restent en attente
+        if u.ref_dart is None:
+            pending.append(id_of[(u.x, u.y)])
+    return final, twins, boundary, array('l', set(pending))
+
+def _stitch(DT: Delaunay_Triangulation, coords: List[Tuple[float, float]],
+            results: List[Tuple[array, array, array, array]]) -> bool:
+    """
+    Assemble dans DT les faces finales des bandes et les faces de la triangulation des sommets en attente
+    hors de la zone finale. Renvoie False si l'assemblage est impossible (DT est alors à reconstruire).
+    """
+    if not any(final for final, _, _, _ in results):
+        return False
+    # faces finales à la suite : brin k d'origine faces[k], de jumeau twins[k] (-1 pour une arête de bord)
+    faces, twins = array('l'), array('l')
+    border = {}  # arête de bord (a, b), orientée comme dans sa face finale -> brin de a vers b
+    for final, strip_twins, boundary, _ in results:
+        offset = len(faces)
+        faces.extend(final)
+        twins.extend(array('l', [t + offset if t >= 0 else -1 for t in strip_twins]))
+        for k in boundary:
+            border[(final[k], final[k + 1 if k % 3 < 2 else k - 2])] = offset + k
+    pending = [i for _, _, _, p in results for i in p]
+    glue = Delaunay_Triangulation()
+    glue.build([coords[i - 1] for i in pending], brio=True)
+    id_of = {coords[i - 1]: i for i in pending}
+    gid = [0] + [id_of[(u.x, u.y)] for u in glue.vertices[1:]]  # sommet infini -> 0
+    darts_of = {(gid[d.origin.index], gid[d.next.origin.index]): d for d in glue.darts}
+    seeds = [d for d in glue.darts if d.origin is glue.infinite]
+    for a, b in border:
+        d = darts_of.get((b, a))
+        if d is None: # arête de bord absente de la triangulation des sommets en attente
+            return False
+        seeds.append(d)
+    # faces de glue hors de la zone finale : parcours depuis les graines sans traverser d'arête de bord
+    position = array('l', [-1]) * len(glue.darts)  # brin de glue -> brin de la triangulation finale
+    kept = []
+    while seeds:
+        d = seeds.pop()
+        if position[d.index] >= 0:
+            continue
+        for e in (d, d.next, d.next.next):
+            position[e.index] = len(faces)
+            faces.append(gid[e.origin.index])
+            twins.append(-1)
+            kept.append(e)
+            if (gid[e.next.origin.index], gid[e.origin.index]) not in border:
+                seeds.append(e.twin)
+    for e in kept:
+        t = position[e.twin.index]
+        if t < 0:  # de l'autre côté, une face finale
+            t = border.get((gid[e.next.origin.index], gid[e.origin.index]), -1)
+            if t < 0:
+                return False
+            twins[t] = position[e.index]
+        twins[position[e.index]] = t
+    if -1 in twins:
+        return False
+    # création des brins, sans ramasse-miettes : il parcourrait à chaque passage les brins déjà créés
+    subscribers, locator = DT.subscribers, DT.locator
+    DT.subscribers, DT.locator = [], None
+    DT.reset()
+    collect = gc.isenabled()
+    gc.disable()
+    try:
+        vertices = DT.vertices = [DT.infinite] + [Vertex(x, y, index=i) for i, (x, y) in enumerate(coords, 1)]
+        darts = DT.darts = [DT.dart_class(vertices[i], None, None, k) for k, i in enumerate(faces)]
+        for k in range(0, len(darts), 3):
+            d_a, d_b, d_c = darts[k], darts[k + 1], darts[k + 2]
+            d_a.next, d_b.next, d_c.next = d_b, d_c, d_a
+        for d, t in zip(darts, twins):
+            d.twin = darts[t]
+            d.origin.ref_dart = d
+    finally:
+        if collect:
+            gc.enable()
+    DT.subscribers = subscribers
+    DT.set_locator(locator)
+    DT._notify()
+    return True
+
+if __name__ == "__main__":
+    import time
+    n = 1000000
+    points = [(random.random(), random.random()) for _ in range(n)]
+    for workers in sorted({1, os.cpu_count() or 1}):
+        DT = Delaunay_Triangulation()
+        start = time.perf_counter()
+        DT.build_parallel(points, workers)
+        print(f"{workers} processus : {n} points en {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,90 @@
+"""
+Vérification de la triangulation périodique (Periodic_Delaunay_Triangulation) contre une force brute.
+
+check_delaunay teste chaque face : sa copie vue depuis l'origine de son brin doit être un triangle
+dont le cercle circonscrit ne contient strictement aucune copie d'aucun sommet (calcul exact en fractions,
+les copies x + period n'étant pas exactes en flottants). On vérifie aussi la combinatoire du tore
+(6n brins, faces triangulaires, twins). cross_check construit des jeux aléatoires et des grilles
+(points cocycliques), par build puis par insertions une à une.
+"""
+
+import random
+from fractions import Fraction
+from typing import List, Tuple
+
+import geom
+from graphs import Periodic_Delaunay_Triangulation
+
+Point = Tuple[float, float]
+
+def check_delaunay(T: Periodic_Delaunay_Triangulation) -> List[str]:
+    """Renvoie la liste des défauts de la triangulation (vide si elle est de Delaunay)."""
+    errors = []
+    n = len(T.vertices) - 1
+    if not T.darts:
+        return [f"aucun brin pour {n} sommets"]
+    if len(T.darts) != 6 * n:
+        errors.append(f"{len(T.darts)} brins pour {n} sommets (6n attendus)")
+    L = Fraction(T.period)
+    copies = [(Fraction(u.x) + ox * L, Fraction(u.y) + oy * L)
+              for u in T.vertices[1:] for ox in (-2, -1, 0, 1, 2) for oy in (-2, -1, 0, 1, 2)]
+    float_copies = [(float(x), float(y)) for x, y in copies]
+    for d in T.darts:
+        if d.next.next.next is not d or d.twin.twin is not d:
+            errors.append(f"brin {d.index} : face ou twin incohérents")
+            continue
+        b, c = d.next, d.next.next
+        a = (Fraction(d.origin.x), Fraction(d.origin.y))
+        p = (Fraction(b.origin.x) + Fraction(d.sx), Fraction(b.origin.y) + Fraction(d.sy))
+        q = (Fraction(c.origin.x) + (Fraction(d.sx) + Fraction(b.sx)), Fraction(c.origin.y) + (Fraction(d.sy) + Fraction(b.sy)))
+        if d.sx + b.sx + c.sx != 0 or d.sy + b.sy + c.sy != 0:
+            errors.append(f"brin {d.index} : translations de la face de somme non nulle")
+        if geom.orient2d(a, p, q) >= 0:
+            errors.append(f"brin {d.index} : face plate ou mal orientée")
+            continue
+        if d.index != min(d.index, b.index, c.index):
+            continue # une fois par face
+        # filtre en flottants par le cercle circonscrit (avec marge), puis test exact
+        center = geom.circumcenter(*(tuple(map(float, u)) for u in (a, p, q)))
+        r2 = geom.square_dist(center, (float(a[0]), float(a[1]))) * (1 + 1e-9) + 1e-12
+        if any(geom.incircle(a, p, q, r) < 0 for r, f in zip(copies, float_copies) if geom.square_dist(center, f) <= r2):
+            errors.append(f"brin {d.index} : cercle circonscrit non vide")
+    return errors
+
+def random_points(n: int, kind: str, rng: random.Random, period: float = 1.0) -> List[Point]:
+    """Génère n points dans [0, period)² : 'uniform', 'grid' (k x k en i/k) ou 'integer' (grille entière, period = k)."""
+    if kind == "uniform":
+        return [(rng.random() * period, rng.random() * period) for _ in range(n)]
+    k = max(2, int(n ** 0.5))
+    if kind == "grid":
+        return [(i / k * period, j / k * period) for i in range(k) for j in range(k)]
+    return [(float(i), float(j)) for i in range(k) for j in range(k)]
+
+def cross_check(trials: int = 24, seed: int = 0) -> int:
+    """Vérifie des triangulations construites par build puis par insertions une à une, renvoie le nombre d'échecs."""
+    rng = random.Random(seed)
+    failures = 0
+    for t in range(trials):
+        kind = ("uniform", "grid", "integer")[t % 3]
+        n = rng.choice((16, 50, 100))
+        period = float(int(n ** 0.5)) if kind == "integer" else 1.0
+        points = random_points(n, kind, rng, period)
+        for one_by_one in (False, True):
+            T = Periodic_Delaunay_Triangulation(period)
+            if one_by_one:
+                rng.shuffle(points)
+                for p in points:
+                    T.insert_point(p)
+            else:
+                T.build(points, brio=True)
+            errors = check_delaunay(T)
+            if errors:
+                failures += 1
+                how = "insertions" if one_by_one else "build"
+                print(f"échec : essai {t}, {kind}, {len(points)} points, {how} : {errors[0]} ({len(errors)} défauts)")
+    return failures
+
+
+if __name__ == "__main__":
+    failures = cross_check()
+    print("cross-check :", "ok" if failures == 0 else f"{failures} échecs")
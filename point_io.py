@@ -0,0 +1,79 @@
+"""
+Lecture et écriture de fichiers de points, au fil de l'eau (pour Delaunay_Triangulation.insert_stream).
+
+Les lecteurs sont des générateurs : ils ne gardent en mémoire qu'une ligne (CSV) ou un bloc (binaire),
+jamais le fichier entier. Formats :
+    - CSV (.csv, .txt) : un point par ligne, x et y en deux premières colonnes (séparées par des virgules,
+      des points-virgules ou des blancs) ; les lignes qui ne commencent pas par deux nombres
+      (en-tête, commentaires, lignes vides) sont ignorées
+    - binaire (toute autre extension) : couples (x, y) de float64 petit-boutistes, sans en-tête
+Les coordonnées non finies (nan, inf) sont refusées dans les deux formats (ValueError, avec la ligne ou le point).
+"""
+
+import os
+import sys
+from array import array
+from math import isfinite
+from typing import Iterable, Iterator, Tuple
+
+BLOCK = 65536  # points lus par bloc dans un fichier binaire
+
+def read_csv(path: str) -> Iterator[Tuple[float, float]]:
+    """Renvoie les points d'un fichier CSV, un à un. ValueError si une coordonnée n'est pas finie (nan, inf)."""
+    with open(path, newline="") as f:
+        for number, line in enumerate(f, 1):
+            fields = line.replace(",", " ").replace(";", " ").split()
+            try:
+                x, y = float(fields[0]), float(fields[1])
+            except (IndexError, ValueError):
+                continue
+            if not (isfinite(x) and isfinite(y)):
+                raise ValueError(f"ligne {number} : coordonnée non finie ({fields[0]}, {fields[1]})")
+            yield x, y
+
+def read_binary(path: str) -> Iterator[Tuple[float, float]]:
+    """Renvoie les points d'un fichier binaire de float64 (x, y), lus par blocs de BLOCK points (ValueError si non finis)."""
+    count = 0  # points des blocs précédents
+    with open(path, "rb") as f:
+        while True:
+            block = array("d")
+            data = f.read(16 * BLOCK)
+            if len(data) % 16:
+                raise ValueError(f"{path} : taille incompatible avec des couples de float64")
+            block.frombytes(data)
+            if sys.byteorder != "little":
+                block.byteswap()
+            for k in range(0, len(block), 2):
+                x, y = block[k], block[k + 1]
+                if not (isfinite(x) and isfinite(y)):
+                    raise ValueError(f"point {count + k // 2} : coordonnée non finie ({x}, {y})")
+                yield x, y
+            count += len(block) // 2
+            if len(data) < 16 * BLOCK:
+                return
+
+def read_points(path: str) -> Iterator[Tuple[float, float]]:
+    """Renvoie les points d'un fichier, CSV ou binaire selon son extension."""
+    if os.path.splitext(path)[1].lower() in (".csv", ".txt"):
+        return read_csv(path)
+    return read_binary(path)
+
+def write_binary(points: Iterable[Tuple[float, float]], path: str) -> int:
+    """Écrit les points (un itérable quelconque, consommé par blocs) en binaire, renvoie leur nombre."""
+    count = 0
+    with open(path, "wb") as f:
+        block = array("d")
+        for x, y in points:
+            block.append(x)
+            block.append(y)
+            if len(block) == 2 * BLOCK:
+                count += _write_block(f, block)
+                block = array("d")
+        count += _write_block(f, block)
+    return count
+
+def _write_block(f, block: array) -> int:
+    if sys.byteorder != "little":
+        block.byteswap()
+    f.write(block.tobytes())
+    return len(block) // 2
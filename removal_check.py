@@ -0,0 +1,125 @@
+"""
+Vérification de la suppression de sommets (Delaunay_Triangulation.remove_vertex) contre une reconstruction.
+
+Sur des points aléatoires et sur des grilles mélangées (points cocycliques et alignés), on alterne
+suppressions (dont des sommets de l'enveloppe convexe) et insertions. Après chaque opération,
+la triangulation est comparée à celle reconstruite par build sur les mêmes points :
+    - combinatoire cohérente (indices, twins, faces triangulaires, brins de référence)
+    - propriété de Delaunay vérifiée en force brute (cercles circonscrits vides, calcul exact)
+    - mêmes arêtes que la reconstruction pour des points aléatoires ; sur une grille, la triangulation
+      n'est pas unique (carrés cocycliques) et l'on compare le nombre d'arêtes
+    - graphes abonnés (Gabriel, RNG, MST) égaux à ceux extraits de la reconstruction (points aléatoires)
+"""
+
+import random
+from typing import List, Set, Tuple
+
+import geom
+from graphs import Delaunay_Triangulation, Gabriel_Graph, Minimal_Spanning_Tree, Rel_Neighbor_Graph
+
+Point = Tuple[float, float]
+
+def structure_errors(DT: Delaunay_Triangulation) -> List[str]:
+    """Renvoie les incohérences de la carte combinatoire et les faces qui ne sont pas de Delaunay."""
+    errors = []
+    for i, v in enumerate(DT.vertices):
+        if v.index != i:
+            errors.append(f"sommet {v} : indice {v.index} au lieu de {i}")
+        if v.ref_dart is not None and v.ref_dart.origin is not v:
+            errors.append(f"sommet {v} : brin de référence d'une autre origine")
+    for i, d in enumerate(DT.darts):
+        if d.index != i or d.twin.twin is not d or d.next.next.next is not d:
+            errors.append(f"brin {i} : indice, twin ou face incohérents")
+    if errors:
+        return errors
+    finite = [v.coord for v in DT.vertices[1:]]
+    for d in DT.darts:
+        a, b, c = d.origin, d.next.origin, d.next.next.origin
+        if a.is_infinite or b.is_infinite or c.is_infinite or d.index != min(d.index, d.next.index, d.next.next.index):
+            continue
+        if geom.orient2d(a.coord, b.coord, c.coord) >= 0:
+            errors.append(f"face de {d} plate ou mal orientée")
+        elif any(geom.incircle(a.coord, b.coord, c.coord, p) < 0 for p in finite):
+            errors.append(f"face de {d} : cercle circonscrit non vide")
+    return errors
+
+def edge_set(DT: Delaunay_Triangulation) -> Set[frozenset]:
+    """Arêtes finies de la triangulation, par coordonnées."""
+    return {frozenset((d.origin.coord, d.target.coord)) for d in DT.unique_finite_darts}
+
+def graph_edges(graph) -> Set[frozenset]:
+    """Arêtes d'un graphe dérivé, par coordonnées."""
+    return {frozenset((e.a.coord, e.b.coord)) for e in graph.edges}
+
+def compare(DT: Delaunay_Triangulation, graphs: list, unique: bool) -> List[str]:
+    """Compare DT (et ses graphes abonnés) à la triangulation reconstruite sur ses points."""
+    errors = structure_errors(DT)
+    rebuilt = Delaunay_Triangulation()
+    rebuilt.build([v.coord for v in DT.vertices[1:]] + [v.coord for v in DT.aligned])
+    if sorted(v.coord for v in DT.vertices[1:]) != sorted(v.coord for v in rebuilt.vertices[1:]):
+        errors.append("sommets différents de la reconstruction")
+    if unique:
+        if edge_set(DT) != edge_set(rebuilt):
+            errors.append("arêtes différentes de la reconstruction")
+        for graph in graphs:
+            fresh = type(graph)()
+            fresh.extract_from_Del(rebuilt)
+            if graph_edges(graph) != graph_edges(fresh):
+                errors.append(f"{type(graph).__name__} différent de la reconstruction")
+    elif len(DT.unique_finite_darts) != len(rebuilt.unique_finite_darts):
+        errors.append("nombre d'arêtes différent de la reconstruction")
+    return errors
+
+def hull_vertices(DT: Delaunay_Triangulation) -> list:
+    """Sommets de l'enveloppe convexe (voisins du sommet infini)."""
+    if DT.infinite.ref_dart is None:
+        return []
+    return [d.target for d in DT.infinite.incident_darts]
+
+def random_points(n: int, kind: str, rng: random.Random) -> List[Point]:
+    """Génère n points : 'uniform' ou 'grid' (grille entière mélangée)."""
+    if kind == "uniform":
+        return [(rng.random(), rng.random()) for _ in range(n)]
+    side = int(n ** 0.5) + 1
+    points = [(float(i), float(j)) for i in range(side) for j in range(side)]
+    rng.shuffle(points)
+    return points[:n]
+
+def cross_check(trials: int = 20, operations: int = 60, seed: int = 0) -> int:
+    """Alterne suppressions et insertions sur des jeux aléatoires, renvoie le nombre d'échecs."""
+    rng = random.Random(seed)
+    failures = 0
+    for t in range(trials):
+        kind = ("uniform", "grid")[t % 2]
+        n = rng.choice((10, 40, 100))
+        pool = random_points(2 * n, kind, rng)  # la seconde moitié sert aux insertions
+        DT = Delaunay_Triangulation()
+        DT.build(pool[:n])
+        pool = pool[n:]
+        graphs = [Gabriel_Graph(), Rel_Neighbor_Graph(), Minimal_Spanning_Tree()]
+        for graph in graphs:
+            DT.subscribe(graph)
+        for k in range(operations):
+            hull = hull_vertices(DT)
+            if pool and (len(DT.vertices) <= 4 or rng.random() < 0.4):
+                what = "insertion"
+                DT.insert_point(pool.pop())
+            elif hull and rng.random() < 0.3:
+                what = "suppression (enveloppe)"
+                DT.remove_vertex(rng.choice(hull))
+            elif len(DT.vertices) > 1:
+                what = "suppression"
+                DT.remove_vertex(rng.choice(DT.vertices[1:]))
+            else:
+                break
+            errors = compare(DT, graphs, kind == "uniform")
+            if errors:
+                failures += 1
+                print(f"échec : essai {t}, {kind}, opération {k} ({what}), {len(DT.vertices) - 1} sommets : {errors[0]}")
+                break
+    return failures
+
+
+if __name__ == "__main__":
+    failures = cross_check()
+    print("cross-check :", "ok" if failures == 0 else f"{failures} échecs")
@@ -0,0 +1,78 @@
+"""
+Vérification et mesure de l'extraction du graphe des voisins relatifs (RNG).
+
+cross_check compare Rel_Neighbor_Graph à un oracle en force brute sur des jeux de points aléatoires
+(uniformes, étirés, en amas, sur grille), bench mesure le temps d'extraction pour des tailles croissantes.
+"""
+
+import random
+import time
+from typing import List, Set, Tuple
+
+import geom
+from graphs import Delaunay_Triangulation, Rel_Neighbor_Graph
+
+Point = Tuple[float, float]
+
+def rng_brute_force(points: List[Point]) -> Set[frozenset]:
+    """RNG par définition : ab est gardée si aucun autre point n'est plus proche de a et de b que |ab|."""
+    edges = set()
+    for i, a in enumerate(points):
+        # seuls les points plus proches de a que b peuvent être dans la lune de ab
+        others = sorted((geom.square_dist(a, b), b) for j, b in enumerate(points) if j != i)
+        for k, (d2ab, b) in enumerate(others):
+            if a >= b:
+                continue # chaque arête une seule fois
+            if not any(geom.in_RNG_Moon(a, b, c) for d2ac, c in others[:k] if d2ac < d2ab):
+                edges.add(frozenset((a, b)))
+    return edges
+
+def rng_edges(points: List[Point]) -> Set[frozenset]:
+    """RNG extrait de la triangulation de Delaunay."""
+    DT = Delaunay_Triangulation()
+    DT.build(points, brio=True)
+    RNG = Rel_Neighbor_Graph()
+    RNG.extract_from_Del(DT)
+    return {frozenset((e.a.coord, e.b.coord)) for e in RNG.edges}
+
+def random_points(n: int, kind: str, rng: random.Random) -> List[Point]:
+    """Génère n points : 'uniform', 'stretched', 'clustered' ou 'grid' (points cocycliques)."""
+    if kind == "uniform":
+        return [(rng.random(), rng.random()) for _ in range(n)]
+    if kind == "stretched":
+        return [(rng.gauss(0, 0.02), rng.gauss(0, 1)) for _ in range(n)]
+    if kind == "clustered":
+        centers = [(rng.random(), rng.random()) for _ in range(max(1, n // 50))]
+        return [(cx + rng.gauss(0, 0.01), cy + rng.gauss(0, 0.01)) for cx, cy in (rng.choice(centers) for _ in range(n))]
+    side = int(n ** 0.5) + 1
+    return list({(float(rng.randrange(side)), float(rng.randrange(side))) for _ in range(n)})
+
+def cross_check(trials: int = 200, seed: int = 0) -> int:
+    """Compare l'extraction à l'oracle sur des jeux aléatoires, renvoie le nombre de désaccords."""
+    rng = random.Random(seed)
+    failures = 0
+    for t in range(trials):
+        kind = ("uniform", "stretched", "clustered", "grid")[t % 4]
+        points = random_points(rng.choice((10, 50, 200)), kind, rng)
+        if rng_edges(points) != rng_brute_force(points):
+            failures += 1
+            print(f"désaccord : essai {t}, {kind}, {len(points)} points")
+    return failures
+
+def bench(sizes: Tuple[int, ...] = (1000, 4000, 16000, 64000), seed: int = 0) -> None:
+    """Affiche le temps d'extraction du RNG (triangulation déjà construite) pour chaque taille."""
+    rng = random.Random(seed)
+    for n in sizes:
+        DT = Delaunay_Triangulation()
+        DT.build(random_points(n, "uniform", rng), brio=True)
+        RNG = Rel_Neighbor_Graph()
+        start = time.perf_counter()
+        RNG.extract_from_Del(DT)
+        elapsed = time.perf_counter() - start
+        print(f"n = {n:6d} : {elapsed:.3f} s, {elapsed / n * 1e6:.1f} µs par point, {len(RNG.edges)} arêtes")
+
+
+if __name__ == "__main__":
+    failures = cross_check()
+    print("cross-check :", "ok" if failures == 0 else f"{failures} désaccords")
+    bench()
@@ -0,0 +1,193 @@
+"""
+Format binaire des triangulations (Delaunay_Triangulation.save, Delaunay_Triangulation.load).
+
+Un fichier contient un en-tête de HEADER_SIZE octets puis des tableaux contigus, petit-boutistes,
+chacun aligné sur 8 octets :
+    - coords : float64, 2 par sommet (x, y), le sommet 0 étant le sommet infini
+    - aligned : float64, 2 par point aligné en attente
+    - ref : int32, dart de référence de chaque sommet (-1 s'il n'en a pas)
+    - origin, twin, next : int32, un par dart (indices de sommets, de darts)
+    - shift : float64, 2 par dart (translation du sommet d'arrivée), triangulation périodique seulement
+
+Les indices sont ceux des listes vertices et darts de la triangulation, qui est reconstruite à l'identique
+par load, sans aucun prédicat. Les tableaux peuvent aussi être lus sans rien reconstruire ni copier,
+par open_arrays (mmap de la bibliothèque standard, lecture seule, partageable entre processus) ou par numpy :
+    offset, dtype, count = storage.layout(path)["twin"]
+    twin = numpy.memmap(path, dtype, "r", offset, (count,))
+
+Un graphe (matrice d'adjacence CSR, cf. graphs.Graph) s'écrit de la même façon avec save_csr : en-tête de
+HEADER_SIZE octets (CSR_MAGIC, nombre de noeuds n, nombre d'arcs m) puis coords (float64, 2n), indptr (int32, n + 1),
+indices (int32, m) et lengths (float64, m), chacun aligné sur 8 octets.
+"""
+
+import gc
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, List, Tuple
+
+from graphs import Delaunay_Triangulation, Periodic_Delaunay_Triangulation, Vertex
+
+MAGIC = b"DELAUNAY"
+VERSION = 1
+HEADER = struct.Struct("<8sHHqqqd")  # magic, version, drapeaux, sommets, darts, points alignés, période
+HEADER_SIZE = 64
+PERIODIC, FINE = 1, 2  # drapeaux
+CSR_MAGIC = b"GRAPHCSR"
+CSR_HEADER = struct.Struct("<8sqq")  # magic, noeuds, arcs
+TYPES = {"d": "<f8", "i": "<i4"}  # code de array -> dtype numpy
+CODES = {dtype: code for code, dtype in TYPES.items()}
+
+def _sections(flags: int, n_vertices: int, n_darts: int, n_aligned: int) -> List[Tuple[str, str, int]]:
+    """Noms, codes de type (array) et longueurs des tableaux du fichier, dans l'ordre."""
+    sections = [("coords", "d", 2 * n_vertices), ("aligned", "d", 2 * n_aligned), ("ref", "i", n_vertices),
+                ("origin", "i", n_darts), ("twin", "i", n_darts), ("next", "i", n_darts)]
+    if flags & PERIODIC:
+        sections.append(("shift", "d", 2 * n_darts))
+    return sections
+
+def _read_header(data: bytes) -> Tuple[int, int, int, int, float]:
+    if len(data) < HEADER_SIZE:
+        raise ValueError("ce n'est pas un fichier de triangulation")
+    magic, version, flags, n_vertices, n_darts, n_aligned, period = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("ce n'est pas un fichier de triangulation")
+    if version != VERSION:
+        raise ValueError(f"version de format non prise en charge : {version} (attendue : {VERSION})")
+    return flags, n_vertices, n_darts, n_aligned, period
+
+def layout(path: str) -> Dict[str, Tuple[int, str, int]]:
+    """Renvoie, pour chaque tableau du fichier, son décalage en octets, son dtype numpy et sa longueur."""
+    with open(path, "rb") as f:
+        flags, n_vertices, n_darts, n_aligned, _ = _read_header(f.read(HEADER_SIZE))
+    offsets = {}
+    offset = HEADER_SIZE
+    for name, code, count in _sections(flags, n_vertices, n_darts, n_aligned):
+        offsets[name] = (offset, TYPES[code], count)
+        offset += -(-count * array(code).itemsize // 8) * 8
+    return offsets
+
+def open_arrays(path: str) -> Dict[str, memoryview]:
+    """Projette le fichier en mémoire (lecture seule) et renvoie ses tableaux, sans copie."""
+    if sys.byteorder != "little":
+        raise ValueError("lecture sans copie possible seulement sur une machine petit-boutiste (utiliser load)")
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(data)
+    arrays = {}
+    for name, (offset, dtype, count) in layout(path).items():
+        code = CODES[dtype]
+        arrays[name] = view[offset:offset + count * array(code).itemsize].cast(code)
+    return arrays
+
+def save(DT: Delaunay_Triangulation, path: str) -> None:
+    """Écrit la triangulation dans le fichier (les graphes abonnés et le localisateur ne sont pas sauvés)."""
+    periodic = isinstance(DT, Periodic_Delaunay_Triangulation)
+    flags = (PERIODIC | (FINE if DT.fine else 0)) if periodic else 0
+    vertices, darts = DT.vertices, DT.darts
+    arrays = {
+        "coords": array("d", [c for v in vertices for c in (v.x, v.y)]),
+        "aligned": array("d", [c for v in DT.aligned for c in (v.x, v.y)]),
+        "ref": array("i", [v.ref_dart.index if v.ref_dart is not None else -1 for v in vertices]),
+        "origin": array("i", [d.origin.index for d in darts]),
+        "twin": array("i", [d.twin.index for d in darts]),
+        "next": array("i", [d.next.index for d in darts]),
+    }
+    if periodic:
+        arrays["shift"] = array("d", [c for d in darts for c in (d.sx, d.sy)])
+    with open(path, "wb") as f:
+        header = HEADER.pack(MAGIC, VERSION, flags, len(vertices), len(darts), len(DT.aligned),
+                             DT.period if periodic else 0.0)
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        for name, code, _ in _sections(flags, len(vertices), len(darts), len(DT.aligned)):
+            values = arrays[name]
+            if sys.byteorder != "little":
+                values.byteswap()
+            f.write(values.tobytes())
+            f.write(bytes(-len(values) * values.itemsize % 8)) # alignement sur 8 octets
+
+def load(path: str) -> Delaunay_Triangulation:
+    """Relit une triangulation écrite par save (périodique ou non), sans localisateur ni graphe abonné."""
+    with open(path, "rb") as f:
+        flags, n_vertices, n_darts, n_aligned, period = _read_header(f.read(HEADER_SIZE))
+        arrays = {}
+        for name, code, count in _sections(flags, n_vertices, n_darts, n_aligned):
+            values = array(code)
+            values.fromfile(f, count)
+            f.read(-count * values.itemsize % 8)
+            if sys.byteorder != "little":
+                values.byteswap()
+            arrays[name] = values
+    DT = Periodic_Delaunay_Triangulation(period) if flags & PERIODIC else Delaunay_Triangulation()
+    coords, ref = arrays["coords"], arrays["ref"]
+    collect = gc.isenabled()
+    gc.disable() # comme pour build_parallel : le ramasse-miettes parcourrait les objets déjà créés
+    try:
+        DT.vertices = [DT.infinite] + [Vertex(coords[2 * i], coords[2 * i + 1], index=i) for i in range(1, n_vertices)]
+        darts = DT.darts = [DT.dart_class(DT.vertices[o], None, None, k) for k, o in enumerate(arrays["origin"])]
+        for d, t, nx in zip(darts, arrays["twin"], arrays["next"]):
+            d.twin, d.next = darts[t], darts[nx]
+        for v, r in zip(DT.vertices, ref):
+            if r >= 0:
+                v.ref_dart = darts[r]
+        if flags & PERIODIC:
+            shift = arrays["shift"]
+            for k, d in enumerate(darts):
+                d.sx, d.sy = shift[2 * k], shift[2 * k + 1]
+            DT.fine = bool(flags & FINE)
+    finally:
+        if collect:
+            gc.enable()
+    aligned = arrays["aligned"]
+    DT.aligned = [Vertex(aligned[2 * i], aligned[2 * i + 1]) for i in range(n_aligned)]
+    return DT
+
+def save_csr(path: str, coords: array, indptr: array, indices: array, lengths: array) -> None:
+    """Écrit un graphe au format CSR : coordonnées des noeuds (x, y à la suite), indptr, indices et longueurs."""
+    with open(path, "wb") as f:
+        f.write(CSR_HEADER.pack(CSR_MAGIC, len(indptr) - 1, len(indices)).ljust(HEADER_SIZE, b"\0"))
+        for values in (coords, indptr, indices, lengths):
+            values = array(values.typecode, values)
+            if sys.byteorder != "little":
+                values.byteswap()
+            f.write(values.tobytes())
+            f.write(bytes(-len(values) * values.itemsize % 8))
+
+def load_csr(path: str) -> Tuple[array, array, array, array]:
+    """Relit un graphe écrit par save_csr : (coords, indptr, indices, lengths)."""
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:8] != CSR_MAGIC:
+            raise ValueError("ce n'est pas un fichier de graphe")
+        _, n, m = CSR_HEADER.unpack_from(header)
+        arrays = []
+        for code, count in (("d", 2 * n), ("i", n + 1), ("i", m), ("d", m)):
+            values = array(code)
+            values.fromfile(f, count)
+            f.read(-count * values.itemsize % 8)
+            if sys.byteorder != "little":
+                values.byteswap()
+            arrays.append(values)
+    return tuple(arrays)
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+    n = 200000
+    DT = Delaunay_Triangulation()
+    start = time.perf_counter()
+    DT.build([(random.random(), random.random()) for _ in range(n)], brio=True)
+    print(f"construction : {time.perf_counter() - start:.2f} s")
+    path = os.path.join(tempfile.gettempdir(), "triangulation.del")
+    start = time.perf_counter()
+    save(DT, path)
+    print(f"écriture : {time.perf_counter() - start:.2f} s, {os.path.getsize(path) / 2**20:.1f} Mo")
+    start = time.perf_counter()
+    load(path)
+    print(f"lecture : {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    twin = open_arrays(path)["twin"]
+    print(f"projection en mémoire : {1000 * (time.perf_counter() - start):.2f} ms, {len(twin)} darts")
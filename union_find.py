@@ -1,27 +1,35 @@
+# Union-find sur les indices 0..n-1, stocké dans des tableaux compacts (pas d'attributs posés sur les objets)
 
-# Faire un make_set par objet dont on veut faire des unions
+from array import array
 
-def make_set(x):
-    x.parent = x  # Chaque élément est son propre parent
-    x.rank = 0    # Rangs pour optimiser les unions
+class Union_Find:
+    """Partition des entiers 0..n-1 : union par rang et find itératif par halving."""
 
-def find(x):    # usuel find
-    # renvoie le représentant. + Compression de chemin : raccourcit les branches
-    if x.parent != x:
-        x.parent = find(x.parent)
-    return x.parent
+    def __init__(self, n: int):
+        self.parent = array('i', range(n))  # Chaque élément est son propre parent
+        self.rank = bytearray(n)            # Rangs pour optimiser les unions (< log2 n, tient sur un octet)
 
-def union(x, y):
-    # Trouver les racines
-    rx, ry = find(x), find(y)
-    if rx == ry:
-        return False  # Déjà connectés
+    def find(self, x: int) -> int:
+        # renvoie le représentant. + Path halving : chaque noeud visité pointe vers son grand-père,
+        # sans récursion (pas de limite de profondeur sur les longues chaînes)
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
-    # Union par rang : attache l’arbre le plus petit sous le plus grand
-    if rx.rank < ry.rank:
-        rx.parent = ry
-    else:
-        ry.parent = rx
-        if rx.rank == ry.rank:
-            rx.rank += 1
-    return True
+    def union(self, x: int, y: int) -> bool:
+        # Trouver les racines
+        rx, ry = self.find(x), self.find(y)
+        if rx == ry:
+            return False  # Déjà connectés
+
+        # Union par rang : attache l’arbre le plus petit sous le plus grand
+        rank = self.rank
+        if rank[rx] < rank[ry]:
+            self.parent[rx] = ry
+        else:
+            self.parent[ry] = rx
+            if rank[rx] == rank[ry]:
+                rank[rx] += 1
+        return True
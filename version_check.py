@@ -0,0 +1,85 @@
+"""
+Vérification des versions des graphes abonnés (Graph.is_current) après chaque modification de la triangulation.
+
+Un graphe abonné doit rester à jour (is_current) après toute insertion ou suppression, y compris quand
+la triangulation n'existe pas encore : premier point, points alignés en attente (ajout ou retrait).
+check teste ces trois cas, fuzz alterne au hasard insertions (souvent sur une même droite, et en double)
+et suppressions, en comparant aussi les arêtes des graphes à une extraction neuve.
+"""
+
+import random
+from math import sqrt
+from typing import List
+
+from graphs import (Delaunay_Triangulation, Gabriel_Graph, Graph, Minimal_Spanning_Tree, Rel_Neighbor_Graph,
+                    Voronoi_Diagram)
+
+def subscribed() -> List[Graph]:
+    """Une triangulation vide et ses graphes abonnés (la triangulation est graphs[0].triangulation)."""
+    DT = Delaunay_Triangulation()
+    graphs = [Gabriel_Graph(), Rel_Neighbor_Graph(), Minimal_Spanning_Tree(), Voronoi_Diagram()]
+    for graph in graphs:
+        DT.subscribe(graph)
+    return graphs
+
+def stale(DT: Delaunay_Triangulation, graphs: List[Graph]) -> List[str]:
+    """Noms des graphes qui ne sont pas à jour de DT."""
+    return [type(graph).__name__ for graph in graphs if not graph.is_current(DT)]
+
+def check() -> int:
+    """Premier point, deuxième point aligné en attente, retrait d'un point en attente : renvoie le nombre d'échecs."""
+    failures = 0
+    graphs = subscribed()
+    DT = graphs[0].triangulation
+    steps = [("premier point", lambda: DT.insert_point((0.0, 0.0))),
+             ("deuxième point", lambda: DT.insert_point((1.0, 0.0))),
+             ("premier point aligné", lambda: DT.insert_point((2.0, 0.0))),
+             ("deuxième point aligné", lambda: DT.insert_point((3.0, 0.0))),
+             ("retrait d'un point en attente", lambda: DT.remove_vertex(DT.aligned[0])),
+             ("retrait du dernier point en attente", lambda: DT.remove_vertex(DT.aligned[0])),
+             ("point hors de la droite", lambda: DT.insert_point((0.5, 1.0)))]
+    for what, step in steps:
+        step()
+        if stale(DT, graphs):
+            failures += 1
+            print(f"échec : {what} : {', '.join(stale(DT, graphs))} périmé(s)")
+    return failures
+
+def signature(graph: Graph):
+    """Arêtes du graphe, ou longueur totale pour l'arbre couvrant minimal (pas unique sur une grille)."""
+    if isinstance(graph, Minimal_Spanning_Tree):
+        return round(sum(sqrt(e.square_length) for e in graph.edges), 9)
+    return {frozenset((e.a.coord, e.b.coord)) for e in graph.edges}
+
+def fuzz(trials: int = 200, operations: int = 30, seed: int = 0) -> int:
+    """Insertions et suppressions au hasard sur de petits jeux souvent alignés, renvoie le nombre d'échecs."""
+    rng = random.Random(seed)
+    failures = 0
+    for t in range(trials):
+        graphs = subscribed()
+        DT = graphs[0].triangulation
+        for k in range(operations):
+            candidates = DT.vertices[1:] + DT.aligned
+            if candidates and rng.random() < 0.35:
+                DT.remove_vertex(rng.choice(candidates))
+            elif rng.random() < 0.7:
+                DT.insert_point((float(rng.randrange(4)), 0.0)) # sur la droite y = 0, parfois en double
+            else:
+                DT.insert_point((float(rng.randrange(4)), float(rng.randrange(1, 3))))
+            errors = [f"{name} périmé" for name in stale(DT, graphs)]
+            for graph in graphs[:3]:
+                fresh = type(graph)()
+                fresh.extract_from_Del(DT)
+                if signature(graph) != signature(fresh):
+                    errors.append(f"{type(graph).__name__} différent d'une extraction neuve")
+            if errors:
+                failures += 1
+                print(f"échec : essai {t}, opération {k}, {len(DT.vertices) - 1} sommets, "
+                      f"{len(DT.aligned)} en attente : {errors[0]}")
+                break
+    return failures
+
+
+if __name__ == "__main__":
+    failures = check() + fuzz()
+    print("cross-check :", "ok" if failures == 0 else f"{failures} échecs")
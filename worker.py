@@ -0,0 +1,160 @@
+"""
+Calcul en arrière-plan pour l'interface (demo.py) : un thread exécute les tâches une à une
+et renvoie leurs résultats par une file (queue.Queue), que la boucle d'affichage vide à chaque image.
+
+Une tâche est une fonction job(report) : elle peut appeler report(partial) pour publier un résultat partiel
+(affichage progressif). Les demandes se regroupent : submit remplace la tâche en attente s'il y en a une,
+et la tâche en cours, devenue périmée, est interrompue à son prochain appel à report (exception Cancelled).
+Seul compte donc le résultat de la dernière tâche soumise : les messages portent le numéro de leur tâche,
+comparé à latest.
+
+Un thread plutôt qu'un processus : le résultat est une triangulation et ses graphes, des millions d'objets
+qu'il faudrait sérialiser pour les faire passer d'un processus à l'autre. Le thread ne rend pas le calcul
+plus rapide (verrou global de l'interpréteur) mais la boucle d'affichage reprend la main à chaque intervalle
+de commutation (sys.getswitchinterval(), 5 ms par défaut), bien moins d'une image.
+
+Reste le ramasse-miettes : ses passages complets parcourent tous les objets, verrou pris, et bloquaient
+l'affichage plusieurs images pendant une construction. Il est donc suspendu pendant chaque tâche
+(comme dans storage.load et parallel). À la fin de la tâche, un seul passage (gc.collect) ramasse les cycles
+laissés par la tâche, et par le thread d'affichage pendant ce temps (la suspension vaut pour tout le
+processus) : il ne parcourt que les objets non gelés, donc à peu près ceux de la tâche. Les survivants sont
+ensuite gelés (gc.freeze) : il ne les parcourra plus jamais. Un résultat abandonné, gelé, n'est plus ramassé :
+il doit être confié à discard, qui casse ses cycles de références (méthode release) dans le thread, pour que
+le comptage de références le libère ; de même, une tâche interrompue libère ce qu'elle a construit avant
+de laisser passer Cancelled.
+"""
+
+import gc
+import queue
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+Job = Callable[[Callable[[Any], None]], Any]
+
+class Cancelled(Exception):
+    """Levée par report dans une tâche devenue périmée (une autre a été soumise depuis)."""
+
+class Worker:
+    """Thread de calcul : une tâche en cours au plus, une en attente au plus (la dernière soumise)."""
+
+    def __init__(self):
+        self.results: "queue.Queue[Tuple[str, int, Any]]" = queue.Queue()  # ("progress" | "done" | "error", numéro, valeur)
+        self.latest = 0  # numéro de la dernière tâche soumise
+        self._pending: Optional[Tuple[int, Job]] = None
+        self._running = 0  # numéro de la tâche en cours (0 : aucune)
+        self._discarded: List[Any] = []  # objets à libérer (par leur méthode release) entre deux tâches
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._loop, name="worker", daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        """Vrai si une tâche est en cours ou en attente (ses résultats ne sont pas encore dans la file)."""
+        with self._condition:
+            return self._pending is not None or self._running != 0
+
+    def submit(self, job: Job) -> int:
+        """Soumet une tâche, qui remplace celle en attente et rend périmée celle en cours ; renvoie son numéro."""
+        with self._condition:
+            self.latest += 1
+            self._pending = (self.latest, job)
+            self._condition.notify()
+            return self.latest
+
+    def discard(self, obj: Any) -> None:
+        """Confie au thread un objet abandonné (une triangulation...), qu'il libère par obj.release() entre deux tâches."""
+        with self._condition:
+            self._discarded.append(obj)
+            self._condition.notify()
+
+    def poll(self) -> List[Tuple[str, int, Any]]:
+        """
+        Renvoie, sans attendre, les messages arrivés des tâches qui ne sont pas périmées.
+        Le résultat d'une tâche périmée est confié à discard s'il a une méthode release.
+        """
+        messages = []
+        while True:
+            try:
+                message = self.results.get_nowait()
+            except queue.Empty:
+                return messages
+            kind, number, value = message
+            if number == self.latest:
+                messages.append(message)
+            elif kind == "done" and hasattr(value, "release"):
+                self.discard(value)
+
+    def close(self) -> None:
+        """Arrête le thread après la tâche en cours (qui sera interrompue à son prochain report)."""
+        with self._condition:
+            self._closed = True
+            self.latest += 1
+            self._pending = None
+            self._condition.notify()
+
+    def _report(self, number: int, partial: Any) -> None:
+        if number != self.latest:
+            raise Cancelled
+        self.results.put(("progress", number, partial))
+
+    def _loop(self) -> None:
+        while True:
+            obj = None
+            with self._condition:
+                while self._pending is None and not self._discarded and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                if self._pending is None: # pas de tâche en attente : on libère un objet abandonné
+                    obj = self._discarded.pop()
+                else:
+                    (number, job), self._pending = self._pending, None
+                    self._running = number
+            if obj is not None:
+                obj.release()
+                continue
+            collect = gc.isenabled()
+            gc.disable()
+            try:
+                result = job(lambda partial: self._report(number, partial))
+            except Cancelled:
+                pass
+            except Exception as error: # remontée à la boucle d'affichage, qui décide quoi en faire
+                self.results.put(("error", number, error))
+            else:
+                self.results.put(("done", number, result))
+            finally:
+                result = None
+                if collect:
+                    gc.collect() # sans quoi les cycles de la tâche seraient gelés avec le reste, jamais libérés
+                    gc.freeze()
+                    gc.enable()
+                with self._condition:
+                    self._running = 0
+
+if __name__ == "__main__":
+    import random
+    import time
+    from graphs import Delaunay_Triangulation
+
+    def build(report: Callable[[Any], None]) -> Delaunay_Triangulation:
+        DT = Delaunay_Triangulation()
+        DT.insert_stream(((random.random(), random.random()) for _ in range(100000)), 5000, progress=report)
+        return DT
+
+    worker = Worker()
+    worker.submit(build)
+    start, latency = time.perf_counter(), 0.0
+    done = False
+    while not done: # boucle « d'affichage » : on mesure le retard de chaque image de 1/60 s
+        before = time.perf_counter()
+        time.sleep(1 / 60)
+        latency = max(latency, time.perf_counter() - before - 1 / 60)
+        for kind, _, value in worker.poll():
+            if kind == "progress":
+                print(f"{value} points insérés")
+            else:
+                done = True
+    print(f"construction en {time.perf_counter() - start:.2f} s, retard maximal d'une image : {1000 * latency:.1f} ms")
+    worker.close()
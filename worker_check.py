@@ -0,0 +1,79 @@
+"""
+Vérification de la libération des résultats gelés par le worker (gc.freeze, cf. worker).
+
+Comme l'interface (demo) : une tâche construit une triangulation et ses graphes abonnés (dont l'arbre couvrant
+minimal, avec sa forêt link-cut créée par une insertion dans le thread principal), puis la scène est abandonnée
+et confiée à discard. Le nombre d'objets gelés doit rester stable d'un cycle à l'autre : un objet gelé
+dont les cycles ne sont pas cassés par release n'est jamais libéré.
+"""
+
+import gc
+import random
+import time
+from typing import List
+
+from graphs import Delaunay_Triangulation, Gabriel_Graph, Minimal_Spanning_Tree, Rel_Neighbor_Graph
+from worker import Worker
+
+def build_job(n: int, seed: int):
+    """Tâche : triangulation de n points aléatoires et ses graphes abonnés."""
+    def job(report) -> Delaunay_Triangulation:
+        rng = random.Random(seed)
+        DT = Delaunay_Triangulation()
+        DT.insert_stream(((rng.random(), rng.random()) for _ in range(n)), 500, progress=report)
+        for graph in (Gabriel_Graph(), Rel_Neighbor_Graph(), Minimal_Spanning_Tree()):
+            DT.subscribe(graph)
+        return DT
+    return job
+
+def wait(worker: Worker) -> list:
+    """Attend la fin des tâches soumises et renvoie leurs messages."""
+    messages = []
+    while True:
+        messages += worker.poll()
+        if not worker.busy and worker.results.empty():
+            return messages
+        time.sleep(0.01)
+
+def freeze_counts(cycles: int = 5, n: int = 2000, insertions: int = 1, seed: int = 0) -> List[int]:
+    """
+    Nombre d'objets gelés après chaque cycle : construction d'une scène pendant que la précédente, modifiée
+    dans le thread principal, reste affichée (elle est donc gelée avec la nouvelle), puis abandon de la précédente.
+    """
+    rng = random.Random(seed)
+    worker = Worker()
+    counts = []
+    shown = None
+    try:
+        for c in range(cycles + 1):
+            worker.submit(build_job(n, c))
+            DT = next(value for kind, _, value in wait(worker) if kind == "done")
+            if shown is not None:
+                worker.discard(shown)
+                shown = None
+                while worker._discarded: # libérée dans le thread du worker
+                    time.sleep(0.01)
+                worker.submit(lambda report: None) # attend la fin de release, puis ramasse et gèle
+                wait(worker)
+                counts.append(gc.get_freeze_count())
+            for _ in range(insertions):
+                DT.insert_point((rng.random(), rng.random())) # met à jour l'arbre couvrant (forêt link-cut)
+            shown, DT = DT, None
+    finally:
+        worker.close()
+    return counts
+
+def check(cycles: int = 5) -> int:
+    """Renvoie le nombre de cycles après lesquels les objets gelés ont augmenté depuis le premier."""
+    counts = freeze_counts(cycles)
+    failures = 0
+    for c in range(1, cycles):
+        if counts[c] > counts[0] + 1000: # bruit de quelques centaines d'objets ; une forêt perdue en compte 2n
+            failures += 1
+            print(f"échec : cycle {c}, {counts[c]} objets gelés (contre {counts[0]} au cycle 0)")
+    return failures
+
+
+if __name__ == "__main__":
+    failures = check()
+    print("cross-check :", "ok" if failures == 0 else f"{failures} échecs")